@@ -0,0 +1,175 @@
+import os
+import time
+import logging
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from models import AnalyticsCount, Resume
+from parser import SKILLS
+from skill_index import split_skills
+
+# ------------------------------------------------------------------
+# Dashboard aggregates (skill frequency, cities, countries, job titles,
+# uploads per day) kept as counters in analytics_count. Every save adds
+# its rows' values in the same transaction, so GET /analytics reads a
+# few top-N index ranges instead of scanning resumes. Skills are counted
+# by canonical name, so a taxonomy change triggers a recount.
+# ------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "30"))
+
+TOTAL = "total"
+UPLOAD_DAY = "upload_day"
+TAXONOMY = "taxonomy"  # one row; value = fingerprint of the taxonomy the skills were counted with
+
+_BATCH = 5000
+
+
+def _values(resume) -> Iterable[Tuple[str, str]]:
+    for skill in split_skills(resume.skills):
+        yield "skill", skill
+    for dimension, raw in (("city", resume.city), ("country", resume.country), ("job_title", resume.jobTitle)):
+        value = (raw or "").strip()
+        if value:
+            yield dimension, value
+    if resume.uploaded_at is not None:
+        yield UPLOAD_DAY, resume.uploaded_at.date().isoformat()
+    yield TOTAL, ""
+
+
+def count(resumes: Iterable[Any], sign: int = 1) -> Counter:
+    """{(dimension, value): +-n} contributed by the resumes (any objects with Resume's attributes)."""
+    counts: Counter = Counter()
+    for resume in resumes:
+        for key in _values(resume):
+            counts[key] += sign
+    return counts
+
+
+def apply(session: Session, counts: Counter):
+    """Add counts (from count()) to the stored counters; same transaction as the caller."""
+    rows = [{"dimension": d, "value": v, "count": n} for (d, v), n in counts.items() if n]
+    if not rows:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(AnalyticsCount)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["dimension", "value"], set_={"count": AnalyticsCount.count + stmt.excluded.count}
+    )
+    session.exec(stmt, params=rows)
+
+
+def record(session: Session, resumes: Iterable[Any]):
+    """Count newly saved resumes."""
+    apply(session, count(resumes))
+
+
+def rebuild(engine, batch_size: int = _BATCH) -> int:
+    """Recount everything from the resume table in one transaction. Returns resumes counted."""
+    columns = (Resume.id, Resume.skills, Resume.city, Resume.country, Resume.jobTitle, Resume.uploaded_at)
+    counts: Counter = Counter({(TAXONOMY, SKILLS.current().fingerprint): 1})
+    total = 0
+    with Session(engine) as session:
+        # Delete first: on SQLite that takes the write lock, so no upload lands between the read and the write
+        session.exec(delete(AnalyticsCount))
+        last_id = 0
+        while True:
+            rows = session.exec(select(*columns).where(Resume.id > last_id).order_by(Resume.id).limit(batch_size)).all()
+            if not rows:
+                break
+            counts.update(count(rows))
+            total += len(rows)
+            last_id = rows[-1].id
+        apply(session, counts)
+        session.commit()
+    return total
+
+
+def rebuild_if_stale(engine) -> bool:
+    """
+    Recount when the counters are empty (resumes from before they existed)
+    or were counted with another skills taxonomy.
+    """
+    with Session(engine) as session:
+        counted = session.exec(select(AnalyticsCount.value).where(AnalyticsCount.dimension == TAXONOMY)).first()
+        if counted == SKILLS.current().fingerprint:
+            return False
+        if session.exec(select(Resume.id).limit(1)).first() is None:
+            return False
+    started = time.perf_counter()
+    total = rebuild(engine)
+    logger.info("Analytics counters rebuilt from %d resumes in %.1fs", total, time.perf_counter() - started)
+    return True
+
+
+def _top(session: Session, dimension: str, limit: int) -> List[Dict[str, Any]]:
+    rows = session.exec(
+        select(AnalyticsCount.value, AnalyticsCount.count)
+        .where(AnalyticsCount.dimension == dimension, AnalyticsCount.count > 0)
+        .order_by(AnalyticsCount.count.desc(), AnalyticsCount.value).limit(limit)
+    ).all()
+    return [{"name": value, "count": n} for value, n in rows]
+
+
+def summary(session: Session, top: int = 20, days: int = 30) -> Dict[str, Any]:
+    total = session.get(AnalyticsCount, (TOTAL, ""))
+    # ISO dates sort like dates: the newest `days` days that had uploads
+    day_rows = session.exec(
+        select(AnalyticsCount.value, AnalyticsCount.count)
+        .where(AnalyticsCount.dimension == UPLOAD_DAY, AnalyticsCount.count > 0)
+        .order_by(AnalyticsCount.value.desc()).limit(days)
+    ).all()
+    return {
+        "total_resumes": total.count if total else 0,
+        "skills": _top(session, "skill", top),
+        "cities": _top(session, "city", top),
+        "countries": _top(session, "country", top),
+        "job_titles": _top(session, "job_title", top),
+        "uploads_per_day": [{"date": day, "count": n} for day, n in reversed(day_rows)],
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+    }
+
+
+class AnalyticsCache:
+    """summary() per (top, days), reused for ANALYTICS_CACHE_TTL seconds."""
+
+    def __init__(self, engine, ttl: float = ANALYTICS_CACHE_TTL):
+        self.engine = engine
+        self.ttl = ttl
+        self._items: Dict[Tuple[int, int], Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, top: int, days: int) -> Dict[str, Any]:
+        key = (top, days)
+        with self._lock:
+            entry = self._items.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        with Session(self.engine) as session:
+            payload = summary(session, top, days)
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, payload)
+        return payload
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Rebuild the analytics counters from the resume table.")
+    ap.add_argument("--database-url", default=None, help="defaults to $DATABASE_URL")
+    ap.add_argument("--batch-size", type=int, default=_BATCH)
+    args = ap.parse_args()
+
+    from database import DATABASE_URL, make_engine, create_db_and_tables
+    engine = make_engine(args.database_url or DATABASE_URL)
+    create_db_and_tables(engine)
+    started = time.perf_counter()
+    print(f"Counted {rebuild(engine, args.batch_size)} resumes in {time.perf_counter() - started:.1f}s.")
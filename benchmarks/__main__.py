@@ -0,0 +1,101 @@
+"""
+Run the release benchmark suite and write one JSON report; optionally
+compare it with the report of a previous release.
+
+    stages   per-stage parser timings over the synthetic corpus (bench_stages)
+    load     HTTP load test with stubbed Cloudinary (bench_load, own process)
+
+Latency metrics (*_ms) that grow, or throughput (rps, *_per_s) that
+drops, by more than --threshold percent against --baseline are listed
+as regressions and the exit status is 1. Latencies under --min-ms in
+both runs are ignored.
+
+Run from the repo root:
+    python -m benchmarks --out bench-1.5.json [--baseline bench-1.4.json] [--threshold 20]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks import bench_stages
+
+
+def flatten(report, prefix=""):
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, path)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, value
+
+
+def regressions(current, baseline, threshold, min_ms=1.0):
+    old = dict(flatten(baseline))
+    found = []
+    for path, now in flatten(current):
+        then = old.get(path)
+        if not then:
+            continue
+        if "_ms" in path:
+            if max(now, then) < min_ms:
+                continue  # sub-millisecond stages are mostly timer noise
+            change = (now - then) / then * 100
+        elif path.endswith("rps") or path.endswith("_per_s"):
+            change = (then - now) / then * 100
+        else:
+            continue
+        if change > threshold:
+            found.append({"metric": path, "baseline": then, "current": now, "worse_by_pct": round(change, 1)})
+    return found
+
+
+def run_load(args):
+    cmd = [sys.executable, "-m", "benchmarks.bench_load", "--uploads", str(args.uploads),
+           "--requests", str(args.requests), "--concurrency", str(args.concurrency)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    # The report is the last JSON document on stdout
+    return json.loads(out[out.rindex("\n{") + 1:] if "\n{" in out else out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--baseline", help="report of a previous run to compare against")
+    ap.add_argument("--threshold", type=float, default=20.0, help="percent change that counts as a regression")
+    ap.add_argument("--min-ms", type=float, default=1.0, help="ignore latencies below this in both runs")
+    ap.add_argument("--count", type=int, default=30, help="corpus size for the stage timings")
+    ap.add_argument("--uploads", type=int, default=60)
+    ap.add_argument("--requests", type=int, default=500)
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--skip-load", action="store_true")
+    args = ap.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "stages": bench_stages.run(args.count),
+    }
+    if not args.skip_load:
+        report["load"] = run_load(args)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = regressions(report, json.load(f), args.threshold, args.min_ms)
+        status = 1 if report["regressions"] else 0
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report.get("regressions", []), indent=2) if args.baseline else f"Wrote {args.out}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
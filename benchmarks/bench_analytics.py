@@ -0,0 +1,142 @@
+"""
+GET /analytics latency as the resume table grows.
+
+Fills a fresh SQLite database with synthetic resumes (corpus skills,
+titles and cities, uploads spread over --spread-days) up to each of
+--sizes in turn, recounts the aggregates with analytics.rebuild, then
+reports per size:
+  - "naive": the same dashboard computed on the fly -- scan every resume,
+    split the skills and count in Python (what the endpoint would
+    otherwise do)
+  - "aggregates": analytics.summary over the counters table
+  - "endpoint": GET /analytics through the app with the TTL cache off
+  - "cached": GET /analytics with the TTL cache on
+plus the rebuild time. The aggregate numbers should stay flat across
+sizes; "naive" grows with the table.
+
+Run from the repo root:
+    python -m benchmarks.bench_analytics [--sizes 10000,100000] [--queries 200]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from benchmarks import corpus
+from benchmarks.bench_match import percentiles
+from models import Resume
+
+CHUNK = 5000
+COUNTRIES = ["India", "India", "India", "USA", "UK", "Singapore"]
+NOW = datetime(2026, 1, 1)
+
+
+def resume_row(i, rng, spread_days):
+    r = corpus.make_resume(rng, rng.choice(list(corpus.SIZES)))
+    return {
+        "id": i, "name": r["name"], "email": r["email"], "jobTitle": r["title"],
+        "skills": ", ".join(r["skills"]), "city": r["city"], "country": rng.choice(COUNTRIES),
+        "uploaded_at": NOW - timedelta(days=rng.randrange(spread_days), seconds=rng.randrange(86400)),
+    }
+
+
+def fill(engine, start, stop, rng, spread_days):
+    for lo in range(start, stop, CHUNK):
+        with Session(engine) as session:
+            session.exec(insert(Resume), params=[resume_row(i, rng, spread_days) for i in range(lo + 1, min(stop, lo + CHUNK) + 1)])
+            session.commit()
+
+
+def naive_summary(engine, top, days):
+    from skill_index import split_skills
+
+    counts = {name: Counter() for name in ("skills", "cities", "countries", "job_titles", "days")}
+    total = 0
+    with Session(engine) as session:
+        rows = session.exec(select(Resume.skills, Resume.city, Resume.country, Resume.jobTitle, Resume.uploaded_at))
+        for skills, city, country, title, uploaded_at in rows:
+            total += 1
+            counts["skills"].update(split_skills(skills))
+            for name, value in (("cities", city), ("countries", country), ("job_titles", title)):
+                if value and value.strip():
+                    counts[name][value.strip()] += 1
+            if uploaded_at is not None:
+                counts["days"][uploaded_at.date().isoformat()] += 1
+    result = {name: counts[name].most_common(top) for name in ("skills", "cities", "countries", "job_titles")}
+    result["uploads_per_day"] = sorted(counts["days"].items())[-days:]
+    result["total_resumes"] = total
+    return result
+
+
+def timed(fn, repeats):
+    fn()  # warm-up
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return percentiles(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="10000,100000")
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--naive-queries", type=int, default=5)
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--days", type=int, default=30)
+    ap.add_argument("--spread-days", type=int, default=365)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ["MATCH_INDEX_DIR"] = os.path.join(tmp, "match_index")
+        os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "bench")
+        os.environ.setdefault("CLOUDINARY_API_KEY", "bench")
+        os.environ.setdefault("CLOUDINARY_API_SECRET", "bench")
+        os.environ["SKILL_INDEX_BACKFILL_ON_START"] = "0"
+        os.environ["DEDUP_BACKFILL_ON_START"] = "0"
+        os.environ["ANALYTICS_BACKFILL_ON_START"] = "0"
+        from fastapi.testclient import TestClient
+        import analytics
+        import main as app_main
+
+        engine = app_main.engine
+        cache = app_main.analytics_cache
+        url = f"/analytics?top={args.top}&days={args.days}"
+        report = {}
+        filled = 0
+        with TestClient(app_main.app) as client:
+            for size in (int(s) for s in args.sizes.split(",")):
+                fill(engine, filled, size, rng, args.spread_days)
+                filled = size
+                start = time.perf_counter()
+                analytics.rebuild(engine)
+                entry = {"rebuild_s": round(time.perf_counter() - start, 2)}
+
+                entry["naive"] = timed(lambda: naive_summary(engine, args.top, args.days), args.naive_queries)
+
+                def aggregates():
+                    with Session(engine) as session:
+                        return analytics.summary(session, args.top, args.days)
+                entry["aggregates"] = timed(aggregates, args.queries)
+
+                cache.ttl = 0
+                entry["endpoint"] = timed(lambda: client.get(url), args.queries)
+                cache.ttl = analytics.ANALYTICS_CACHE_TTL
+                entry["cached"] = timed(lambda: client.get(url), args.queries)
+                report[str(size)] = entry
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+/api/v1 serialization, compression and export over a large table.
+
+Fills a fresh SQLite database with --size synthetic resumes, then reports:
+  - "serialize": encoding one --limit page of full records, as
+      "model_dump": select(Resume) rows -> model_dump() -> json.dumps
+                    (how /match and the templates build payloads)
+      "orjson":     resume_api.list_page (column select -> struct -> orjson)
+      "sparse":     the same with ?fields=name,email,skills
+  - "endpoint": GET /api/v1/resumes?limit=N with and without ?fields=
+  - "compression": body size and encode time per Content-Encoding
+  - "export": the NDJSON export stream of the whole table, drained
+    directly -- time, bytes, and the peak Python heap (tracemalloc),
+    which should stay around one batch rather than grow with the table
+Latencies are p50/p95/max over --queries runs.
+
+Run from the repo root:
+    python -m benchmarks.bench_api [--size 100000] [--limit 200] [--queries 200]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from sqlmodel import Session, select
+
+from benchmarks.bench_analytics import fill
+from benchmarks.bench_match import percentiles
+from models import Resume
+
+
+def timed(fn, repeats):
+    fn()  # warm-up
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return percentiles(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=100000)
+    ap.add_argument("--limit", type=int, default=200)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ["MATCH_INDEX_DIR"] = os.path.join(tmp, "match_index")
+        os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "bench")
+        os.environ.setdefault("CLOUDINARY_API_KEY", "bench")
+        os.environ.setdefault("CLOUDINARY_API_SECRET", "bench")
+        os.environ["SKILL_INDEX_BACKFILL_ON_START"] = "0"
+        os.environ["DEDUP_BACKFILL_ON_START"] = "0"
+        os.environ["ANALYTICS_BACKFILL_ON_START"] = "0"
+        os.environ["API_LIST_MAX"] = str(max(args.limit, 200))
+        from fastapi.testclient import TestClient
+        import main as app_main
+        import resume_api
+
+        engine = app_main.engine
+        fill(engine, 0, args.size, rng, 365)
+        report = {"size": args.size, "limit": args.limit}
+        full = resume_api.API_FIELDS
+        sparse = resume_api.parse_fields("name,email,skills")
+
+        def model_dump_page():
+            with Session(engine) as session:
+                rows = session.exec(select(Resume).order_by(Resume.id.desc()).limit(args.limit)).all()
+                return json.dumps({"resumes": [r.model_dump() for r in rows]}, default=str).encode()
+
+        def list_page(fields):
+            with Session(engine) as session:
+                return resume_api.list_page(session, fields, args.limit)
+
+        report["serialize"] = {
+            "model_dump": timed(model_dump_page, args.queries),
+            "orjson": timed(lambda: list_page(full), args.queries),
+            "sparse": timed(lambda: list_page(sparse), args.queries),
+        }
+
+        with TestClient(app_main.app) as client:
+            plain = {"Accept-Encoding": "identity"}
+            report["endpoint"] = {
+                "full": timed(lambda: client.get(f"/api/v1/resumes?limit={args.limit}", headers=plain), args.queries),
+                "sparse": timed(lambda: client.get(f"/api/v1/resumes?limit={args.limit}&fields=name,email,skills",
+                                                   headers=plain), args.queries),
+            }
+
+            body = list_page(full)
+            report["compression"] = {"identity": {"bytes": len(body)}}
+            for encoding in ("gzip", "br"):
+                out, _ = resume_api.compress(body, encoding)
+                report["compression"][encoding] = {
+                    "bytes": len(out),
+                    "encode": timed(lambda: resume_api.compress(body, encoding), args.queries),
+                }
+
+            # The generator the endpoint streams, drained here: TestClient buffers whole bodies.
+            # Timed without tracemalloc, which slows allocation-heavy code several times over.
+            def drain(encoding):
+                return sum(len(c) for c in resume_api.compress_stream(resume_api.export_lines(engine, full), encoding))
+
+            export = {}
+            for encoding in (None, "br", "gzip"):
+                start = time.perf_counter()
+                total = drain(encoding)
+                entry = {"seconds": round(time.perf_counter() - start, 2), "mb": round(total / 2**20, 1)}
+                tracemalloc.start()
+                drain(encoding)
+                entry["peak_heap_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                tracemalloc.stop()
+                export[encoding or "identity"] = entry
+            report["export"] = export
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
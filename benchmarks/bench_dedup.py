@@ -0,0 +1,145 @@
+"""
+Duplicate lookup latency and recall as the table grows.
+
+Fills a fresh SQLite database with fingerprints (random MinHash
+signatures, unique emails and phones) up to each --sizes step. It also
+stores real signatures of --probes synthetic resumes. After each step it
+looks up edited copies of those resumes:
+  - "text_2pct" / "text_5pct": 2% / 5% of words changed and no email/phone,
+    so only MinHash/LSH can find them
+  - "contact": a reformatted email/phone ("A.B7+cv@EXAMPLE.COM", "0" + local number)
+Reports lookup percentiles, recall and false matches per step; flat
+latency across sizes is the point of the LSH index.
+
+Run from the repo root:
+    python -m benchmarks.bench_dedup [--sizes 10000,100000] [--probes 200]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+from sqlalchemy import insert
+from sqlmodel import Session
+
+import dedup
+from benchmarks import corpus
+from database import make_engine, create_db_and_tables
+from models import Resume, ResumeFingerprint, ResumeLshBand
+
+CHUNK = 5000
+
+
+def resume_text(resume):
+    jobs = [f"{j['role']} {j['company']} {j['years']} " + " ".join(j["bullets"]) for j in resume["jobs"]]
+    edu = [f"{e['degree']} {e['college']} {e['years']}" for e in resume["education"]]
+    return "\n".join([
+        resume["name"], resume["title"], resume["email"], resume["phone"], resume["summary"],
+        ", ".join(resume["skills"]), *jobs, *resume["projects"], *edu, ", ".join(resume["languages"]),
+    ])
+
+
+def edit_words(rng, text, fraction=0.05):
+    words = text.split()
+    vocabulary = corpus.SKILLS + corpus.VERBS
+    for i in rng.sample(range(len(words)), max(1, int(len(words) * fraction))):
+        words[i] = rng.choice(vocabulary)
+    return " ".join(words)
+
+
+def email_variant(email):
+    local, _, domain = email.partition("@")
+    return f"{local.title()}+cv@{domain.upper()}"
+
+
+def insert_rows(engine, rows):
+    """rows: (id, email, phone, signature)"""
+    with Session(engine) as session:
+        session.exec(insert(Resume), params=[{"id": i, "name": f"r{i}"} for i, *_ in rows])
+        session.exec(insert(ResumeFingerprint), params=[
+            {"resume_id": i, "email": email, "phone": phone, "minhash": dedup.to_bytes(sig)} for i, email, phone, sig in rows
+        ])
+        session.exec(insert(ResumeLshBand), params=[
+            {"band": band, "bucket": bucket, "resume_id": i}
+            for i, _, _, sig in rows for band, bucket in enumerate(dedup.band_buckets(sig))
+        ])
+        session.commit()
+
+
+def fill(engine, start, stop, nprng):
+    for lo in range(start, stop, CHUNK):
+        hi = min(stop, lo + CHUNK)
+        sigs = nprng.randint(0, 1 << 32, size=(hi - lo, dedup.MINHASH_PERMUTATIONS), dtype=np.uint64).astype(np.uint32)
+        insert_rows(engine, [
+            (i, f"filler{i}@example.com", f"{7000000000 + i}", sig) for i, sig in zip(range(lo + 1, hi + 1), sigs)
+        ])
+
+
+def measure(engine, probes):
+    out = {}
+    with Session(engine) as session:
+        for kind in probes:
+            times, found, false = [], 0, 0
+            for original_id, email, phone, text in probes[kind]:
+                start = time.perf_counter()
+                matches = dedup.find_matches(session, dedup.normalize_email(email), dedup.normalize_phone(phone), None, dedup.minhash(text))
+                times.append((time.perf_counter() - start) * 1000)
+                found += original_id in matches
+                false += len(set(matches) - {original_id})
+            times.sort()
+            out[kind] = {
+                "p50_ms": round(statistics.median(times), 3),
+                "p95_ms": round(times[int(len(times) * 0.95) - 1], 3),
+                "recall": round(found / len(times), 3),
+                "false_matches": false,
+            }
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="10000,100000")
+    ap.add_argument("--probes", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    nprng = np.random.RandomState(args.seed)
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        create_db_and_tables(engine)
+
+        # Originals get the first ids, fillers the rest
+        originals = [corpus.make_resume(rng, rng.choice(list(corpus.SIZES))) for _ in range(args.probes)]
+        texts = [resume_text(r) for r in originals]
+        insert_rows(engine, [
+            (i + 1, dedup.normalize_email(r["email"]), dedup.normalize_phone(r["phone"]), dedup.minhash(t))
+            for i, (r, t) in enumerate(zip(originals, texts))
+        ])
+        probes = {
+            "text_2pct": [(i + 1, None, None, edit_words(rng, t, 0.02)) for i, t in enumerate(texts)],
+            "text_5pct": [(i + 1, None, None, edit_words(rng, t, 0.05)) for i, t in enumerate(texts)],
+            "contact": [(i + 1, email_variant(r["email"]), "0" + r["phone"][-10:], None) for i, r in enumerate(originals)],
+        }
+
+        start = time.perf_counter()
+        for t in texts:
+            dedup.minhash(t)
+        report = {"minhash_ms_per_resume": round((time.perf_counter() - start) * 1000 / len(texts), 3), "sizes": {}}
+
+        filled = args.probes
+        for size in sizes:
+            fill(engine, filled, size, nprng)
+            filled = max(filled, size)
+            report["sizes"][size] = measure(engine, probes)
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+HTTP load test of the running app with Cloudinary stubbed out.
+
+Starts main:app under uvicorn in-process against a throwaway SQLite
+database, replaces the Cloudinary upload/destroy calls with a stub that
+sleeps --cloudinary-ms (network round trip stand-in), then drives
+    POST /upload                  synthetic corpus PDFs, all distinct
+    GET  /resumes                 dashboard listing
+    GET  /resume/{id}/details     ids created by the upload phase
+with --concurrency parallel clients. Latency percentiles and
+throughput per endpoint are printed as JSON.
+
+Run from the repo root:
+    python -m benchmarks.bench_load [--uploads 60] [--requests 500] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def summarize(latencies, errors, elapsed):
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "p95_ms": round(pct(latencies, 0.95), 2) if latencies else None,
+        "p99_ms": round(pct(latencies, 0.99), 2) if latencies else None,
+    }
+
+
+async def drive(client, concurrency, make_request, total):
+    latencies, errors = [], 0
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            i = queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                ok = (await make_request(client, i)).status_code < 400
+            except Exception:
+                ok = False
+            if ok:
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def load(base_url, pdfs, resume_ids, args):
+    import httpx
+
+    report = {}
+    timeout = httpx.Timeout(120.0)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def upload(c, i):
+            name, data = pdfs[i % len(pdfs)]
+            return await c.post("/upload", files={"resume": (name, data, "application/pdf")})
+
+        report["upload"] = await drive(client, args.concurrency, upload, args.uploads)
+
+        async def listing(c, i):
+            return await c.get("/resumes", params={"page_size": 20})
+
+        report["resumes"] = await drive(client, args.concurrency, listing, args.requests)
+
+        ids = resume_ids()
+        rng = random.Random(args.seed)
+
+        async def details(c, i):
+            return await c.get(f"/resume/{rng.choice(ids)}/details")
+
+        report["details"] = await drive(client, args.concurrency, details, args.requests if ids else 0)
+    return report
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--uploads", type=int, default=60)
+    ap.add_argument("--requests", type=int, default=500, help="requests for each read endpoint")
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--cloudinary-ms", type=float, default=50.0, help="stubbed upload latency")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", help="also write the JSON report to this file")
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp.name, 'load.db')}"
+    os.environ["SKILL_INDEX_BACKFILL_ON_START"] = "0"
+    for key in ("CLOUDINARY_CLOUD_NAME", "CLOUDINARY_API_KEY", "CLOUDINARY_API_SECRET"):
+        os.environ.setdefault(key, "bench")
+
+    import uvicorn
+    from sqlmodel import Session, select
+    import main as app_module
+    from models import Resume
+    from benchmarks import corpus
+
+    def fake_upload(file, public_id=None, **kwargs):
+        time.sleep(args.cloudinary_ms / 1000)
+        return {"secure_url": f"https://res.cloudinary.invalid/raw/upload/{public_id}"}
+
+    app_module.cloudinary_upload = fake_upload
+    app_module.cloudinary_destroy = lambda *a, **kw: {"result": "ok"}
+
+    def resume_ids():
+        with Session(app_module.engine) as session:
+            return list(session.exec(select(Resume.id)).all())
+
+    pdfs = [(item["filename"], item["pdf"]) for item in corpus.generate(args.uploads, args.seed)]
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app_module.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    try:
+        report = asyncio.run(load(f"http://127.0.0.1:{port}", pdfs, resume_ids, args))
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        tmp.cleanup()
+
+    output = json.dumps({"concurrency": args.concurrency, "cloudinary_ms": args.cloudinary_ms, "endpoints": report}, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
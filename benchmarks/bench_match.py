@@ -0,0 +1,131 @@
+"""
+/match ranking latency over a large table.
+
+Fills a fresh SQLite database with --size synthetic resumes (corpus
+skills, titles and degrees) and builds the on-disk match index. Then it
+ranks --queries generated job descriptions and reports:
+  - "search": MatchIndex.search alone (scoring + top-k)
+  - "endpoint": POST /match through the app (search + loading the top-k rows)
+  - "delta": search again after --delta more resumes were saved, i.e.
+    with the unmerged in-memory segment in play
+plus the build time and index size. The goal is p95 under 100 ms at 100k.
+
+Run from the repo root:
+    python -m benchmarks.bench_match [--size 100000] [--queries 200] [--top-k 10]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from benchmarks import corpus
+from models import Resume
+
+CHUNK = 5000
+JD_TEMPLATE = "We are hiring a {title} with {skills}. {degree} preferred. {extra}"
+
+
+def resume_row(i, rng):
+    r = corpus.make_resume(rng, rng.choice(list(corpus.SIZES)))
+    return {
+        "id": i, "name": r["name"], "email": r["email"], "jobTitle": r["title"],
+        "skills": ", ".join(r["skills"]), "education": r["education"][0]["degree"],
+        "educationHistory": "; ".join(f"{e['degree']}, {e['college']}" for e in r["education"]),
+    }
+
+
+def fill(engine, start, stop, rng):
+    for lo in range(start, stop, CHUNK):
+        with Session(engine) as session:
+            session.exec(insert(Resume), params=[resume_row(i, rng) for i in range(lo + 1, min(stop, lo + CHUNK) + 1)])
+            session.commit()
+
+
+def job_description(rng):
+    return JD_TEMPLATE.format(
+        title=rng.choice(corpus.TITLES),
+        skills=", ".join(rng.sample(corpus.SKILLS, rng.randint(3, 10))),
+        degree=rng.choice(corpus.DEGREES),
+        extra=" ".join(corpus._sentence(rng) for _ in range(rng.randint(1, 4))),
+    )
+
+
+def percentiles(times):
+    times = sorted(times)
+    return {
+        "p50_ms": round(statistics.median(times), 3),
+        "p95_ms": round(times[max(0, int(len(times) * 0.95) - 1)], 3),
+        "max_ms": round(times[-1], 3),
+    }
+
+
+def timed(fn, queries):
+    fn(queries[0])  # warm-up: first touch of the mapped pages
+    times = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        times.append((time.perf_counter() - start) * 1000)
+    return percentiles(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=100000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--top-k", type=int, default=10)
+    ap.add_argument("--delta", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ["MATCH_INDEX_DIR"] = index_dir = os.path.join(tmp, "match_index")
+        os.environ["MATCH_REFRESH_SECONDS"] = "0"
+        os.environ["MATCH_DELTA_MAX"] = str(args.delta * 2)  # keep the delta unmerged for the "delta" run
+        os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "bench")
+        os.environ.setdefault("CLOUDINARY_API_KEY", "bench")
+        os.environ.setdefault("CLOUDINARY_API_SECRET", "bench")
+        os.environ["SKILL_INDEX_BACKFILL_ON_START"] = "0"
+        os.environ["DEDUP_BACKFILL_ON_START"] = "0"
+        from fastapi.testclient import TestClient
+        import main as app_main
+        import match_index
+
+        engine = app_main.engine
+        start = time.perf_counter()
+        fill(engine, 0, args.size, rng)
+        report = {"size": args.size, "fill_s": round(time.perf_counter() - start, 1)}
+
+        start = time.perf_counter()
+        segment = match_index.build(engine, index_dir)
+        report["build_s"] = round(time.perf_counter() - start, 2)
+        report["terms"] = len(segment.terms)
+        seg_dir = os.path.join(index_dir, segment.name)
+        report["index_mb"] = round(sum(os.path.getsize(os.path.join(seg_dir, f)) for f in os.listdir(seg_dir)) / 2**20, 1)
+
+        queries = [job_description(rng) for _ in range(args.queries)]
+        index = app_main.match_index
+        index.refresh(force=True)
+        report["search"] = timed(lambda q: index.search(q, args.top_k), queries)
+        with TestClient(app_main.app) as client:
+            report["endpoint"] = timed(lambda q: client.post("/match", json={"job_description": q, "top_k": args.top_k}), queries)
+
+        fill(engine, args.size, args.size + args.delta, rng)
+        start = time.perf_counter()
+        index.refresh(force=True)
+        report["delta_refresh_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        report["delta"] = timed(lambda q: index.search(q, args.top_k), queries)
+        report["index_stats"] = index.stats()
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-resume CPU time of the text-level extraction in parser.py.
+
+PDF text is extracted once up front, so only the field extractors are
+timed. With --compare REV the same texts are also run through parser.py
+as it was at git revision REV, for a before/after comparison.
+
+Run from the repo root:
+    python -m benchmarks.bench_parser [--repeat 50] [--compare HEAD~1] [file.pdf ...]
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+DEFAULT_PDFS = ["resume_25.pdf", "parsed_resume.pdf"]
+
+
+def load_parser_at(rev):
+    source = subprocess.run(["git", "show", f"{rev}:parser.py"], check=True, capture_output=True, text=True).stdout
+    fd, path = tempfile.mkstemp(suffix=".py", prefix="parser_at_")
+    with os.fdopen(fd, "w") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location(f"parser_at_{rev}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    os.unlink(path)
+    return module
+
+
+def cpu_ms_per_resume(module, text, repeat):
+    # Time parse_resume_from_path minus the PDF step, with its debug prints silenced
+    # Newer parsers read PDFs through read_pdf(), older ones through extract_text_from_pdf()
+    hook = "read_pdf" if hasattr(module, "read_pdf") else "extract_text_from_pdf"
+    original = getattr(module, hook)
+    setattr(module, hook, (lambda _: module.pdf_text.PdfText(text, 1, False, "bench")) if hook == "read_pdf" else (lambda _: text))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.parse_resume_from_path("<bench>")  # warm caches
+            start = time.process_time()
+            for _ in range(repeat):
+                result = module.parse_resume_from_path("<bench>")
+            elapsed = time.process_time() - start
+    finally:
+        setattr(module, hook, original)
+    return elapsed / repeat * 1000, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("pdfs", nargs="*", default=DEFAULT_PDFS)
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--compare", metavar="REV", help="git revision of parser.py to compare against")
+    args = ap.parse_args()
+
+    import parser as current
+    baseline = load_parser_at(args.compare) if args.compare else None
+
+    for path in args.pdfs:
+        text = current.extract_text_from_pdf(path)
+        now_ms, now = cpu_ms_per_resume(current, text, args.repeat)
+        line = f"{path:<24} {len(text):>7} chars   current {now_ms:8.3f} ms"
+        if baseline is not None:
+            then_ms, then = cpu_ms_per_resume(baseline, text, args.repeat)
+            same = "identical" if then == now else "DIFFERENT OUTPUT"
+            line += f"   {args.compare} {then_ms:8.3f} ms   x{then_ms / now_ms:.1f}   {same}"
+        print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
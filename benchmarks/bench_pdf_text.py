@@ -0,0 +1,112 @@
+"""
+PDF text extraction backends compared on the bundled PDFs and the
+synthetic corpus.
+
+For every installed backend (pdfium, pymupdf, pdfminer with the tuned
+LAParams) and the old call, pdfminer extract_text with default
+LAParams over all pages, it reports the median milliseconds per file,
+and whether the fields extract_fields finds match the old call's. A
+40-page document is also timed with and without the PDF_MAX_PAGES cap,
+along with an image-only PDF, which is detected before any layout work.
+
+Run from the repo root:
+    python -m benchmarks.bench_pdf_text [--repeat 5] [--count 12] [file.pdf ...]
+"""
+import argparse
+import io
+import json
+import statistics
+import time
+
+from fpdf import FPDF
+from pdfminer.high_level import extract_text
+
+import parser
+import pdf_text
+from benchmarks import corpus
+
+BUNDLED = ["resume_25.pdf", "parsed_resume.pdf"]
+
+
+def median_ms(fn, repeat):
+    fn()  # warm up (library init, font caches)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(times), 2)
+
+
+def long_document(pages=40):
+    pdf = FPDF()
+    pdf.set_font("Arial", size=11)
+    for i in range(pages):
+        pdf.add_page()
+        for j in range(45):
+            pdf.cell(0, 6, txt=f"Portfolio page {i + 1}, line {j + 1}: designed and shipped things with python and react.", ln=True)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def image_only_document(pages=10):
+    import tempfile
+    from PIL import Image
+
+    with tempfile.NamedTemporaryFile(suffix=".png") as img:
+        Image.new("RGB", (1240, 1754), "white").save(img.name)
+        pdf = FPDF()
+        for _ in range(pages):
+            pdf.add_page()
+            pdf.image(img.name, x=0, y=0, w=210, h=297)
+        return pdf.output(dest="S").encode("latin-1")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("pdfs", nargs="*", default=BUNDLED)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--count", type=int, default=12, help="synthetic resumes to add")
+    args = ap.parse_args()
+
+    backends = [b for b in pdf_text.BACKENDS if pdf_text._installed(pdf_text.BACKENDS[b][0])]
+    files = [(path, open(path, "rb").read()) for path in args.pdfs]
+    files += [(item["filename"], item["pdf"]) for item in corpus.generate(args.count)]
+
+    report = {"backends": backends, "files": {}, "total_ms": {"pdfminer_default": 0.0, **{b: 0.0 for b in backends}}}
+    for name, data in files:
+        baseline_text = extract_text(io.BytesIO(data))
+        baseline_fields = parser.extract_fields(baseline_text)
+        row = {"pdfminer_default": {"ms": median_ms(lambda: extract_text(io.BytesIO(data)), args.repeat)}}
+        for backend in backends:
+            result = pdf_text.extract(data, max_pages=0, backend=backend)
+            fields = parser.extract_fields(result.text)
+            row[backend] = {
+                "ms": median_ms(lambda: pdf_text.extract(data, max_pages=0, backend=backend), args.repeat),
+                "fields_differ": [k for k in baseline_fields if baseline_fields[k] != fields[k]],
+            }
+        for key, value in row.items():
+            report["total_ms"][key] = round(report["total_ms"][key] + value["ms"], 2)
+        report["files"][name] = row
+
+    long_pdf = long_document()
+    report["page_cap_40_pages"] = {
+        backend: {
+            "all_pages_ms": median_ms(lambda: pdf_text.extract(long_pdf, max_pages=0, backend=backend), args.repeat),
+            f"first_{pdf_text.PDF_MAX_PAGES}_ms": median_ms(lambda: pdf_text.extract(long_pdf, backend=backend), args.repeat),
+        }
+        for backend in backends
+    }
+
+    scanned = image_only_document()
+    report["image_only_10_pages"] = {
+        backend: {
+            "ms": median_ms(lambda: pdf_text.extract(scanned, max_pages=0, backend=backend), args.repeat),
+            "detected": pdf_text.extract(scanned, max_pages=0, backend=backend).image_only,
+        }
+        for backend in backends
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+FTS5 search benchmark on a synthetic resume table (default 100k rows).
+
+Builds a throwaway SQLite database with the app's schema, inserts rows
+through the sync triggers, then times /resumes/search-style queries
+(first page and a page 10 cursors deep) against the LIKE table scan
+needed to find every match without an index.
+
+Run from the repo root:
+    python -m benchmarks.bench_search [--rows 100000] [--queries 50]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine
+
+import models  # noqa: F401  (registers tables)
+from search import ensure_fts, search_resumes
+from skill_taxonomy import load_taxonomy
+
+FIRST = ["Ananya", "Rahul", "Sanjay", "Priya", "John", "Meera", "Arjun", "Divya", "Karthik", "Sneha"]
+LAST = ["Mehta", "Iyer", "Kumar", "Sharma", "Doe", "Reddy", "Nair", "Rao", "Gupta", "Menon"]
+TITLES = ["Developer", "Software Engineer", "Data Scientist", "Analyst", "Intern", "Sde"]
+CITIES = ["Chennai", "Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune", "Coimbatore", ""]
+SKILLS = list(load_taxonomy().skills)
+COLLEGES = ["Anna University", "RV College of Engineering", "Vellore Institute of Technology", "IIT Madras", "BITS Pilani"]
+QUERIES = ["python", "react node.js", "machine learning", "kumar", "data scientist chennai", "docker kubernetes", "anna", "pyt"]
+
+
+def make_row(rng):
+    return {
+        "name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+        "email": f"user{rng.randrange(10**9)}@example.com",
+        "jobTitle": rng.choice(TITLES),
+        "skills": ", ".join(rng.sample(SKILLS, rng.randint(4, 15))),
+        "education": f"B.Tech | {rng.choice(COLLEGES)}",
+        "city": rng.choice(CITIES),
+    }
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--queries", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        ensure_fts(engine)
+
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            for offset in range(0, args.rows, 5000):
+                batch = [make_row(rng) for _ in range(min(5000, args.rows - offset))]
+                conn.execute(text('INSERT INTO resume (name, email, "jobTitle", skills, education, city) '
+                                  'VALUES (:name, :email, :jobTitle, :skills, :education, :city)'), batch)
+        insert_s = time.perf_counter() - start
+
+        report = {"rows": args.rows, "insert_rows_per_s": round(args.rows / insert_s), "queries": {}}
+        with engine.connect() as conn:
+            for q in QUERIES:
+                first, deep, like = [], [], []
+                for _ in range(args.queries):
+                    t = time.perf_counter()
+                    page = search_resumes(conn, q, limit=20)
+                    first.append((time.perf_counter() - t) * 1000)
+
+                    cursor = page["next_cursor"]
+                    for _ in range(9):
+                        if not cursor:
+                            break
+                        cursor = search_resumes(conn, q, limit=20, cursor=cursor)["next_cursor"]
+                    if cursor:
+                        t = time.perf_counter()
+                        search_resumes(conn, q, limit=20, cursor=cursor)
+                        deep.append((time.perf_counter() - t) * 1000)
+
+                for _ in range(max(1, args.queries // 10)):
+                    t = time.perf_counter()
+                    # What the old approach needs to find every match (to rank or count them)
+                    conn.execute(text("SELECT count(*) FROM resume WHERE name LIKE :p OR skills LIKE :p OR \"jobTitle\" LIKE :p "
+                                      "OR education LIKE :p OR city LIKE :p"),
+                                 {"p": f"%{q.split()[0]}%"}).one()
+                    like.append((time.perf_counter() - t) * 1000)
+
+                report["queries"][q] = {
+                    "fts_first_page_ms": {"p50": round(statistics.median(first), 3), "p95": round(pct(first, 0.95), 3)},
+                    "fts_page_11_ms": {"p50": round(statistics.median(deep), 3), "p95": round(pct(deep, 0.95), 3)} if deep else None,
+                    "like_full_scan_ms": {"p50": round(statistics.median(like), 3)},
+                }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
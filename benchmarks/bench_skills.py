@@ -0,0 +1,63 @@
+"""
+Microbenchmark: old per-token difflib scan vs the compiled skills taxonomy matcher.
+
+Run from the repo root:
+    python -m benchmarks.bench_skills [--repeat 20] [file.pdf ...]
+"""
+import argparse
+import difflib
+import re
+import time
+
+from parser import SKILLS, STOPWORDS, extract_text_from_pdf
+
+DEFAULT_PDFS = ["resume_25.pdf", "parsed_resume.pdf"]
+
+
+def legacy_extract_skills(text, skill_db):
+    # The previous parser.extract_skills (stopwords were an NLTK list rebuilt per token)
+    stopwords = list(STOPWORDS)
+    text = text.lower()
+    tokens = re.findall(r'\b\w+(?:\.\w+)?\b', text)
+    tokens = [t for t in tokens if t not in stopwords]
+
+    matched_skills = set()
+    for token in tokens:
+        close_matches = difflib.get_close_matches(token, skill_db, n=1, cutoff=0.85)
+        if close_matches:
+            matched_skills.add(close_matches[0])
+
+    return list(matched_skills)
+
+
+def _time(fn, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(text)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("pdfs", nargs="*", default=DEFAULT_PDFS)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    taxonomy = SKILLS.current()
+    for path in args.pdfs:
+        text = extract_text_from_pdf(path)
+        legacy_t, legacy = _time(lambda t: legacy_extract_skills(t, taxonomy.skills), text, args.repeat)
+        new_t, new = _time(taxonomy.match, text, args.repeat)
+        missing = sorted(set(legacy) - set(new))
+        extra = sorted(set(new) - set(legacy))
+        print(f"{path}: {len(text)} chars")
+        print(f"  legacy difflib : {legacy_t * 1000:8.2f} ms  ({len(legacy)} skills)")
+        print(f"  SkillMatcher   : {new_t * 1000:8.2f} ms  ({len(new)} skills)  x{legacy_t / new_t:.0f}")
+        if missing:
+            print(f"  only legacy    : {', '.join(missing)}")
+        if extra:
+            print(f"  only matcher   : {', '.join(extra)}")
+
+
+if __name__ == "__main__":
+    main()
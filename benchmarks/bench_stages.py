@@ -0,0 +1,113 @@
+"""
+Per-stage timing of parse_resume_from_path over the synthetic corpus.
+
+Each resume is run through the same steps as extract_fields, timed one
+at a time:
+    pdf        pdfminer text extraction
+    view       shared ResumeText normalization
+    segment    section segmentation (sections.py)
+    name       name extraction (spaCy NER + fallbacks)
+    contact    email + phone
+    skills     SkillMatcher (exact + fuzzy)
+    education  one-pass line scan (education, history, location)
+    links      linkedin / github / portfolio
+    other      job title, salary, age, experience, languages
+    entries    work experience and awards entries
+    total      parse_resume_from_bytes end to end
+Results are reported per resume size (short / medium / long) as JSON.
+
+Run from the repo root:
+    python -m benchmarks.bench_stages [--count 30] [--repeat 3] [--out stages.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import time
+from collections import defaultdict
+
+import parser
+from benchmarks import corpus
+
+STAGES = ("pdf", "view", "segment", "name", "contact", "skills", "education", "links", "other", "entries", "total")
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def time_stages(pdf: bytes):
+    timings = {}
+
+    def stage(name, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    text = stage("pdf", parser.extract_text_from_pdf, io.BytesIO(pdf))
+    view = stage("view", parser._view, text)
+    stage("segment", getattr, view, "blocks")
+    stage("name", parser.extract_name, view)
+    stage("contact", lambda v: (parser.extract_email(v), parser.extract_phone(v)), view)
+    stage("skills", parser.extract_skills, view)
+    stage("education", parser._scan_lines, view)
+    stage("links", lambda v: {p: parser.extract_link(v, p) for p in parser.SOCIAL_PLATFORMS}, view)
+    stage("other", lambda v: (parser.extract_job_title(v), parser.extract_expected_salary(v), parser.extract_age(v),
+                              parser.extract_years_of_exp(v), parser.extract_languages(v)), view)
+    stage("entries", lambda v: (parser.extract_work_experience(v), parser.extract_awards(v)), view)
+    with contextlib.redirect_stdout(io.StringIO()):
+        stage("total", parser.parse_resume_from_bytes, pdf)
+    return timings, len(text)
+
+
+def run(count: int = 30, repeat: int = 3, seed: int = 7):
+    parser.get_nlp()  # model load is startup cost, not per-resume cost (see bench_startup)
+    items = corpus.generate(count, seed)
+    time_stages(items[0]["pdf"])  # warm caches
+
+    samples = defaultdict(lambda: defaultdict(list))
+    chars = defaultdict(list)
+    for item in items:
+        for _ in range(repeat):
+            timings, n = time_stages(item["pdf"])
+            for name, ms in timings.items():
+                samples[item["size"]][name].append(ms)
+        chars[item["size"]].append(n)
+
+    return {
+        "resumes": count,
+        "repeat": repeat,
+        "sizes": {
+            size: {
+                "avg_chars": round(statistics.mean(chars[size])),
+                "stages_ms": {
+                    name: {"p50": round(statistics.median(values), 3), "p95": round(pct(values, 0.95), 3)}
+                    for name, values in ((s, by_stage[s]) for s in STAGES)
+                },
+            }
+            for size, by_stage in samples.items()
+        },
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--count", type=int, default=30)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", help="also write the JSON report to this file")
+    args = ap.parse_args()
+
+    report = run(args.count, args.repeat, args.seed)
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Cold-start cost of the parser: wall time and peak RSS to import parser,
+then to load spaCy on first use. Each measurement runs in a fresh
+interpreter so nothing is already cached in-process.
+
+Run from the repo root:
+    python -m benchmarks.bench_startup [--runs 3]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+PROBE = r"""
+import json, resource, time
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+t0 = time.perf_counter()
+import parser
+t1 = time.perf_counter()
+after_import = rss_mb()
+parser.get_nlp()
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_s": round(t1 - t0, 3),
+    "import_rss_mb": round(after_import, 1),
+    "spacy_load_s": round(t2 - t1, 3),
+    "spacy_rss_mb": round(rss_mb(), 1),
+}))
+"""
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, "-c", PROBE], check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    best = {k: min(r[k] for r in runs) for k in runs[0]}
+    print(json.dumps({"runs": runs, "best": best}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
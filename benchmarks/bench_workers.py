@@ -0,0 +1,145 @@
+"""
+Memory per web worker: separately started workers vs a preforked master.
+
+Starts the app with --workers N in each mode against a throwaway SQLite
+database (Cloudinary credentials are dummies; nothing is uploaded):
+  - "uvicorn":  uvicorn main:app --workers N -- every worker imports the
+                app and loads spaCy and the skills taxonomy on its own
+  - "gunicorn": gunicorn main:app -c gunicorn.conf.py -- one preloaded
+                master loads them, workers share the pages copy-on-write
+Waits until every worker answers GET /ready, sends --requests dashboard
+requests, then reads /proc/<pid>/smaps_rollup for each worker:
+  rss_mb   resident pages, shared ones counted in full
+  pss_mb   shared pages divided among the processes sharing them
+  uss_mb   pages private to the worker
+Reports per-worker averages, the sum over all processes (master
+included) and the time until every worker was ready. Linux only.
+
+Run from the repo root:
+    python -m benchmarks.bench_workers [--workers 4] [--requests 200]
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def children(pid):
+    out = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid and "resource_tracker" not in cmdline:
+            out.append(int(entry))
+    return out
+
+
+def memory_mb(pid):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {"rss_mb": fields.get("Rss", 0), "pss_mb": fields.get("Pss", 0), "uss_mb": private}
+
+
+def command(mode, port, workers):
+    if mode == "uvicorn":
+        return [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+                "--workers", str(workers), "--log-level", "warning"]
+    return [sys.executable, "-m", "gunicorn", "main:app", "-c", "gunicorn.conf.py",
+            "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--log-level", "warning"]
+
+
+def run_mode(mode, workers, requests, tmp):
+    port = free_port()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(tmp, f'{mode}.db')}",
+        MATCH_INDEX_DIR=os.path.join(tmp, f"{mode}_match_index"),
+        CLOUDINARY_CLOUD_NAME=os.getenv("CLOUDINARY_CLOUD_NAME", "bench"),
+        CLOUDINARY_API_KEY=os.getenv("CLOUDINARY_API_KEY", "bench"),
+        CLOUDINARY_API_SECRET=os.getenv("CLOUDINARY_API_SECRET", "bench"),
+        SKILL_INDEX_BACKFILL_ON_START="0",
+        DEDUP_BACKFILL_ON_START="0",
+        WEB_CONCURRENCY=str(workers),
+        MAX_REQUESTS="0",
+    )
+    start = time.perf_counter()
+    proc = subprocess.Popen(command(mode, port, workers), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f"http://127.0.0.1:{port}"
+        ready_pids = set()
+        deadline = time.monotonic() + 300
+        with httpx.Client(base_url=base, timeout=10) as client:
+            while len(ready_pids) < workers:
+                if time.monotonic() > deadline or proc.poll() is not None:
+                    raise RuntimeError(f"{mode}: only {len(ready_pids)}/{workers} workers became ready")
+                try:
+                    r = client.get("/ready", headers={"Connection": "close"})
+                    if r.status_code == 200:
+                        ready_pids.add(r.json()["pid"])
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.05)
+            ready_s = time.perf_counter() - start
+            for _ in range(requests):
+                client.get("/resumes", headers={"Connection": "close"})
+
+        pids = children(proc.pid)
+        per_worker = [memory_mb(pid) for pid in pids]
+        master = memory_mb(proc.pid)
+        return {
+            "workers": len(pids),
+            "ready_s": round(ready_s, 2),
+            "per_worker": {k: round(statistics.mean(m[k] for m in per_worker), 1) for k in master},
+            "master": {k: round(v, 1) for k, v in master.items()},
+            "total_pss_mb": round(master["pss_mb"] + sum(m["pss_mb"] for m in per_worker), 1),
+        }
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--modes", default="uvicorn,gunicorn")
+    args = ap.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes.split(","):
+            report[mode] = run_mode(mode, args.workers, args.requests, tmp)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Synthetic resume corpus for the benchmarks, generated offline with FPDF
+(the same renderer the app uses for exports).
+
+Resumes come in three lengths so per-page costs show up:
+    short   ~1 page   (contact block, skills, education)
+    medium  ~2-3 pages (+ summary, a few jobs, projects)
+    long    ~6-8 pages (+ many jobs with long bullet lists)
+Content is seeded, so the same --seed always produces the same bytes.
+
+Run from the repo root:
+    python -m benchmarks.corpus --out /tmp/corpus [--count 30] [--seed 7]
+"""
+import argparse
+import json
+import os
+import random
+from typing import Dict, List
+
+from fpdf import FPDF
+
+from skill_taxonomy import load_taxonomy
+
+FIRST = ["Ananya", "Rahul", "Sanjay", "Priya", "John", "Meera", "Arjun", "Divya", "Karthik", "Sneha"]
+LAST = ["Mehta", "Iyer", "Kumar", "Sharma", "Doe", "Reddy", "Nair", "Rao", "Gupta", "Menon"]
+TITLES = ["Software Engineer", "Developer", "Data Scientist", "Analyst", "Intern"]
+CITIES = ["Chennai", "Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune", "Coimbatore"]
+COLLEGES = ["Anna University", "RV College of Engineering", "Vellore Institute of Technology",
+            "PSG College of Technology", "Delhi University"]
+DEGREES = ["B.Tech in Computer Science", "B.E Electronics Engineering", "M.Tech Data Science",
+           "B.Sc Computer Science"]
+COMPANIES = ["Infosys", "Zoho", "Freshworks", "TCS", "Wipro", "Swiggy", "Flipkart", "Razorpay"]
+VERBS = ["Built", "Designed", "Migrated", "Optimised", "Maintained", "Led", "Automated", "Shipped"]
+OBJECTS = ["a REST API", "the billing pipeline", "an internal dashboard", "CI/CD workflows",
+           "a recommendation service", "data ingestion jobs", "the mobile checkout flow", "search indexing"]
+OUTCOMES = ["cutting latency by 40%", "for 2M monthly users", "with 99.9% uptime", "saving 10 hours a week",
+            "reducing cloud spend", "across three teams", "ahead of schedule", "with full test coverage"]
+SKILLS = list(load_taxonomy().skills)
+
+SIZES = {
+    # jobs, bullets per job, projects, skills
+    "short": (0, 0, 1, 8),
+    "medium": (3, 4, 3, 15),
+    "long": (8, 12, 6, 30),
+}
+
+
+def _sentence(rng: random.Random) -> str:
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)} and {rng.choice(SKILLS)}, {rng.choice(OUTCOMES)}."
+
+
+def make_resume(rng: random.Random, size: str) -> Dict:
+    jobs, bullets, projects, n_skills = SIZES[size]
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    start = rng.randint(2008, 2018)
+    return {
+        "size": size,
+        "name": f"{first} {last}",
+        "title": rng.choice(TITLES),
+        "email": f"{first.lower()}.{last.lower()}{rng.randrange(1000)}@example.com",
+        "phone": f"+91 9{rng.randrange(10**8, 10**9)}",
+        "city": rng.choice(CITIES),
+        "age": rng.randint(21, 45),
+        "salary": f"{rng.randint(10, 40)}-{rng.randint(41, 90)}k",
+        "linkedin": f"https://linkedin.com/in/{first.lower()}-{last.lower()}",
+        "github": f"https://github.com/{first.lower()}{last.lower()}",
+        "skills": rng.sample(SKILLS, n_skills),
+        "languages": rng.sample(["English", "Tamil", "Hindi"], rng.randint(1, 3)),
+        "summary": " ".join(_sentence(rng) for _ in range(3 if size != "short" else 1)),
+        "education": [
+            {"degree": rng.choice(DEGREES), "college": rng.choice(COLLEGES), "years": f"{start - 4} - {start}"},
+            {"degree": "Higher Secondary", "college": f"{rng.choice(CITIES)} Public School", "years": f"{start - 6} - {start - 4}"},
+        ],
+        "jobs": [
+            {
+                "role": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "years": f"{start + i} - {start + i + 1}",
+                "bullets": [_sentence(rng) for _ in range(bullets)],
+            }
+            for i in range(jobs)
+        ],
+        "projects": [_sentence(rng) for _ in range(projects)],
+    }
+
+
+def _latin1(text: str) -> str:
+    return text.encode("latin-1", "replace").decode("latin-1")
+
+
+def render(resume: Dict) -> bytes:
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, txt=resume["name"], ln=True)
+    pdf.set_font("Arial", size=11)
+
+    def line(text=""):
+        pdf.multi_cell(0, 6, _latin1(text))
+
+    def heading(text):
+        pdf.ln(3)
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 8, txt=text, ln=True)
+        pdf.set_font("Arial", size=11)
+
+    line(resume["title"])
+    line(f"Email: {resume['email']} | Phone: {resume['phone']}")
+    line(f"Address: {resume['city']}, India")
+    line(f"Age: {resume['age']}   Expected salary: {resume['salary']}")
+    line(f"LinkedIn: {resume['linkedin']}")
+    line(f"GitHub: {resume['github']}")
+
+    heading("Summary")
+    line(resume["summary"])
+
+    heading("Skills")
+    line(", ".join(resume["skills"]))
+
+    if resume["jobs"]:
+        heading("Experience")
+        for job in resume["jobs"]:
+            line(f"{job['role']} - {job['company']} ({job['years']})")
+            for bullet in job["bullets"]:
+                line(f"- {bullet}")
+
+    heading("Projects")
+    for project in resume["projects"]:
+        line(f"- {project}")
+
+    heading("Education")
+    for edu in resume["education"]:
+        line(edu["college"])
+        line(f"{edu['degree']} | {edu['years']}")
+
+    heading("Languages")
+    line(", ".join(resume["languages"]))
+
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def generate(count: int = 30, seed: int = 7) -> List[Dict]:
+    """Return ``count`` resumes (spec + rendered pdf bytes), sizes round-robin."""
+    rng = random.Random(seed)
+    sizes = list(SIZES)
+    corpus = []
+    for i in range(count):
+        spec = make_resume(rng, sizes[i % len(sizes)])
+        corpus.append({**spec, "filename": f"synthetic_{i:04d}_{spec['size']}.pdf", "pdf": render(spec)})
+    return corpus
+
+
+def write(out_dir: str, count: int = 30, seed: int = 7) -> List[str]:
+    os.makedirs(out_dir, exist_ok=True)
+    paths, manifest = [], []
+    for item in generate(count, seed):
+        path = os.path.join(out_dir, item["filename"])
+        with open(path, "wb") as f:
+            f.write(item["pdf"])
+        paths.append(path)
+        manifest.append({k: v for k, v in item.items() if k != "pdf"})
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return paths
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--count", type=int, default=30)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    paths = write(args.out, args.count, args.seed)
+    print(json.dumps({"out": args.out, "files": len(paths)}))
+
+
+if __name__ == "__main__":
+    main()
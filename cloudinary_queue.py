@@ -0,0 +1,89 @@
+import os
+import heapq
+import threading
+import time
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# Deferred Cloudinary uploads: the parsed result is saved and rendered
+# first, the asset upload happens here with exponential-backoff retries.
+# Pending uploads live in memory only; they are lost on restart and the
+# affected rows keep cv_url = NULL.
+# ------------------------------------------------------------------
+DEFERRED_UPLOAD_MAX_PENDING = int(os.getenv("DEFERRED_UPLOAD_MAX_PENDING", "64"))
+DEFERRED_UPLOAD_MAX_ATTEMPTS = int(os.getenv("DEFERRED_UPLOAD_MAX_ATTEMPTS", "5"))
+DEFERRED_UPLOAD_RETRY_SECONDS = float(os.getenv("DEFERRED_UPLOAD_RETRY_SECONDS", "2"))
+
+
+class DeferredUploader:
+    def __init__(self, upload: Callable[[bytes, str], str], on_success: Callable[[Any, str, str], None],
+                 max_pending: int = DEFERRED_UPLOAD_MAX_PENDING, max_attempts: int = DEFERRED_UPLOAD_MAX_ATTEMPTS,
+                 retry_seconds: float = DEFERRED_UPLOAD_RETRY_SECONDS):
+        self.upload = upload
+        self.on_success = on_success
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self._heap = []  # (ready_at, seq, attempt, key, pdf_bytes, public_id)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._counts = {"uploaded": 0, "retries": 0, "failed": 0}
+
+    def stats(self):
+        with self._cond:
+            return {"pending": len(self._heap), **self._counts}
+
+    def submit(self, key: Any, pdf_bytes: bytes, public_id: str) -> bool:
+        """Queue an upload; returns False when the queue is full (caller should upload inline)."""
+        with self._cond:
+            if len(self._heap) >= self.max_pending:
+                return False
+            self._push(time.monotonic(), 0, key, pdf_bytes, public_id)
+            return True
+
+    def _push(self, ready_at, attempt, key, pdf_bytes, public_id):
+        self._seq += 1
+        heapq.heappush(self._heap, (ready_at, self._seq, attempt, key, pdf_bytes, public_id))
+        self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopping and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    self._cond.wait(timeout=(self._heap[0][0] - time.monotonic()) if self._heap else None)
+                if self._stopping:
+                    return
+                _, _, attempt, key, pdf_bytes, public_id = heapq.heappop(self._heap)
+
+            try:
+                secure_url = self.upload(pdf_bytes, public_id)
+                self.on_success(key, public_id, secure_url)
+                self._counts["uploaded"] += 1
+            except Exception:
+                attempt += 1
+                if attempt >= self.max_attempts:
+                    self._counts["failed"] += 1
+                    logger.exception("Deferred upload of %s failed after %d attempts", public_id, attempt)
+                    continue
+                self._counts["retries"] += 1
+                with self._cond:
+                    self._push(time.monotonic() + self.retry_seconds * 2 ** (attempt - 1), attempt, key, pdf_bytes, public_id)
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="cloudinary-deferred", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            if self._heap:
+                logger.warning("Dropping %d pending deferred uploads; their resumes keep no cv_url", len(self._heap))
+        self._thread = None
@@ -0,0 +1,233 @@
+import os
+import re
+import zlib
+import hashlib
+import argparse
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import and_, delete, insert, or_
+from sqlmodel import Session, select
+
+from models import Resume, ResumeFingerprint, ResumeLshBand, ResumeText
+
+# ------------------------------------------------------------------
+# Duplicate candidate detection. Every resume gets a fingerprint row:
+# normalized email and phone and the SHA-256 of the uploaded file (exact
+# matches, indexed), plus a MinHash signature of the extracted text whose
+# LSH band buckets (resume_lsh) find near-duplicates with one index probe
+# per band, however many resumes are stored.
+# ------------------------------------------------------------------
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.6"))  # estimated Jaccard similarity of the texts
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 32           # 32 bands x 4 rows: pairs above ~0.5 similarity become candidates
+SHINGLE_WORDS = 4
+
+_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+# Fixed seeds: signatures are stored, so every process must use the same permutations
+_SEEDS = np.random.RandomState(20240601).randint(0, 1 << 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    email = (email or "").strip().lower()
+    local, at, domain = email.partition("@")
+    if not at or not local or not domain:
+        return None
+    local = local.split("+", 1)[0]
+    if domain in ("gmail.com", "googlemail.com"):
+        local, domain = local.replace(".", ""), "gmail.com"
+    return f"{local}@{domain}"
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    # Last ten digits: "+91 98765 43210" and "098765-43210" are the same number
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] if len(digits) >= 7 else None
+
+
+def minhash(text: Optional[str]) -> Optional[np.ndarray]:
+    """MinHash signature (uint32 x MINHASH_PERMUTATIONS) of the text's word 4-grams."""
+    words = _WORD_RE.findall((text or "").lower())
+    if not words:
+        return None
+    n = max(1, len(words) - SHINGLE_WORDS + 1)
+    shingles = {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(n)}
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+    # One seeded splitmix64 finalizer per permutation (uint64 arithmetic wraps)
+    x = hashes[:, None] ^ _SEEDS
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return (x.min(axis=0) >> np.uint64(32)).astype(np.uint32)
+
+
+def to_bytes(signature: np.ndarray) -> bytes:
+    return signature.astype("<u4").tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u4")
+
+
+def band_buckets(signature: np.ndarray) -> List[int]:
+    """One signed 64-bit bucket per band (fits a BIGINT column)."""
+    raw = to_bytes(signature)
+    step = _ROWS * 4
+    return [
+        int.from_bytes(hashlib.blake2b(raw[i * step:(i + 1) * step], digest_size=8).digest(), "little", signed=True)
+        for i in range(LSH_BANDS)
+    ]
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+# ------------------------------------------------------------------
+# Lookups
+# ------------------------------------------------------------------
+def find_matches(session: Session, email: Optional[str], phone: Optional[str], sha256: Optional[str],
+                 signature: Optional[np.ndarray], exclude: Optional[int] = None,
+                 threshold: float = DEDUP_THRESHOLD) -> Dict[int, Dict[str, Any]]:
+    """{resume_id: {"reasons": [...], "similarity": float|None, "duplicate_of": id|None}} of matching resumes."""
+    matches: Dict[int, Dict[str, Any]] = {}
+
+    def add(row_id, duplicate_of, reason, score=None):
+        if row_id == exclude:
+            return
+        m = matches.setdefault(row_id, {"reasons": [], "similarity": None, "duplicate_of": duplicate_of})
+        m["reasons"].append(reason)
+        if score is not None:
+            m["similarity"] = round(score, 3)
+
+    exact = [(ResumeFingerprint.email, email, "email"), (ResumeFingerprint.phone, phone, "phone"), (ResumeFingerprint.sha256, sha256, "file")]
+    conditions = [column == value for column, value, _ in exact if value]
+    if conditions:
+        for fp in session.exec(select(ResumeFingerprint).where(or_(*conditions))).all():
+            for column, value, reason in exact:
+                if value and getattr(fp, column.key) == value:
+                    add(fp.resume_id, fp.duplicate_of, reason)
+
+    if signature is not None:
+        probes = [and_(ResumeLshBand.band == band, ResumeLshBand.bucket == bucket)
+                  for band, bucket in enumerate(band_buckets(signature))]
+        candidates = set(session.exec(select(ResumeLshBand.resume_id).where(or_(*probes))).all())
+        candidates.discard(exclude)
+        if candidates:
+            rows = session.exec(
+                select(ResumeFingerprint.resume_id, ResumeFingerprint.minhash, ResumeFingerprint.duplicate_of)
+                .where(ResumeFingerprint.resume_id.in_(list(candidates)))
+            ).all()
+            for row_id, stored, duplicate_of in rows:
+                score = similarity(signature, from_bytes(stored)) if stored else 0.0
+                if score >= threshold:
+                    add(row_id, duplicate_of, "text", score)
+    return matches
+
+
+def _earliest(matches: Dict[int, Dict[str, Any]], resume_id: int) -> Optional[int]:
+    roots = [m["duplicate_of"] or row_id for row_id, m in matches.items() if (m["duplicate_of"] or row_id) != resume_id]
+    return min(roots) if roots else None
+
+
+def register(session: Session, resumes: Sequence[Resume], texts: Optional[Sequence[Optional[str]]] = None,
+             digests: Optional[Sequence[Optional[str]]] = None, replace: bool = False) -> Dict[int, Optional[int]]:
+    """
+    Fingerprint flushed Resume rows (same transaction as the caller) and flag
+    each as a duplicate of the earliest matching resume. Returns
+    {resume_id: duplicate_of}. Rows are handled in order, so a later copy in
+    the same batch is flagged against an earlier one. With replace, existing
+    fingerprints of the rows are redone (keeping their file digest unless
+    ``digests`` is given).
+    """
+    kept: Dict[int, Optional[str]] = {}
+    if replace and resumes:
+        ids = [r.id for r in resumes]
+        kept = dict(session.exec(
+            select(ResumeFingerprint.resume_id, ResumeFingerprint.sha256).where(ResumeFingerprint.resume_id.in_(ids))
+        ).all())
+        session.exec(delete(ResumeLshBand).where(ResumeLshBand.resume_id.in_(ids)))
+        session.exec(delete(ResumeFingerprint).where(ResumeFingerprint.resume_id.in_(ids)))
+    flagged: Dict[int, Optional[int]] = {}
+    for i, resume in enumerate(resumes):
+        text = texts[i] if texts else None
+        digest = digests[i] if digests else kept.get(resume.id)
+        email, phone = normalize_email(resume.email), normalize_phone(resume.phone)
+        signature = minhash(text)
+
+        matches = find_matches(session, email, phone, digest, signature, exclude=resume.id)
+        duplicate_of = _earliest(matches, resume.id)
+
+        session.add(ResumeFingerprint(
+            resume_id=resume.id, email=email, phone=phone, sha256=digest,
+            minhash=to_bytes(signature) if signature is not None else None, duplicate_of=duplicate_of,
+        ))
+        if signature is not None:
+            session.exec(insert(ResumeLshBand), params=[
+                {"band": band, "bucket": bucket, "resume_id": resume.id}
+                for band, bucket in enumerate(band_buckets(signature))
+            ])
+        session.flush()
+        flagged[resume.id] = duplicate_of
+    return flagged
+
+
+def find_duplicates(session: Session, resume_id: int) -> Optional[Dict[str, Any]]:
+    """Resumes matching ``resume_id`` (exact or near-duplicate), or None if there is no such resume."""
+    fp = session.get(ResumeFingerprint, resume_id)
+    if fp is not None:
+        signature = from_bytes(fp.minhash) if fp.minhash else None
+        matches = find_matches(session, fp.email, fp.phone, fp.sha256, signature, exclude=resume_id)
+        duplicate_of = fp.duplicate_of
+    else:
+        # Saved before deduplication existed and not reached by backfill() yet: match it
+        # in memory. Storing its fingerprint is backfill()'s job (and would race it).
+        resume = session.get(Resume, resume_id)
+        if resume is None:
+            return None
+        stored = session.get(ResumeText, resume_id)
+        signature = minhash(stored.text if stored else None)
+        matches = find_matches(session, normalize_email(resume.email), normalize_phone(resume.phone), None,
+                               signature, exclude=resume_id)
+        duplicate_of = _earliest(matches, resume_id)
+    rows = session.exec(
+        select(Resume.id, Resume.name, Resume.email, Resume.jobTitle).where(Resume.id.in_(list(matches)))
+    ).all() if matches else []
+    duplicates = [
+        {"id": r.id, "name": r.name, "email": r.email, "jobTitle": r.jobTitle, **matches[r.id]}
+        for r in sorted(rows, key=lambda r: r.id)
+    ]
+    return {"resume_id": resume_id, "duplicate_of": duplicate_of, "duplicates": duplicates}
+
+
+def backfill(engine, batch_size: int = 500) -> int:
+    """Fingerprint resumes saved before deduplication existed, oldest first. Returns rows processed."""
+    done = 0
+    while True:
+        with Session(engine) as session:
+            fingerprinted = select(ResumeFingerprint.resume_id).where(ResumeFingerprint.resume_id == Resume.id).exists()
+            batch = session.exec(
+                select(Resume, ResumeText.text)
+                .join(ResumeText, ResumeText.resume_id == Resume.id, isouter=True)
+                .where(~fingerprinted).order_by(Resume.id).limit(batch_size)
+            ).all()
+            if not batch:
+                return done
+            register(session, [r for r, _ in batch], [t for _, t in batch])
+            session.commit()
+            done += len(batch)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Fingerprint existing resumes for duplicate detection.")
+    ap.add_argument("--database-url", default=None, help="defaults to $DATABASE_URL")
+    ap.add_argument("--batch-size", type=int, default=500)
+    args = ap.parse_args()
+
+    from database import DATABASE_URL, make_engine, create_db_and_tables
+    engine = make_engine(args.database_url or DATABASE_URL)
+    create_db_and_tables(engine)
+    print(f"Fingerprinted {backfill(engine, args.batch_size)} resumes.")
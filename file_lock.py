@@ -0,0 +1,38 @@
+import os
+import fcntl
+from typing import Optional
+
+# ------------------------------------------------------------------
+# "One process at a time" locks between gunicorn workers (and CLI runs
+# on the same host): flock() on a descriptor held open for the whole
+# job. The kernel drops the lock when the holder closes it or exits, so
+# a crashed holder never leaves a stale lock behind. The file itself is
+# never removed: deleting it would let a new opener lock a different
+# inode than a process still waiting on the old one.
+# ------------------------------------------------------------------
+
+
+class FileLock:
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        """Take the lock; without blocking, return False at once if another holder has it."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def release(self):
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)  # closing the descriptor drops the lock
@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------
+# Multi-worker serving: gunicorn master + uvicorn workers.
+#
+#     gunicorn main:app -c gunicorn.conf.py
+#
+# The app is imported once in the master (preload_app), which also loads
+# spaCy and the skills taxonomy and freezes the GC heap before forking, so
+# workers share those pages copy-on-write instead of each loading its own
+# copy. Workers are recycled after MAX_REQUESTS (+ jitter) requests to
+# contain slow leaks; GET /ready reports when a worker can take traffic.
+# ------------------------------------------------------------------
+import gc
+import os
+import glob
+import logging
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+max_requests = int(os.getenv("MAX_REQUESTS", "1000"))          # 0 = never recycle
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "100"))  # so workers don't all restart together
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))               # batch uploads parse for a while
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))  # recycled workers finish queued upload jobs within JOB_STOP_TIMEOUT
+keepalive = 5
+
+logger = logging.getLogger("gunicorn.error")
+
+
+# Per-process metric files from a previous run would be summed into this one's.
+# Done here, before the app (and prometheus_client) is imported.
+_prom_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+if _prom_dir:
+    os.makedirs(_prom_dir, exist_ok=True)
+    for _path in glob.glob(os.path.join(_prom_dir, "*.db")):
+        os.remove(_path)
+
+
+def when_ready(server):
+    # Runs in the master after the app was imported and before the first fork
+    import main
+    main.warm_up()
+    gc.collect()
+    # Objects that exist now are never collected in the workers: the collector
+    # doesn't touch (and so doesn't copy) their pages
+    gc.freeze()
+    logger.info("Preloaded app; %d objects frozen before forking", gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    # Pooled connections opened by the master at import must not be shared across processes
+    import main
+    main.engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
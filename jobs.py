@@ -0,0 +1,144 @@
+import os
+import time
+import queue
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlmodel import Session, select
+
+from models import UploadJob
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# Background upload jobs: a bounded in-process queue drained by worker
+# threads, with job state persisted to SQLite so any worker process can
+# answer GET /jobs/{id}.
+# ------------------------------------------------------------------
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "32"))
+# How long shutdown waits for queued and running jobs; keep it under gunicorn's graceful_timeout
+JOB_STOP_TIMEOUT = float(os.getenv("JOB_STOP_TIMEOUT", "25"))
+
+FINAL_STATES = {"done", "error"}
+
+
+class QueueFull(Exception):
+    pass
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    def __init__(self, engine, workers: int = JOB_WORKERS, max_depth: int = JOB_QUEUE_MAX):
+        self.engine = engine
+        self.workers = workers
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_depth)
+        self._threads = []
+        self._accepting = False
+        self._submit_lock = threading.Lock()
+
+    # Job rows ----------------------------------------------------------
+    def _update(self, job_id: str, **fields):
+        with Session(self.engine) as session:
+            job = session.get(UploadJob, job_id)
+            if job is None:
+                return
+            for k, v in fields.items():
+                setattr(job, k, v)
+            job.updated_at = datetime.utcnow()
+            session.add(job)
+            session.commit()
+
+    def get(self, job_id: str) -> Optional[UploadJob]:
+        with Session(self.engine) as session:
+            return session.get(UploadJob, job_id)
+
+    # Queue -------------------------------------------------------------
+    def submit(self, job_id: str, filename: str, task: Callable[[Callable[[str], None]], Dict[str, Any]]):
+        """
+        Enqueue ``task(report)``; it must return the fields to store on the
+        finished job (at least ``resume_id``) and may call ``report(status)``
+        to publish progress. Raises QueueFull when the queue is at capacity
+        (or shutting down) so the caller can shed load.
+        """
+        with Session(self.engine) as session:
+            session.add(UploadJob(id=job_id, filename=filename, owner_pid=os.getpid()))
+            session.commit()
+        # Under the lock, so no job lands behind stop()'s sentinels
+        with self._submit_lock:
+            refused = None if self._accepting else "Server shutting down."
+            if refused is None:
+                try:
+                    self._queue.put_nowait((job_id, task))
+                except queue.Full:
+                    refused = "Queue full."
+        if refused:
+            self._update(job_id, status="error", error=refused)
+            raise QueueFull()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            job_id, task = item
+            try:
+                result = task(lambda status: self._update(job_id, status=status))
+                self._update(job_id, status="done", **result)
+            except Exception as e:
+                logger.exception("Error in upload job %s", job_id)
+                self._update(job_id, status="error", error=str(e))
+            finally:
+                self._queue.task_done()
+
+    # Lifecycle ---------------------------------------------------------
+    def start(self):
+        # Jobs whose owning process has exited lost their in-memory upload
+        # payload with it; don't leave their clients polling forever.
+        with Session(self.engine) as session:
+            pending = session.exec(select(UploadJob).where(UploadJob.status.not_in(FINAL_STATES))).all()
+            for job in pending:
+                if job.owner_pid and job.owner_pid != os.getpid() and _pid_alive(job.owner_pid):
+                    continue
+                job.status = "error"
+                job.error = "Interrupted by server restart."
+                job.updated_at = datetime.utcnow()
+                session.add(job)
+            session.commit()
+
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"upload-job-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        self._accepting = True
+
+    def stop(self, timeout: float = JOB_STOP_TIMEOUT):
+        """Stop taking jobs, then give the workers up to ``timeout`` seconds to finish the queued ones."""
+        with self._submit_lock:
+            self._accepting = False
+        deadline = time.monotonic() + timeout
+        for _ in self._threads:
+            try:
+                # Behind every queued job, so those still run
+                self._queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                break
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        running = sum(t.is_alive() for t in self._threads)
+        if running:
+            # Daemon threads go down with the process; the next start() marks their jobs interrupted
+            logger.warning("%d upload job workers still busy after %.0fs; exiting anyway", running, timeout)
+        self._threads.clear()
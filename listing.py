@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func as sa_func
+from sqlmodel import Session, select
+
+from models import Resume
+
+# ------------------------------------------------------------------
+# Dashboard listing: keyset pagination on Resume.id over just the columns
+# the table shows, plus a cached total instead of count(*) per request.
+# ------------------------------------------------------------------
+RESUME_COUNT_TTL = float(os.getenv("RESUME_COUNT_TTL", "60"))
+
+LIST_COLUMNS = (Resume.id, Resume.name, Resume.email, Resume.jobTitle, Resume.skills)
+
+
+class CachedCount:
+    """count(*) of resumes, recomputed at most every ``ttl`` seconds and bumped on local inserts."""
+
+    def __init__(self, engine, ttl: float = RESUME_COUNT_TTL):
+        self.engine = engine
+        self.ttl = ttl
+        self._value: Optional[int] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> int:
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires:
+                return self._value
+        with Session(self.engine) as session:
+            value = session.exec(select(sa_func.count(Resume.id))).one()
+        with self._lock:
+            self._value = value
+            self._expires = time.monotonic() + self.ttl
+        return value
+
+    def bump(self, n: int = 1):
+        with self._lock:
+            if self._value is not None:
+                self._value += n
+
+
+def list_resumes(session: Session, page_size: int, after_id: Optional[int] = None,
+                 before_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Newest-first page of resumes. ``after_id`` continues below the last id
+    of the previous page, ``before_id`` goes back above the first id.
+    """
+    query = select(*LIST_COLUMNS)
+    if before_id is not None:
+        rows = session.exec(query.where(Resume.id > before_id).order_by(Resume.id.asc()).limit(page_size + 1)).all()
+        has_newer = len(rows) > page_size
+        rows = list(reversed(rows[:page_size]))
+        has_older = True
+    else:
+        if after_id is not None:
+            query = query.where(Resume.id < after_id)
+        rows = session.exec(query.order_by(Resume.id.desc()).limit(page_size + 1)).all()
+        has_older = len(rows) > page_size
+        rows = rows[:page_size]
+        has_newer = after_id is not None
+
+    return {
+        "resumes": rows,
+        "next_after_id": rows[-1].id if rows and has_older else None,
+        "prev_before_id": rows[0].id if rows and has_newer else None,
+    }
@@ -1,29 +1,63 @@
 import os
-import shutil
-import mimetypes
-from typing import List, Any, Dict, Optional
+import json
+import logging
+import time
+import uuid
+import asyncio
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Any, Dict, Optional, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, File, UploadFile, Request, HTTPException, Query
-from fastapi.responses import HTMLResponse, PlainTextResponse, FileResponse, JSONResponse
+from fastapi import FastAPI, File, UploadFile, Request, HTTPException, Query, Header
+from fastapi.responses import HTMLResponse, PlainTextResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 
-from sqlmodel import SQLModel, Session, select, create_engine
-from sqlalchemy import func as sa_func
+from sqlalchemy import text as sql_text
+from sqlmodel import Session, select
 from starlette.concurrency import run_in_threadpool
-from fpdf import FPDF
+from pydantic import BaseModel
 from dotenv import load_dotenv
+load_dotenv()  # before the local imports below, which read their settings at import time
 import cloudinary
-from cloudinary.uploader import upload as cloudinary_upload
-
-from models import Resume
-from parser import parse_resume_from_path
+from cloudinary.uploader import upload as cloudinary_upload, destroy as cloudinary_destroy
+
+from models import Resume, ResumeText, UploadJob
+from parser import parse_resume_from_bytes, get_nlp, SKILLS, cache_version as parser_cache_version
+from skill_taxonomy import TaxonomyError
+from pdf_text import cache_tag as pdf_text_source
+from parse_pool import submit_parse, shutdown_parse_pool
+from jobs import JobQueue, QueueFull, FINAL_STATES
+from parse_cache import ParseCache
+from cloudinary_queue import DeferredUploader
+from timing import StageTimer
+import metrics
+from database import engine, create_db_and_tables
+from search import ensure_fts, search_resumes
+from listing import CachedCount, list_resumes
+from pdf_export import PdfCache, content_version, export_filename, stream_zip
+from resume_details import DetailsCache, batch_body
+import resume_api
+from skill_index import index_resumes, backfill as backfill_skill_index, find_candidates, split_skills
+import dedup
+import analytics
+from match_index import MatchIndex
+from file_lock import FileLock
+from upload_stream import (
+    UploadRejected, read_upload, read_pdf_upload, read_zip_pdfs, is_pdf, is_zip, as_file,
+    MAX_UPLOAD_BYTES, MAX_BATCH_BYTES,
+)
 
 # ------------------------------------------------------------------
-# Load environment variables
+# Logging & environment variables
 # ------------------------------------------------------------------
-load_dotenv()
+# LOG_LEVEL=DEBUG also logs the extracted resume text (PII), so keep it off in production
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("resume_parser")
+
 CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
 API_KEY = os.getenv("CLOUDINARY_API_KEY")
 API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
@@ -32,19 +66,113 @@ if not all([CLOUD_NAME, API_KEY, API_SECRET]):
     raise RuntimeError("Missing Cloudinary credentials in .env")
 
 cloudinary.config(cloud_name=CLOUD_NAME, api_key=API_KEY, api_secret=API_SECRET, secure=True)
-print(f"✅ Cloudinary configured for '{CLOUD_NAME}'")
+logger.info("Cloudinary configured for '%s'", CLOUD_NAME)
 
 # ------------------------------------------------------------------
 # FastAPI app
 # ------------------------------------------------------------------
-app = FastAPI(title="AI Resume Parser", version="1.4.0")
+# Set once spaCy and the skills taxonomy are loaded; under gunicorn that
+# happens in the master before forking (gunicorn.conf.py)
+models_loaded = threading.Event()
+# Set while this process is between lifespan startup and shutdown
+serving = threading.Event()
+
+def warm_up():
+    """Load what the first upload would otherwise load on demand. Idempotent."""
+    if models_loaded.is_set():
+        return
+    start = time.perf_counter()
+    get_nlp()
+    SKILLS.current()
+    models_loaded.set()
+    logger.info("Models loaded in %.1fs (pid %d)", time.perf_counter() - start, os.getpid())
+
+def _warm_up_in_background():
+    try:
+        warm_up()
+    except Exception:
+        # /ready keeps answering 503, so the load balancer never routes here
+        logger.exception("Model warm-up failed")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not models_loaded.is_set():
+        threading.Thread(target=_warm_up_in_background, name="warm-up", daemon=True).start()
+    job_queue.start()
+    deferred_uploads.start()
+    threading.Thread(target=_run_startup_backfills, name="backfill", daemon=True).start()
+    # Map the match index (and index resumes saved since its last build) before the first /match
+    threading.Thread(target=match_index.refresh, kwargs={"force": True}, name="match-index-refresh", daemon=True).start()
+    serving.set()
+    yield
+    serving.clear()
+    await run_in_threadpool(job_queue.stop)
+    deferred_uploads.stop()
+    cloudinary_executor.shutdown(wait=False)
+    shutdown_parse_pool()
+
+app = FastAPI(title="AI Resume Parser", version="1.4.0", lifespan=lifespan)
+
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "100"))
+# When set, /admin endpoints require a matching X-Admin-Token header
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+EXPORT_MAX_IDS = int(os.getenv("EXPORT_MAX_IDS", "500"))
+EXPORT_BATCH_SIZE = 50
+DETAILS_MAX_IDS = int(os.getenv("DETAILS_MAX_IDS", "100"))
+
+# "inline": upload to Cloudinary concurrently with parsing (default)
+# "deferred": save and render first, upload from a background retry queue
+CLOUDINARY_UPLOAD_MODE = os.getenv("CLOUDINARY_UPLOAD_MODE", "inline")
+cloudinary_executor = ThreadPoolExecutor(max_workers=int(os.getenv("CLOUDINARY_UPLOAD_THREADS", "4")), thread_name_prefix="cloudinary")
 
 # ------------------------------------------------------------------
 # Database setup
 # ------------------------------------------------------------------
-DATABASE_URL = "sqlite:///resumes.db"
-engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
-SQLModel.metadata.create_all(engine)
+create_db_and_tables()
+FTS_ENABLED = ensure_fts(engine)
+resume_count = CachedCount(engine)
+SKILL_INDEX_BACKFILL_ON_START = os.getenv("SKILL_INDEX_BACKFILL_ON_START", "1") == "1"
+DEDUP_BACKFILL_ON_START = os.getenv("DEDUP_BACKFILL_ON_START", "1") == "1"
+ANALYTICS_BACKFILL_ON_START = os.getenv("ANALYTICS_BACKFILL_ON_START", "1") == "1"
+# Every gunicorn worker starts the backfills; whichever takes the lock runs
+# them and the others skip them, so they don't race on primary keys
+BACKFILL_LOCK_DIR = os.getenv("BACKFILL_LOCK_DIR", ".locks")
+
+def _run_locked(name: str, task):
+    lock = FileLock(os.path.join(BACKFILL_LOCK_DIR, f"{name}.lock"))
+    if not lock.acquire():
+        logger.info("%s already running in another process", name)
+        return
+    try:
+        task(engine)
+    except Exception:
+        logger.exception("%s failed", name)
+    finally:
+        lock.release()
+
+def _run_startup_backfills():
+    if SKILL_INDEX_BACKFILL_ON_START:
+        _run_locked("skill-index-backfill", backfill_skill_index)
+    if DEDUP_BACKFILL_ON_START:
+        _run_locked("dedup-backfill", dedup.backfill)
+    if ANALYTICS_BACKFILL_ON_START:
+        _run_locked("analytics-recount", analytics.rebuild_if_stale)
+
+job_queue = JobQueue(engine)
+parse_cache = ParseCache(engine, parser_cache_version())
+# Parses made with an older skills taxonomy are no longer cache hits
+SKILLS.on_reload(lambda taxonomy: parse_cache.set_parser_version(parser_cache_version()))
+pdf_cache = PdfCache()
+details_cache = DetailsCache(engine)
+match_index = MatchIndex(engine)
+# Stored vectors hold canonical skills: re-index them under the new taxonomy
+SKILLS.on_reload(lambda taxonomy: match_index.start_rebuild())
+analytics_cache = analytics.AnalyticsCache(engine)
+# Skill counts are by canonical name; recount them under the new taxonomy
+SKILLS.on_reload(lambda taxonomy: threading.Thread(
+    target=_run_locked, args=("analytics-recount", analytics.rebuild_if_stale), name="analytics-recount", daemon=True).start())
+MATCH_MAX_JD_CHARS = int(os.getenv("MATCH_MAX_JD_CHARS", "20000"))
+JOB_EVENTS_POLL_SECONDS = float(os.getenv("JOB_EVENTS_POLL_SECONDS", "0.5"))
 
 # ------------------------------------------------------------------
 # Static files & Templates
@@ -53,11 +181,23 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 # ------------------------------------------------------------------
-# Helpers
+# Middleware
 # ------------------------------------------------------------------
-def sanitize(text: Optional[str]) -> str:
-    return text.encode("latin-1", "replace").decode("latin-1") if text else "N/A"
+MULTIPART_OVERHEAD = 64 * 1024
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    # Refuse oversized uploads up front, before the multipart body is spooled
+    if request.method == "POST" and (request.url.path.startswith("/upload") or request.url.path == "/api/v1/resumes"):
+        limit = MAX_BATCH_BYTES if request.url.path == "/upload/batch" else MAX_UPLOAD_BYTES
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > limit + MULTIPART_OVERHEAD:
+            return PlainTextResponse("Upload too large.", status_code=413)
+    return await call_next(request)
 
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
 def _get(d: Dict[str, Any], k: str, default=""):
     return d.get(k, default) if isinstance(d, dict) else default
 
@@ -69,6 +209,64 @@ def _get_social(d: Dict[str, Any], k: str):
     soc = _get(d, "socials", {})
     return soc.get(k, "") if isinstance(soc, dict) else ""
 
+def _public_id(client_ip: str, filename: str, digest: str) -> str:
+    # The content hash keeps a re-upload under the same name from overwriting (or,
+    # when it fails to parse, discarding) the asset an earlier row points to
+    filename_root, _ = os.path.splitext(os.path.basename(filename))
+    return f"resumes/{client_ip.replace('.', '_')}_{filename_root}_{digest[:12]}"
+
+def _build_resume(data: Dict[str, Any], secure_url: Optional[str], client_ip: str, public_id: str) -> Resume:
+    return Resume(
+        name=_get(data, "name"),
+        email=_get(data, "email"),
+        phone=_get(data, "phone"),
+        age=_get(data, "age"),
+        city=_get(data, "city"),
+        country=_get(data, "country"),
+        fullAddress=_get(data, "fullAddress"),
+        jobTitle=_get(data, "jobTitle"),
+        profileDescription=_get(data, "profileDescription"),
+        education=_get(data, "education"),
+        yearsOfExp=_get(data, "yearsOfExp"),
+        languages=", ".join(_get_list(data, "languages")),
+        skills=", ".join(_get_list(data, "skills")),
+        expectedSalary=_get(data, "expectedSalary"),
+        educationHistory="\n".join(_get_list(data, "educationHistory")),
+        linkedin=_get_social(data, "linkedin"),
+        github=_get_social(data, "github"),
+        portfolio=_get_social(data, "portfolio"),
+        cv_url=secure_url,
+        cv_download_url=f"{secure_url}?fl_attachment=1" if secure_url else None,
+        uploader_ip=client_ip,
+        public_id=public_id,
+        uploaded_at=datetime.utcnow()
+    )
+
+def _stored_text(parse_stats: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, str]]]:
+    # Extracted text and the extractor versions it was parsed with (fresh parses only)
+    if parse_stats.get("text") is None:
+        return None
+    return parse_stats["text"], parse_stats["versions"]
+
+def _save_resumes(records: List[Resume], texts: Optional[List[Optional[Tuple[str, Dict[str, str]]]]] = None,
+                  digests: Optional[List[str]] = None) -> List[Tuple[int, Optional[int]]]:
+    """Save parsed resumes; returns (id, duplicate_of) per record."""
+    # Rows, their skill index entries, extracted text and fingerprints go in one transaction
+    texts = texts or [None] * len(records)
+    with metrics.DB_COMMIT_SECONDS.time(), Session(engine) as session:
+        session.add_all(records)
+        session.flush()
+        index_resumes(session, records)
+        session.add_all(
+            ResumeText(resume_id=rec.id, text=stored[0], source=pdf_text_source(), versions=json.dumps(stored[1]))
+            for rec, stored in zip(records, texts) if stored is not None
+        )
+        flagged = dedup.register(session, records, [stored and stored[0] for stored in texts], digests)
+        analytics.record(session, records)
+        session.commit()
+        resume_count.bump(len(records))
+        return [(rec.id, flagged[rec.id]) for rec in records]
+
 # ------------------------------------------------------------------
 # Routes
 # ------------------------------------------------------------------
@@ -84,171 +282,571 @@ async def home(request: Request):
 
 # ✅ View All Resumes
 @app.get("/resumes", response_class=HTMLResponse)
-def view_resumes(request: Request, page: int = Query(1, ge=1), page_size: int = Query(5, ge=1, le=50)):
+def view_resumes(request: Request, page_size: int = Query(5, ge=1, le=50),
+                 after_id: Optional[int] = None, before_id: Optional[int] = None):
     with Session(engine) as session:
-        total_count = session.exec(select(sa_func.count(Resume.id))).one()
-        offset = (page - 1) * page_size
-        resumes: List[Resume] = session.exec(select(Resume).order_by(Resume.id.desc()).offset(offset).limit(page_size)).all()
+        listing = list_resumes(session, page_size, after_id=after_id, before_id=before_id)
 
-    total_pages = (total_count + page_size - 1) // page_size
     return templates.TemplateResponse("resumes.html", {
         "request": request,
-        "resumes": resumes,
-        "page": page,
         "page_size": page_size,
-        "total_pages": total_pages,
+        "after_id": after_id,
+        "before_id": before_id,
+        "total_count": resume_count.get(),
+        **listing,
     })
 
+# ✅ Full-text Search (ranked, keyset-paginated)
+@app.get("/resumes/search")
+def search_resumes_api(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None):
+    if not FTS_ENABLED:
+        raise HTTPException(status_code=501, detail="Full-text search requires the SQLite backend.")
+    try:
+        with engine.connect() as conn:
+            return search_resumes(conn, q, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+# ✅ Candidates by Skills (normalized skill index)
+@app.get("/candidates")
+def get_candidates(skills: str = Query(..., min_length=1, description="Comma-separated skills"),
+                   match: str = Query("all", pattern="^(all|any)$"),
+                   limit: int = Query(20, ge=1, le=100), after_id: Optional[int] = None):
+    # Aliases ("js") are looked up as the canonical skill ("javascript")
+    with Session(engine) as session:
+        return find_candidates(session, skills.split(","), match=match, limit=limit, after_id=after_id)
+
+# ✅ Rank Stored Resumes Against a Job Description
+class MatchRequest(BaseModel):
+    job_description: str
+    top_k: int = 10
+
+# What a ranked result shows; full records are one GET /resume/{id}/details away
+MATCH_COLUMNS = (Resume.id, Resume.name, Resume.email, Resume.phone, Resume.jobTitle, Resume.city, Resume.country,
+                 Resume.yearsOfExp, Resume.skills, Resume.cv_url)
+
+@app.post("/match")
+def match_resumes(body: MatchRequest):
+    jd = body.job_description.strip()
+    if not jd:
+        raise HTTPException(status_code=400, detail="job_description is empty.")
+    if len(jd) > MATCH_MAX_JD_CHARS:
+        raise HTTPException(status_code=400, detail=f"job_description is longer than {MATCH_MAX_JD_CHARS} characters.")
+    if not 1 <= body.top_k <= 100:
+        raise HTTPException(status_code=400, detail="top_k must be between 1 and 100.")
+
+    ranked, jd_skills = match_index.search(jd, body.top_k)
+    with Session(engine) as session:
+        rows = {r.id: r for r in session.exec(
+            select(*MATCH_COLUMNS).where(Resume.id.in_([i for i, _ in ranked]))
+        ).all()} if ranked else {}
+    wanted = set(jd_skills)
+    results = []
+    for resume_id, score in ranked:
+        row = rows.get(resume_id)
+        if row is None:
+            continue
+        results.append({
+            "score": score,
+            "matched_skills": [s for s in split_skills(row.skills) if s in wanted],
+            "resume": row._asdict(),
+        })
+    return {"job_skills": jd_skills, "results": results}
+
 # ✅ Upload & Parse Resume
-@app.post("/upload", response_class=HTMLResponse)
-async def upload_resume(request: Request, resume: UploadFile = File(...)):
-    upload_dir = "uploads"
-    os.makedirs(upload_dir, exist_ok=True)
-    local_path = os.path.join(upload_dir, resume.filename)
+def _upload_to_cloudinary(pdf_bytes: bytes, public_id: str) -> str:
+    start = time.perf_counter()
+    result = "error"
+    try:
+        upload_result = cloudinary_upload(as_file(pdf_bytes), public_id=public_id, resource_type="raw", access_mode="public", overwrite=True)
+        result = "ok"
+        return upload_result["secure_url"]
+    finally:
+        metrics.CLOUDINARY_UPLOAD_SECONDS.labels(result).observe(time.perf_counter() - start)
+
+def _discard_asset(public_id: str):
+    # Only assets no saved row references (e.g. the same PDF was saved meanwhile)
+    with Session(engine) as session:
+        if session.exec(select(Resume.id).where(Resume.public_id == public_id).limit(1)).first() is not None:
+            return
+    try:
+        cloudinary_destroy(public_id, resource_type="raw")
+    except Exception as e:
+        logger.warning("Could not remove orphaned Cloudinary asset %s: %s", public_id, e)
 
+def _on_deferred_upload(digest: str, public_id: str, secure_url: str):
+    with Session(engine) as session:
+        rows = session.exec(select(Resume).where(Resume.public_id == public_id, Resume.cv_url == None)).all()  # noqa: E711
+        for row in rows:
+            row.cv_url = secure_url
+            row.cv_download_url = f"{secure_url}?fl_attachment=1"
+            session.add(row)
+        session.commit()
+    parse_cache.update_asset(digest, public_id, secure_url)
+
+deferred_uploads = DeferredUploader(_upload_to_cloudinary, _on_deferred_upload)
+
+def _run_upload_pipeline(pdf_bytes: bytes, digest: str, filename: str, client_ip: str,
+                         report=lambda status: None, timer: Optional[StageTimer] = None) -> Tuple[int, Dict[str, Any], Optional[int]]:
+    timer = timer or StageTimer()
+
+    # Same bytes seen before: reuse the parse and, if it finished, the Cloudinary asset
+    with timer.stage("cache"):
+        cached = parse_cache.get(digest) or {}
+    data = cached.get("data")
+    public_id = cached.get("public_id") or _public_id(client_ip, filename, digest)
+    secure_url = cached.get("cv_url")
+
+    # Cloudinary upload runs alongside the parse, or after the DB save in deferred mode
+    upload_future = None
+    defer_upload = False
+    if not secure_url:
+        defer_upload = CLOUDINARY_UPLOAD_MODE == "deferred"
+        if not defer_upload:
+            report("uploading")
+            upload_future = cloudinary_executor.submit(timer.timed("cloudinary", _upload_to_cloudinary), pdf_bytes, public_id)
+
+    text = None  # only known on a fresh parse; reparse.py fetches it for cache hits
+    try:
+        if data is None:
+            report("parsing")
+            parse_stats: Dict[str, Any] = {}
+            with timer.stage("parse"):
+                data = parse_resume_from_bytes(pdf_bytes, parse_stats)
+            metrics.record_parse(parse_stats)
+            text = _stored_text(parse_stats)
+            if not isinstance(data, dict):
+                data = {}
+            if "error" in data:
+                # Nothing to save (e.g. a scanned PDF); the asset is discarded below
+                raise UploadRejected(data["error"], status_code=422)
+        if upload_future is not None:
+            with timer.stage("cloudinary_wait"):
+                secure_url = upload_future.result()
+    except BaseException:
+        # Don't leave an asset behind for a resume that was never saved
+        if upload_future is not None and not upload_future.cancel():
+            upload_future.add_done_callback(lambda f: f.exception() is None and _discard_asset(public_id))
+        raise
+
+    if not cached or (secure_url and not cached.get("cv_url")):
+        parse_cache.put(digest, data, public_id, secure_url)
+
+    # Save to DB
+    report("saving")
+    with timer.stage("db"):
+        new_id, duplicate_of = _save_resumes([_build_resume(data, secure_url, client_ip, public_id)], [text], [digest])[0]
+    if duplicate_of:
+        logger.info("Resume %s looks like a duplicate of %s", new_id, duplicate_of)
+
+    if defer_upload and not deferred_uploads.submit(digest, pdf_bytes, public_id):
+        # Retry queue is full: fall back to uploading inline
+        with timer.stage("cloudinary"):
+            _on_deferred_upload(digest, public_id, _upload_to_cloudinary(pdf_bytes, public_id))
+
+    metrics.record_upload_stages(timer.finish())
+    return new_id, data, duplicate_of
+
+def _run_upload_job(pdf_bytes: bytes, digest: str, filename: str, client_ip: str, report) -> Dict[str, Any]:
+    timer = StageTimer()
+    new_id, _, _ = _run_upload_pipeline(pdf_bytes, digest, filename, client_ip, report, timer)
+    return {"resume_id": new_id, "timings": json.dumps(timer.timings)}
+
+async def _enqueue_upload(pdf_bytes: bytes, digest: str, filename: str, client_ip: str) -> JSONResponse:
+    job_id = uuid.uuid4().hex
     try:
-        # Save locally
-        with open(local_path, "wb") as buffer:
-            shutil.copyfileobj(resume.file, buffer)
+        await run_in_threadpool(
+            job_queue.submit, job_id, filename,
+            lambda report: _run_upload_job(pdf_bytes, digest, filename, client_ip, report),
+        )
+    except QueueFull:
+        return JSONResponse({"detail": "Too many uploads in progress, retry later."}, status_code=429, headers={"Retry-After": "5"})
+    return JSONResponse({
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events",
+    }, status_code=202)
 
-        # Validate file type
-        mime_type, _ = mimetypes.guess_type(local_path)
-        if mime_type != "application/pdf":
-            os.remove(local_path)
-            return PlainTextResponse("Please upload a valid PDF file.", status_code=400)
+@app.post("/upload", response_class=HTMLResponse)
+async def upload_resume(request: Request, resume: UploadFile = File(...), mode: str = Query("sync", pattern="^(sync|async)$")):
+    try:
+        # Read once into memory; validate by content, not by file name
+        try:
+            pdf_bytes, digest = await read_pdf_upload(resume)
+        except UploadRejected as e:
+            return PlainTextResponse(e.message, status_code=e.status_code)
 
-        # Upload to Cloudinary
         client_ip = request.client.host if request.client else "unknown"
-        filename_root, _ = os.path.splitext(resume.filename)
-        public_id = f"resumes/{client_ip.replace('.', '_')}_{filename_root}"
-
-        upload_result = await run_in_threadpool(cloudinary_upload, local_path, public_id=public_id, resource_type="raw", access_mode="public", overwrite=True)
-        secure_url = upload_result["secure_url"]
-        download_url = f"{secure_url}?fl_attachment=1"
-
-        # Parse resume
-        data = await run_in_threadpool(parse_resume_from_path, local_path)
-        if not isinstance(data, dict):
-            data = {}
-
-        # Save to DB
-        with Session(engine) as session:
-            resume_record = Resume(
-                name=_get(data, "name"),
-                email=_get(data, "email"),
-                phone=_get(data, "phone"),
-                age=_get(data, "age"),
-                city=_get(data, "city"),
-                country=_get(data, "country"),
-                fullAddress=_get(data, "fullAddress"),
-                jobTitle=_get(data, "jobTitle"),
-                profileDescription=_get(data, "profileDescription"),
-                education=_get(data, "education"),
-                yearsOfExp=_get(data, "yearsOfExp"),
-                languages=", ".join(_get_list(data, "languages")),
-                skills=", ".join(_get_list(data, "skills")),
-                expectedSalary=_get(data, "expectedSalary"),
-                educationHistory="\n".join(_get_list(data, "educationHistory")),
-                linkedin=_get_social(data, "linkedin"),
-                github=_get_social(data, "github"),
-                portfolio=_get_social(data, "portfolio"),
-                cv_url=secure_url,
-                cv_download_url=download_url,
-                uploader_ip=client_ip,
-                public_id=public_id,
-                uploaded_at=datetime.utcnow()
-            )
-            session.add(resume_record)
-            session.commit()
-            session.refresh(resume_record)
-            new_id = resume_record.id
-
-        # Cleanup
-        os.remove(local_path)
+
+        # Opt-in async mode: hand off to the job queue and return at once
+        if mode == "async":
+            return await _enqueue_upload(pdf_bytes, digest, resume.filename, client_ip)
+
+        timer = StageTimer()
+        try:
+            new_id, data, duplicate_of = await run_in_threadpool(_run_upload_pipeline, pdf_bytes, digest, resume.filename, client_ip, timer=timer)
+        except UploadRejected as e:
+            return PlainTextResponse(e.message, status_code=e.status_code)
 
         return templates.TemplateResponse("index.html", {
             "request": request,
             "parsed": data,
-            "last_resume_id": new_id
-        })
+            "last_resume_id": new_id,
+            "duplicate_of": duplicate_of,
+            "timings": timer.timings,
+        }, headers={"Server-Timing": timer.server_timing()})
 
     except Exception as e:
-        if os.path.exists(local_path):
-            os.remove(local_path)
+        logger.exception("Upload failed")
         return PlainTextResponse(f"Internal Server Error: {str(e)}", status_code=500)
 
+# ✅ Upload Job Status (async mode)
+def _job_payload(job: UploadJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "filename": job.filename,
+        "status": job.status,
+        "resume_id": job.resume_id,
+        "error": job.error,
+        "timings": json.loads(job.timings) if job.timings else None,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return _job_payload(job)
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job(request: Request, job_id: str):
+    if not await run_in_threadpool(job_queue.get, job_id):
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    async def _events():
+        last = None
+        while not await request.is_disconnected():
+            job = await run_in_threadpool(job_queue.get, job_id)
+            payload = _job_payload(job)
+            if payload["status"] != last:
+                last = payload["status"]
+                yield f"event: {last}\ndata: {json.dumps(payload)}\n\n"
+            if last in FINAL_STATES:
+                return
+            await asyncio.sleep(JOB_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+# ✅ Batch Upload & Parse (many PDFs or a .zip of PDFs)
+BATCH_PRIVATE_KEYS = ("public_id", "secure_url", "pdf_bytes", "digest", "text")
+
+async def _read_batch_files(files: List[UploadFile]) -> List[Tuple[str, bytes, str]]:
+    collected: List[Tuple[str, bytes, str]] = []
+    total = 0
+    for f in files:
+        data, digest = await read_upload(f, max_bytes=MAX_BATCH_BYTES - total)
+        total += len(data)
+        if is_zip(data):
+            # Decompressed members count against what is left of the batch budget
+            members = await run_in_threadpool(read_zip_pdfs, data, BATCH_MAX_FILES - len(collected), MAX_BATCH_BYTES - total)
+            total += sum(len(content) for _, content, _ in members)
+            collected.extend(members)
+        elif is_pdf(data):
+            collected.append((os.path.basename(f.filename or "resume.pdf"), data, digest))
+        if len(collected) > BATCH_MAX_FILES:
+            raise UploadRejected(f"At most {BATCH_MAX_FILES} PDFs per batch.", status_code=413)
+    return collected
+
+@app.post("/upload/batch")
+async def upload_resume_batch(request: Request, resumes: List[UploadFile] = File(...)):
+    try:
+        files = await _read_batch_files(resumes)
+    except UploadRejected as e:
+        return PlainTextResponse(e.message, status_code=e.status_code)
+    except zipfile.BadZipFile:
+        return PlainTextResponse("Could not read the .zip archive.", status_code=400)
+    if not files:
+        return PlainTextResponse("Please upload PDF files or a .zip of PDFs.", status_code=400)
+
+    client_ip = request.client.host if request.client else "unknown"
+
+    async def _process(filename: str, pdf_bytes: bytes, digest: str) -> Dict[str, Any]:
+        timer = StageTimer()
+        upload = None
+        try:
+            cached = await run_in_threadpool(parse_cache.get, digest) or {}
+            public_id = cached.get("public_id") or _public_id(client_ip, filename, digest)
+            secure_url = cached.get("cv_url")
+            if not secure_url and CLOUDINARY_UPLOAD_MODE != "deferred":
+                upload = asyncio.wrap_future(cloudinary_executor.submit(timer.timed("cloudinary", _upload_to_cloudinary), pdf_bytes, public_id))
+
+            data = cached.get("data")
+            text = None
+            if data is None:
+                with timer.stage("parse"):
+                    data, parse_stats = await asyncio.wrap_future(submit_parse(pdf_bytes, SKILLS.current().fingerprint))
+                metrics.record_parse(parse_stats)
+                text = _stored_text(parse_stats)
+                if not isinstance(data, dict) or "error" in data:
+                    if upload is not None:
+                        upload.add_done_callback(lambda f: not f.cancelled() and f.exception() is None and _discard_asset(public_id))
+                    return {"file": filename, "status": "error", "error": _get(data, "error", "Parse failed."), "timings": timer.finish()}
+            if upload is not None:
+                secure_url = await upload
+            if not cached or (secure_url and not cached.get("cv_url")):
+                await run_in_threadpool(parse_cache.put, digest, data, public_id, secure_url)
+            return {"file": filename, "status": "parsed", "cached": bool(cached), "data": data, "timings": timer.finish(),
+                    "public_id": public_id, "secure_url": secure_url, "pdf_bytes": pdf_bytes, "digest": digest, "text": text}
+        except Exception as e:
+            if upload is not None and not upload.cancel():
+                upload.add_done_callback(lambda f: not f.cancelled() and f.exception() is None and _discard_asset(public_id))
+            return {"file": filename, "status": "error", "error": str(e), "timings": timer.finish()}
+
+    async def _stream():
+        tasks = [asyncio.ensure_future(_process(name, pdf_bytes, digest)) for name, pdf_bytes, digest in files]
+        parsed: List[Dict[str, Any]] = []
+        try:
+            # Per-file results, in completion order
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                metrics.record_upload_stages(result["timings"])
+                if result["status"] == "parsed":
+                    parsed.append(result)
+                yield json.dumps({k: v for k, v in result.items() if k not in BATCH_PRIVATE_KEYS}) + "\n"
+
+            # One transaction for the whole batch
+            records = [_build_resume(r["data"], r["secure_url"], client_ip, r["public_id"]) for r in parsed]
+            saved = await run_in_threadpool(_save_resumes, records, [r["text"] for r in parsed], [r["digest"] for r in parsed]) if parsed else []
+            for r in parsed:
+                if not r["secure_url"] and not deferred_uploads.submit(r["digest"], r["pdf_bytes"], r["public_id"]):
+                    url = await run_in_threadpool(_upload_to_cloudinary, r["pdf_bytes"], r["public_id"])
+                    await run_in_threadpool(_on_deferred_upload, r["digest"], r["public_id"], url)
+            yield json.dumps({
+                "status": "done",
+                "total": len(files),
+                "saved": [{"file": r["file"], "id": i, "duplicate_of": dup} for r, (i, dup) in zip(parsed, saved)],
+                "failed": len(files) - len(parsed),
+            }) + "\n"
+        finally:
+            for t in tasks:
+                t.cancel()
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+# ✅ Dashboard Aggregates (top skills, locations, job titles, uploads per day)
+@app.get("/analytics")
+def get_analytics(top: int = Query(20, ge=1, le=200), days: int = Query(30, ge=1, le=366)):
+    return analytics_cache.get(top, days)
+
+# ✅ Parse Cache Stats
+@app.get("/cache/stats")
+def get_cache_stats():
+    return {**parse_cache.snapshot(), "pdf_export": pdf_cache.stats(), "details": details_cache.stats(),
+            "deferred_uploads": deferred_uploads.stats()}
+
+# ✅ Readiness (health check): 503 until this worker has loaded its models and can reach the database
+@app.get("/ready")
+def get_ready():
+    checks = {"serving": serving.is_set(), "models": models_loaded.is_set(), "database": True}
+    try:
+        with engine.connect() as conn:
+            conn.execute(sql_text("SELECT 1"))
+    except Exception as e:
+        logger.warning("Readiness check: database unreachable: %s", e)
+        checks["database"] = False
+    ready = all(checks.values())
+    return JSONResponse({"ready": ready, "pid": os.getpid(), **checks}, status_code=200 if ready else 503)
+
+# ✅ Prometheus Metrics
+@app.get("/metrics")
+def get_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
+# ✅ Reload the Skills Taxonomy (skills_db.txt) without a restart
+@app.post("/admin/skills/reload")
+def reload_skills(x_admin_token: Optional[str] = Header(None)):
+    if ADMIN_TOKEN and x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+    try:
+        taxonomy = SKILLS.reload()
+    except (OSError, TaxonomyError) as e:
+        raise HTTPException(status_code=422, detail=f"Skills taxonomy not reloaded: {e}")
+    # Parse workers switch over on their next parse
+    return {
+        "version": taxonomy.fingerprint,
+        "skills": len(taxonomy.skills),
+        "aliases": len(taxonomy.aliases),
+        "categories": sorted(set(taxonomy.categories.values())),
+    }
+
 # ✅ API for Resume Details (for modal)
+def _json_response(etag: str, body: bytes) -> Response:
+    return Response(content=body, media_type="application/json", headers={
+        "ETag": f'"{etag}"',
+        "Cache-Control": "private, no-cache",
+    })
+
 @app.get("/resume/{resume_id}/details")
-async def get_resume_details(resume_id: int):
+def get_resume_details(resume_id: int, request: Request):
+    cached = details_cache.get(resume_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Resume not found.")
+    etag, body = cached
+    if f'"{etag}"' in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": f'"{etag}"'})
+    return _json_response(etag, body)
+
+# ✅ Batch Resume Details (dashboard prefetch)
+@app.get("/resumes/details")
+def get_resumes_details(request: Request, ids: str = Query(..., min_length=1, description="Comma-separated resume ids")):
+    try:
+        wanted = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers.")
+    if len(wanted) > DETAILS_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {DETAILS_MAX_IDS} ids per request.")
+    etag, body = batch_body(wanted, details_cache.get_many(wanted))
+    if f'"{etag}"' in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": f'"{etag}"'})
+    return _json_response(etag, body)
+
+# ✅ Duplicates of a Resume (same email / phone / file, or near-identical text)
+@app.get("/resume/{resume_id}/duplicates")
+def get_resume_duplicates(resume_id: int):
     with Session(engine) as session:
-        resume = session.get(Resume, resume_id)
-    if not resume:
+        found = dedup.find_duplicates(session, resume_id)
+    if found is None:
         raise HTTPException(status_code=404, detail="Resume not found.")
-
-    return {
-        "name": resume.name,
-        "email": resume.email,
-        "phone": resume.phone,
-        "jobTitle": resume.jobTitle,
-        "age": resume.age,
-        "fullAddress": resume.fullAddress,
-        "city": resume.city,
-        "country": resume.country,
-        "languages": resume.languages,
-        "skills": resume.skills,
-        "expectedSalary": resume.expectedSalary,
-        "education": resume.education,
-        "yearsOfExp": resume.yearsOfExp,
-        "educationHistory": resume.educationHistory,
-        "linkedin": resume.linkedin,
-        "github": resume.github,
-        "portfolio": resume.portfolio,
-    }
+    return found
 
 # ✅ Download Parsed Resume by ID
+def _pdf_response(etag: str, data: bytes, filename: str) -> Response:
+    return Response(content=data, media_type="application/pdf", headers={
+        "ETag": f'"{etag}"',
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    })
+
 @app.get("/resume/{resume_id}/download")
-async def download_parsed_pdf_by_id(resume_id: int):
+def download_parsed_pdf_by_id(resume_id: int, request: Request):
     with Session(engine) as session:
         resume = session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found.")
-    return generate_pdf(resume)
-
-# ✅ PDF Generator
-def generate_pdf(resume: Resume):
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-
-    pdf.cell(200, 10, txt="AI Resume Parser Result", ln=True, align="C")
-    pdf.ln(10)
-
-    fields = [
-        f"Name: {resume.name}",
-        f"Email: {resume.email}",
-        f"Phone: {resume.phone}",
-        f"Job Title: {resume.jobTitle}",
-        f"Age: {resume.age or 'N/A'}",
-        f"Location: {resume.fullAddress or 'N/A'}",
-        f"Languages: {resume.languages or 'N/A'}",
-        f"Skills: {resume.skills or 'N/A'}",
-        f"Expected Salary: {resume.expectedSalary or 'N/A'}",
-        f"Education: {resume.education or 'N/A'}",
-        f"Years of Experience: {resume.yearsOfExp or 'N/A'}",
-        f"LinkedIn: {resume.linkedin or 'N/A'}",
-        f"GitHub: {resume.github or 'N/A'}",
-        f"Portfolio: {resume.portfolio or 'N/A'}",
-    ]
-
-    for field in fields:
-        pdf.multi_cell(0, 10, sanitize(field))
-
-    pdf.ln(5)
-    pdf.set_font("Arial", "B", 12)
-    pdf.cell(200, 10, txt="Education History", ln=True)
-    pdf.set_font("Arial", size=12)
-    pdf.multi_cell(0, 10, sanitize(resume.educationHistory or "N/A"))
-
-    output_path = "output_resume.pdf"
-    pdf.output(output_path)
-    return FileResponse(path=output_path, filename="parsed_resume.pdf", media_type="application/pdf")
+
+    # The ETag is the content version, so a revalidation costs one row read
+    etag = content_version(resume)
+    if f'"{etag}"' in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": f'"{etag}"'})
+    etag, data = pdf_cache.get(resume)
+    return _pdf_response(etag, data, "parsed_resume.pdf")
+
+# ✅ Bulk Export (zip of parsed-resume PDFs, streamed)
+class ExportRequest(BaseModel):
+    ids: List[int]
+
+@app.post("/resumes/export")
+def export_resumes(body: ExportRequest):
+    ids = list(dict.fromkeys(body.ids))
+    if not ids:
+        raise HTTPException(status_code=400, detail="No resume ids given.")
+    if len(ids) > EXPORT_MAX_IDS:
+        raise HTTPException(status_code=413, detail=f"At most {EXPORT_MAX_IDS} resumes per export.")
+    with Session(engine) as session:
+        found = set(session.exec(select(Resume.id).where(Resume.id.in_(ids))).all())
+    if not found:
+        raise HTTPException(status_code=404, detail="None of the requested resumes exist.")
+    ids = [i for i in ids if i in found]
+
+    def entries():
+        # Load rows a batch at a time; each PDF comes from the cache or is rendered once
+        for start in range(0, len(ids), EXPORT_BATCH_SIZE):
+            chunk = ids[start:start + EXPORT_BATCH_SIZE]
+            with Session(engine) as session:
+                rows = {r.id: r for r in session.exec(select(Resume).where(Resume.id.in_(chunk))).all()}
+            for resume_id in chunk:
+                resume = rows.get(resume_id)
+                if resume is not None:
+                    yield export_filename(resume), pdf_cache.get(resume)[1]
+
+    missing = [i for i in body.ids if i not in found]
+    headers = {"Content-Disposition": 'attachment; filename="resumes.zip"'}
+    if missing:
+        headers["X-Missing-Ids"] = ",".join(str(i) for i in dict.fromkeys(missing))
+    return StreamingResponse(stream_zip(entries()), media_type="application/zip", headers=headers)
+
+# ------------------------------------------------------------------
+# JSON API (v1): no templates, orjson bodies, ?fields= sparse fieldsets
+# ------------------------------------------------------------------
+def _api_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    try:
+        return resume_api.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# ✅ Upload and Parse (201 with the saved record, or 202 with a job in async mode)
+@app.post("/api/v1/resumes", status_code=201)
+async def api_upload_resume(request: Request, resume: UploadFile = File(...), fields: Optional[str] = None,
+                            mode: str = Query("sync", pattern="^(sync|async)$")):
+    wanted = _api_fields(fields)
+    try:
+        pdf_bytes, digest = await read_pdf_upload(resume)
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    client_ip = request.client.host if request.client else "unknown"
+    if mode == "async":
+        return await _enqueue_upload(pdf_bytes, digest, resume.filename, client_ip)
+
+    timer = StageTimer()
+    try:
+        new_id, _, duplicate_of = await run_in_threadpool(_run_upload_pipeline, pdf_bytes, digest, resume.filename, client_ip, timer=timer)
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    with Session(engine) as session:
+        _, record = resume_api.get_one(session, new_id, wanted)
+    return Response(
+        content=b'{"resume":' + record + b',"duplicate_of":' + (b"%d" % duplicate_of if duplicate_of else b"null") + b"}",
+        status_code=201, media_type="application/json",
+        headers={"Location": f"/api/v1/resumes/{new_id}", "Server-Timing": timer.server_timing()},
+    )
+
+# ✅ List Resumes (newest first, keyset-paginated, compressed)
+@app.get("/api/v1/resumes")
+def api_list_resumes(request: Request, fields: Optional[str] = None, after_id: Optional[int] = None,
+                     limit: int = Query(50, ge=1, le=resume_api.API_LIST_MAX)):
+    wanted = _api_fields(fields)
+    with Session(engine) as session:
+        body = resume_api.list_page(session, wanted, limit, after_id)
+    body, encoding = resume_api.compress(body, resume_api.negotiate_encoding(request.headers.get("accept-encoding")))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# ✅ Export All Resumes (NDJSON, streamed in id order)
+@app.get("/api/v1/resumes/export")
+def api_export_resumes(request: Request, fields: Optional[str] = None):
+    wanted = _api_fields(fields)
+    encoding = resume_api.negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding", "Content-Disposition": 'attachment; filename="resumes.ndjson"'}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(resume_api.compress_stream(resume_api.export_lines(engine, wanted), encoding),
+                             media_type="application/x-ndjson", headers=headers)
+
+# ✅ One Resume
+@app.get("/api/v1/resumes/{resume_id}")
+def api_get_resume(resume_id: int, request: Request, fields: Optional[str] = None):
+    wanted = _api_fields(fields)
+    with Session(engine) as session:
+        found = resume_api.get_one(session, resume_id, wanted)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Resume not found.")
+    etag, body = found
+    if f'"{etag}"' in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": f'"{etag}"'})
+    return _json_response(etag, body)
@@ -0,0 +1,377 @@
+import os
+import re
+import json
+import math
+import time
+import shutil
+import logging
+import argparse
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from file_lock import FileLock
+from models import Resume
+from parser import SKILLS, STOPWORDS
+from skill_index import split_skills
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# Job-description matching. Each resume is a sparse TF-IDF vector over its
+# canonical skills ("s:python") and the words of its jobTitle and education
+# ("w:engineer"). Vectors are stored column-wise (one postings run per term,
+# like a CSC matrix) in .npy files under MATCH_INDEX_DIR that every worker
+# memory-maps, so the pages are shared. Resumes saved after the last build
+# go into a small in-memory delta segment; once it passes MATCH_DELTA_MAX
+# rows the index is rebuilt in the background and swapped in. Rows that
+# change in place (reparse.py, a skills taxonomy reload) are only picked
+# up by a rebuild, which those trigger.
+# ------------------------------------------------------------------
+MATCH_INDEX_DIR = os.getenv("MATCH_INDEX_DIR", "match_index")
+MATCH_DELTA_MAX = int(os.getenv("MATCH_DELTA_MAX", "5000"))
+MATCH_REFRESH_SECONDS = float(os.getenv("MATCH_REFRESH_SECONDS", "1"))
+MATCH_SKILL_WEIGHT = float(os.getenv("MATCH_SKILL_WEIGHT", "2.0"))  # a skill counts as much as two title words
+
+_BUILD_BATCH = 5000
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*")
+_COLUMNS = (Resume.id, Resume.skills, Resume.jobTitle, Resume.education, Resume.educationHistory)
+
+
+def _words(text: str) -> Iterable[str]:
+    return (w for w in _WORD_RE.findall(text.lower()) if len(w) > 1 and w not in STOPWORDS)
+
+
+def resume_terms(skills: Optional[str], *texts: Optional[str]) -> Dict[str, float]:
+    """Term frequencies of one resume: skills weigh MATCH_SKILL_WEIGHT, words 1 + log(count)."""
+    terms = {f"s:{s}": MATCH_SKILL_WEIGHT for s in split_skills(skills)}
+    counts: Dict[str, int] = {}
+    for word in _words(" ".join(t for t in texts if t)):
+        counts[word] = counts.get(word, 0) + 1
+    for word, n in counts.items():
+        terms[f"w:{word}"] = 1.0 + math.log(n)
+    return terms
+
+
+def query_terms(job_description: str) -> Tuple[Dict[str, float], List[str]]:
+    """-> (term frequencies, skills found) of a job description."""
+    skills = SKILLS.current().match(job_description)
+    terms = {f"s:{s}": MATCH_SKILL_WEIGHT for s in skills}
+    counts: Dict[str, int] = {}
+    for word in _words(job_description):
+        counts[word] = counts.get(word, 0) + 1
+    for word, n in counts.items():
+        terms[f"w:{word}"] = 1.0 + math.log(n)
+    return terms, skills
+
+
+def _idf(df: np.ndarray, n_docs: int) -> np.ndarray:
+    return (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+
+# ------------------------------------------------------------------
+# Segments
+# ------------------------------------------------------------------
+class _Segment:
+    """
+    Term-major postings of a set of resumes: the rows and weights of term t
+    are ``rows[indptr[t]:indptr[t + 1]]`` / ``weights[...]``. ``norms`` are the
+    vector lengths computed with the idf at build time.
+    """
+
+    def __init__(self, terms: Dict[str, int], df, indptr, rows, weights, doc_ids, norms, name: str = ""):
+        self.terms = terms
+        self.df = df
+        self.indptr = indptr
+        self.rows = rows
+        self.weights = weights
+        self.doc_ids = doc_ids
+        self.norms = norms
+        self.name = name
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.doc_ids)
+
+    @property
+    def max_id(self) -> int:
+        return int(self.doc_ids[-1]) if len(self.doc_ids) else 0
+
+    def df_of(self, term: str) -> int:
+        t = self.terms.get(term)
+        return 0 if t is None else int(self.df[t])
+
+    def scores(self, query: Dict[str, float]) -> np.ndarray:
+        """Dot product of every row with the (idf-weighted) query, divided by the row norm."""
+        runs, weights = [], []
+        for term, q in query.items():
+            t = self.terms.get(term)
+            if t is None:
+                continue
+            lo, hi = int(self.indptr[t]), int(self.indptr[t + 1])
+            runs.append(self.rows[lo:hi])
+            weights.append(self.weights[lo:hi] * np.float32(q))
+        if not runs:
+            return np.zeros(self.n_docs, dtype=np.float32)
+        dots = np.bincount(np.concatenate(runs), weights=np.concatenate(weights), minlength=self.n_docs)
+        return (dots / self.norms).astype(np.float32)
+
+
+def _empty_segment() -> _Segment:
+    return _Segment({}, np.zeros(0, np.int64), np.zeros(1, np.int64), np.zeros(0, np.int32),
+                    np.zeros(0, np.float32), np.zeros(0, np.int64), np.zeros(0, np.float32))
+
+
+class _Builder:
+    """Accumulates resumes as (term, row, tf) triples, then sorts them into a _Segment."""
+
+    def __init__(self):
+        self.terms: Dict[str, int] = {}
+        self.term_col = array("i")
+        self.row_col = array("i")
+        self.tf_col = array("f")
+        self.doc_ids = array("q")
+
+    def add(self, resume_id: int, terms: Dict[str, float]):
+        row = len(self.doc_ids)
+        self.doc_ids.append(resume_id)
+        for term, tf in terms.items():
+            self.term_col.append(self.terms.setdefault(term, len(self.terms)))
+            self.row_col.append(row)
+            self.tf_col.append(tf)
+
+    def add_rows(self, rows):
+        for row in rows:
+            self.add(row.id, resume_terms(row.skills, row.jobTitle, row.education, row.educationHistory))
+
+    def build(self, idf_of=None) -> _Segment:
+        """``idf_of(df)`` -> idf per term; defaults to this builder's own document frequencies."""
+        n_terms = len(self.terms)
+        # Copies, so the arrays can keep growing (a live buffer view would block append)
+        term_col = np.array(self.term_col, dtype=np.int32)
+        row_col = np.array(self.row_col, dtype=np.int32)
+        tf_col = np.array(self.tf_col, dtype=np.float32)
+        doc_ids = np.array(self.doc_ids, dtype=np.int64)
+
+        df = np.bincount(term_col, minlength=n_terms).astype(np.int64)
+        idf = idf_of(df) if idf_of else _idf(df, len(doc_ids))
+        # Rows stay ascending within each term: the sort is stable and triples were added in row order
+        order = np.argsort(term_col, kind="stable")
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+        weighted = tf_col * idf[term_col]
+        norms = np.sqrt(np.bincount(row_col, weights=weighted * weighted, minlength=len(doc_ids))).astype(np.float32)
+        norms[norms == 0] = 1.0
+        return _Segment(dict(self.terms), df, indptr, row_col[order], tf_col[order], doc_ids, norms)
+
+
+_ARRAYS = ("df", "indptr", "rows", "weights", "doc_ids", "norms")
+
+
+def _write_segment(root: str, segment: _Segment) -> str:
+    name = f"seg-{time.time_ns()}"
+    tmp = os.path.join(root, f".{name}.tmp")
+    os.makedirs(tmp)
+    for key in _ARRAYS:
+        np.save(os.path.join(tmp, f"{key}.npy"), getattr(segment, key))
+    terms = sorted(segment.terms, key=segment.terms.get)
+    with open(os.path.join(tmp, "terms.json"), "w", encoding="utf-8") as f:
+        json.dump(terms, f)
+    os.rename(tmp, os.path.join(root, name))
+    # CURRENT names the live segment; replacing it is the atomic switch for every process
+    pointer = os.path.join(root, f".CURRENT.{os.getpid()}")
+    with open(pointer, "w") as f:
+        f.write(name)
+    os.replace(pointer, os.path.join(root, "CURRENT"))
+    return name
+
+
+def _load_segment(root: str, name: str) -> _Segment:
+    path = os.path.join(root, name)
+    with open(os.path.join(path, "terms.json"), encoding="utf-8") as f:
+        terms = {term: i for i, term in enumerate(json.load(f))}
+    arrays = {key: np.load(os.path.join(path, f"{key}.npy"), mmap_mode="r") for key in _ARRAYS}
+    return _Segment(terms, name=name, **arrays)
+
+
+def _current_name(root: str) -> Optional[str]:
+    try:
+        with open(os.path.join(root, "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _prune(root: str, keep: Iterable[str]):
+    # Processes still mapping an older segment keep their open mappings after the unlink
+    keep = set(keep)
+    for entry in os.listdir(root):
+        if entry.startswith("seg-") and entry not in keep:
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+
+
+def build(engine, root: str = MATCH_INDEX_DIR) -> _Segment:
+    """Index every stored resume into a new on-disk segment and make it current."""
+    os.makedirs(root, exist_ok=True)
+    previous = _current_name(root)
+    builder = _Builder()
+    last_id = 0
+    while True:
+        with Session(engine) as session:
+            rows = session.exec(select(*_COLUMNS).where(Resume.id > last_id).order_by(Resume.id).limit(_BUILD_BATCH)).all()
+        if not rows:
+            break
+        builder.add_rows(rows)
+        last_id = rows[-1].id
+    name = _write_segment(root, builder.build())
+    _prune(root, [name, previous])
+    return _load_segment(root, name)
+
+
+def _rebuild_lock(root: str) -> FileLock:
+    # One rebuild at a time across processes
+    return FileLock(os.path.join(root, ".rebuild.lock"))
+
+
+def rebuild(engine, root: str = MATCH_INDEX_DIR) -> _Segment:
+    """build() under the rebuild lock, after any rebuild already in progress (which may predate the caller's writes)."""
+    os.makedirs(root, exist_ok=True)
+    lock = _rebuild_lock(root)
+    lock.acquire(blocking=True)
+    try:
+        return build(engine, root)
+    finally:
+        lock.release()
+
+
+# ------------------------------------------------------------------
+# Per-process view
+# ------------------------------------------------------------------
+class MatchIndex:
+    """
+    The memory-mapped base segment plus a delta of resumes saved since it
+    was built. ``refresh()`` (throttled to MATCH_REFRESH_SECONDS, called by
+    ``search``) picks up a new base written by any process and appends
+    newer rows to the delta with one ``id > last`` query. Searches read an
+    immutable (base, delta) pair, so they never wait on a refresh.
+    """
+
+    def __init__(self, engine, root: str = MATCH_INDEX_DIR, delta_max: int = MATCH_DELTA_MAX,
+                 refresh_seconds: float = MATCH_REFRESH_SECONDS):
+        self.engine = engine
+        self.root = root
+        self.delta_max = delta_max
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._rebuilding = threading.Event()
+        self._base = _empty_segment()
+        self._delta_builder = _Builder()
+        self._view: Tuple[_Segment, _Segment] = (self._base, _empty_segment())
+        self._next_refresh = 0.0
+
+    def refresh(self, force: bool = False):
+        if not force and time.monotonic() < self._next_refresh:
+            return
+        if not self._lock.acquire(blocking=force):
+            return
+        try:
+            self._next_refresh = time.monotonic() + self.refresh_seconds
+            changed = False
+            name = _current_name(self.root)
+            if name and name != self._base.name:
+                try:
+                    self._base = _load_segment(self.root, name)
+                except FileNotFoundError:
+                    # Pruned by a newer rebuild between reading CURRENT and loading; next refresh gets it
+                    return
+                self._delta_builder = _Builder()
+                changed = True
+
+            last_id = self._delta_builder.doc_ids[-1] if self._delta_builder.doc_ids else self._base.max_id
+            with Session(self.engine) as session:
+                rows = session.exec(select(*_COLUMNS).where(Resume.id > last_id).order_by(Resume.id)).all()
+            if rows:
+                self._delta_builder.add_rows(rows)
+                changed = True
+            if changed:
+                self._view = (self._base, self._build_delta())
+            if len(self._delta_builder.doc_ids) > self.delta_max:
+                self.start_rebuild()
+        finally:
+            self._lock.release()
+
+    def _build_delta(self) -> _Segment:
+        base = self._base
+        n_docs = base.n_docs + len(self._delta_builder.doc_ids)
+        terms = sorted(self._delta_builder.terms, key=self._delta_builder.terms.get)
+        base_df = np.array([base.df_of(t) for t in terms], dtype=np.int64)
+        return self._delta_builder.build(lambda df: _idf(df + base_df, n_docs))
+
+    def start_rebuild(self):
+        """Rebuild the base segment in the background, unless some process already is."""
+        if self._rebuilding.is_set():
+            return
+        os.makedirs(self.root, exist_ok=True)
+        lock = _rebuild_lock(self.root)
+        if not lock.acquire():
+            return
+        self._rebuilding.set()
+
+        def run():
+            try:
+                started = time.perf_counter()
+                segment = build(self.engine, self.root)
+                logger.info("Match index rebuilt: %d resumes, %d terms in %.1fs",
+                            segment.n_docs, len(segment.terms), time.perf_counter() - started)
+            except Exception:
+                logger.exception("Match index rebuild failed")
+            finally:
+                lock.release()
+                self._rebuilding.clear()
+            self.refresh(force=True)
+
+        threading.Thread(target=run, name="match-index-rebuild", daemon=True).start()
+
+    def search(self, job_description: str, top_k: int = 10) -> Tuple[List[Tuple[int, float]], List[str]]:
+        """-> ([(resume_id, score)] best first, skills found in the job description)."""
+        self.refresh()
+        base, delta = self._view
+        tf, skills = query_terms(job_description)
+        n_docs = base.n_docs + delta.n_docs
+        if not tf or not n_docs:
+            return [], skills
+
+        terms = list(tf)
+        df = np.array([base.df_of(t) + delta.df_of(t) for t in terms], dtype=np.int64)
+        idf = _idf(df, n_docs)
+        weighted = np.array([tf[t] for t in terms], dtype=np.float32) * idf
+        # Postings hold raw tf, so each query weight carries the document's idf factor too
+        query = dict(zip(terms, (weighted * idf).tolist()))
+        scores = np.concatenate([base.scores(query), delta.scores(query)]) / max(float(np.linalg.norm(weighted)), 1e-9)
+        ids = np.concatenate([base.doc_ids, delta.doc_ids])
+        k = min(top_k, n_docs)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), round(float(scores[i]), 4)) for i in top if scores[i] > 0], skills
+
+    def stats(self):
+        base, delta = self._view
+        return {"base_resumes": base.n_docs, "delta_resumes": delta.n_docs, "terms": len(base.terms),
+                "segment": base.name or None, "rebuilding": self._rebuilding.is_set()}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Rebuild the job-description match index from the database.")
+    ap.add_argument("--database-url", default=None, help="defaults to $DATABASE_URL")
+    ap.add_argument("--dir", default=MATCH_INDEX_DIR)
+    args = ap.parse_args()
+
+    from database import DATABASE_URL, make_engine, create_db_and_tables
+    engine = make_engine(args.database_url or DATABASE_URL)
+    create_db_and_tables(engine)
+    started = time.perf_counter()
+    segment = build(engine, args.dir)
+    print(f"Indexed {segment.n_docs} resumes ({len(segment.terms)} terms) in {time.perf_counter() - started:.1f}s.")
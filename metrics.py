@@ -0,0 +1,65 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+# ------------------------------------------------------------------
+# Prometheus metrics, served on GET /metrics.
+# With several server processes, set PROMETHEUS_MULTIPROC_DIR to a shared
+# empty directory so every worker's samples are aggregated.
+# ------------------------------------------------------------------
+# Extractors run in microseconds to milliseconds, PDF extraction and
+# uploads in tens of milliseconds to seconds.
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PARSE_STAGE_SECONDS = Histogram(
+    "resume_parse_stage_seconds", "Time spent in each parser stage (pdf extraction and each extractor).",
+    ["stage"], buckets=STAGE_BUCKETS,
+)
+PARSES = Counter(
+    "resume_parses", "Parsed PDFs by outcome (ok, image_only, empty_text, error).", ["outcome"],
+)
+PARSED_CHARS = Histogram(
+    "resume_parse_text_chars", "Characters of text extracted per PDF.",
+    buckets=(500, 1000, 2500, 5000, 10_000, 25_000, 50_000, 100_000),
+)
+UPLOAD_STAGE_SECONDS = Histogram(
+    "resume_upload_stage_seconds", "Per-request upload pipeline stages (cache, parse, cloudinary, db, total).",
+    ["stage"], buckets=STAGE_BUCKETS,
+)
+CLOUDINARY_UPLOAD_SECONDS = Histogram(
+    "resume_cloudinary_upload_seconds", "Cloudinary upload calls, inline or from the deferred queue.",
+    ["result"], buckets=STAGE_BUCKETS,
+)
+DB_COMMIT_SECONDS = Histogram(
+    "resume_db_commit_seconds", "Saving resumes and their skill index rows (one transaction).",
+    buckets=STAGE_BUCKETS,
+)
+
+
+def record_parse(stats: Optional[Dict[str, Any]]):
+    """Feed the stats dict filled in by parser.parse_resume_from_path."""
+    if not stats:
+        return
+    for stage, seconds in stats.get("stages", {}).items():
+        PARSE_STAGE_SECONDS.labels(stage).observe(seconds)
+    if "chars" in stats:
+        PARSED_CHARS.observe(stats["chars"])
+    PARSES.labels(stats.get("outcome", "ok")).inc()
+
+
+def record_upload_stages(timings: Dict[str, float]):
+    """Feed a StageTimer's millisecond timings."""
+    for stage, ms in timings.items():
+        UPLOAD_STAGE_SECONDS.labels(stage).observe(ms / 1000)
+
+
+def render() -> Tuple[bytes, str]:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
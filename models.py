@@ -1,5 +1,7 @@
 # models.py
 from typing import Optional
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, Index
 from sqlmodel import SQLModel, Field
 
 class Resume(SQLModel, table=True):
@@ -35,4 +37,95 @@ class Resume(SQLModel, table=True):
     socials: Optional[str] 
     # Audit / reporting
     uploader_ip: Optional[str] = None
+    uploaded_at: Optional[datetime] = Field(default=None, index=True)  # NULL on rows saved before it existed
     projectSummary: Optional[str] = None
+
+
+class UploadJob(SQLModel, table=True):
+    id: str = Field(primary_key=True)          # uuid4 hex, returned to the client
+    filename: Optional[str] = None
+    status: str = "queued"                     # queued | uploading | parsing | saving | done | error
+    resume_id: Optional[int] = None
+    error: Optional[str] = None
+    owner_pid: Optional[int] = None            # worker process running the job
+    timings: Optional[str] = None              # JSON of per-stage milliseconds
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ParseCacheEntry(SQLModel, table=True):
+    sha256: str = Field(primary_key=True)      # hex digest of the uploaded bytes
+    parser_version: str
+    data: str                                  # JSON of parse_resume_from_path() output
+    size: int = 0                              # len(data), used for size-based eviction
+    public_id: Optional[str] = None            # Cloudinary asset already holding these bytes
+    cv_url: Optional[str] = None
+    hits: int = 0
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_used_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class Skill(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True, unique=True)  # normalized (lowercase, trimmed)
+
+
+class ResumeSkill(SQLModel, table=True):
+    __tablename__ = "resume_skill"
+    # (skill_id, resume_id) clustered: each skill's postings are contiguous and sorted
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    skill_id: int = Field(foreign_key="skill.id", primary_key=True)
+    resume_id: int = Field(foreign_key="resume.id", primary_key=True, index=True)
+
+
+class ResumeText(SQLModel, table=True):
+    __tablename__ = "resume_text"
+
+    resume_id: int = Field(foreign_key="resume.id", primary_key=True)
+    text: str                                  # extracted PDF text the fields were parsed from
+    source: Optional[str] = None               # pdf_text backend/page cap that produced it
+    versions: str = "{}"                       # JSON {extractor: version} the row's fields reflect
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class BackfillState(SQLModel, table=True):
+    __tablename__ = "backfill_state"
+
+    name: str = Field(primary_key=True)        # e.g. "reparse"
+    target: str                                # fingerprint of the versions being backfilled to
+    last_id: int = 0                           # checkpoint: highest resume id finished
+    processed: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ResumeFingerprint(SQLModel, table=True):
+    __tablename__ = "resume_fingerprint"
+
+    resume_id: int = Field(foreign_key="resume.id", primary_key=True)
+    email: Optional[str] = Field(default=None, index=True)      # normalized (dedup.normalize_email)
+    phone: Optional[str] = Field(default=None, index=True)      # normalized (dedup.normalize_phone)
+    sha256: Optional[str] = Field(default=None, index=True)     # of the uploaded PDF bytes
+    minhash: Optional[bytes] = None                             # MinHash signature of the extracted text
+    duplicate_of: Optional[int] = Field(default=None, index=True)  # earliest resume of the same candidate
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ResumeLshBand(SQLModel, table=True):
+    __tablename__ = "resume_lsh"
+    # (band, bucket) first: a lookup is one index probe per band
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    band: int = Field(primary_key=True)
+    bucket: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    resume_id: int = Field(foreign_key="resume.id", primary_key=True, index=True)
+
+
+class AnalyticsCount(SQLModel, table=True):
+    __tablename__ = "analytics_count"
+    # Maintained by analytics.record() on every save; rebuilt with `python analytics.py`
+    __table_args__ = (Index("ix_analytics_count_top", "dimension", "count"), {"sqlite_with_rowid": False})
+
+    dimension: str = Field(primary_key=True)   # skill | city | country | job_title | upload_day | total
+    value: str = Field(primary_key=True)       # e.g. "python", "Chennai", "2024-06-01"
+    count: int = 0
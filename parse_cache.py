@@ -0,0 +1,138 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlmodel import Session, select
+from sqlalchemy import func as sa_func
+
+from models import ParseCacheEntry
+
+# ------------------------------------------------------------------
+# Content-hash parse cache: an in-memory LRU in front of a SQLite table,
+# keyed by the SHA-256 of the uploaded PDF bytes.
+# ------------------------------------------------------------------
+PARSE_CACHE_MEMORY_ITEMS = int(os.getenv("PARSE_CACHE_MEMORY_ITEMS", "256"))
+PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class ParseCache:
+    def __init__(self, engine, parser_version: str,
+                 memory_items: int = PARSE_CACHE_MEMORY_ITEMS, max_bytes: int = PARSE_CACHE_MAX_BYTES):
+        self.engine = engine
+        self.parser_version = parser_version
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def set_parser_version(self, parser_version: str):
+        """Entries from other versions become misses (and are overwritten on the next store)."""
+        with self._lock:
+            if parser_version != self.parser_version:
+                self.parser_version = parser_version
+                self._lru.clear()
+
+    def _remember(self, digest: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._lru[digest] = entry
+            self._lru.move_to_end(digest)
+            while len(self._lru) > self.memory_items:
+                self._lru.popitem(last=False)
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Return {"data", "public_id", "cv_url"} for a cached parse, or None."""
+        with self._lock:
+            entry = self._lru.get(digest)
+            if entry is not None:
+                self._lru.move_to_end(digest)
+                self.stats["memory_hits"] += 1
+                return entry
+
+        with Session(self.engine) as session:
+            row = session.get(ParseCacheEntry, digest)
+            if row is None or row.parser_version != self.parser_version:
+                with self._lock:
+                    self.stats["misses"] += 1
+                return None
+            # Only DB-tier hits refresh last_used_at; memory hits stay write-free
+            row.hits += 1
+            row.last_used_at = datetime.utcnow()
+            session.add(row)
+            session.commit()
+            entry = {"data": json.loads(row.data), "public_id": row.public_id, "cv_url": row.cv_url}
+
+        with self._lock:
+            self.stats["db_hits"] += 1
+        self._remember(digest, entry)
+        return entry
+
+    def put(self, digest: str, data: Dict[str, Any], public_id: Optional[str], cv_url: Optional[str]):
+        if not isinstance(data, dict) or "error" in data:
+            return
+        payload = json.dumps(data)
+        with Session(self.engine) as session:
+            row = session.get(ParseCacheEntry, digest) or ParseCacheEntry(sha256=digest, parser_version=self.parser_version, data=payload)
+            row.parser_version = self.parser_version
+            row.data = payload
+            row.size = len(payload)
+            row.public_id = public_id
+            row.cv_url = cv_url
+            row.last_used_at = datetime.utcnow()
+            session.add(row)
+            session.commit()
+            evicted = self._evict(session)
+
+        with self._lock:
+            self.stats["stores"] += 1
+            self.stats["evictions"] += len(evicted)
+            for d in evicted:
+                self._lru.pop(d, None)
+        self._remember(digest, {"data": data, "public_id": public_id, "cv_url": cv_url})
+
+    def update_asset(self, digest: str, public_id: str, cv_url: str):
+        """Record the Cloudinary asset for an entry whose upload finished later (deferred mode)."""
+        with Session(self.engine) as session:
+            row = session.get(ParseCacheEntry, digest)
+            if row is not None:
+                row.public_id = public_id
+                row.cv_url = cv_url
+                session.add(row)
+                session.commit()
+        with self._lock:
+            entry = self._lru.get(digest)
+            if entry is not None:
+                self._lru[digest] = dict(entry, public_id=public_id, cv_url=cv_url)
+
+    def _evict(self, session: Session):
+        total = session.exec(select(sa_func.coalesce(sa_func.sum(ParseCacheEntry.size), 0))).one()
+        evicted = []
+        if total <= self.max_bytes:
+            return evicted
+        rows = session.exec(select(ParseCacheEntry.sha256, ParseCacheEntry.size).order_by(ParseCacheEntry.last_used_at)).all()
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            session.delete(session.get(ParseCacheEntry, digest))
+            total -= size
+            evicted.append(digest)
+        session.commit()
+        return evicted
+
+    def snapshot(self) -> Dict[str, Any]:
+        with Session(self.engine) as session:
+            entries, total = session.exec(select(sa_func.count(ParseCacheEntry.sha256), sa_func.coalesce(sa_func.sum(ParseCacheEntry.size), 0))).one()
+        with self._lock:
+            stats = dict(self.stats, memory_entries=len(self._lru))
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats.update(
+            db_entries=entries,
+            db_bytes=total,
+            max_bytes=self.max_bytes,
+            hit_ratio=round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0,
+            parser_version=self.parser_version,
+        )
+        return stats
@@ -0,0 +1,67 @@
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+# ------------------------------------------------------------------
+# Process pool used for CPU-bound parsing (pdfminer + spaCy hold the GIL,
+# so threads can't use more than one core).
+# ------------------------------------------------------------------
+# Each web worker (WEB_CONCURRENCY, see gunicorn.conf.py) has its own pool,
+# so by default they split the cores between them
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", "0")) or max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", "1")))
+PARSE_POOL_START_METHOD = os.getenv("PARSE_POOL_START_METHOD", "spawn")
+
+_executor: Optional[ProcessPoolExecutor] = None
+logger = logging.getLogger(__name__)
+
+
+def _init_worker():
+    # Spawned workers start with unconfigured logging
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(asctime)s %(levelname)s %(name)s[%(process)d]: %(message)s")
+    # Build the skill matcher and load spaCy once per worker, not per file
+    import parser
+    parser.get_nlp()
+
+
+def _parse_bytes(data: bytes, skills_version: Optional[str] = None):
+    import parser
+    if skills_version and parser.SKILLS.current().fingerprint != skills_version:
+        # The parent has a newer skills taxonomy (e.g. POST /admin/skills/reload):
+        # follow it now instead of at this worker's next file check
+        try:
+            parser.SKILLS.reload()
+        except Exception as e:
+            logger.warning("Skills taxonomy reload failed in parse worker: %s", e)
+    # Stats travel back with the result; metrics live in the parent process
+    stats = {}
+    return parser.parse_resume_from_bytes(data, stats), stats
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=PARSE_POOL_WORKERS,
+            mp_context=multiprocessing.get_context(PARSE_POOL_START_METHOD),
+            initializer=_init_worker,
+        )
+    return _executor
+
+
+def submit_parse(data: bytes, skills_version: Optional[str] = None):
+    try:
+        return get_parse_pool().submit(_parse_bytes, data, skills_version)
+    except BrokenProcessPool:
+        # A worker died (OOM, segfault in a native lib): start a fresh pool
+        shutdown_parse_pool()
+        return get_parse_pool().submit(_parse_bytes, data, skills_version)
+
+
+def shutdown_parse_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -1,187 +1,326 @@
+import io
+import os
 import re
-import spacy
-import nltk
-from pdfminer.high_level import extract_text
-from nltk.corpus import stopwords
-import traceback
-import random
-import difflib
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
 
+import pdf_text
+import sections
+from skill_taxonomy import TaxonomyStore
 
-nltk.download("punkt")
-nltk.download("stopwords")
-nltk.download("averaged_perceptron_tagger")
+logger = logging.getLogger(__name__)
 
-nlp = spacy.load("en_core_web_sm")
+# Bump whenever extraction output changes, so cached parses are recomputed.
+# The PDF backend and page cap change the text too, so they are part of it.
+PARSER_VERSION = f"4+{pdf_text.cache_tag()}"
 
-def load_skills_database():
-    try:
-        with open("skills_db.txt", "r", encoding="utf-8") as f:
-            return [line.strip().lower() for line in f if line.strip()]
-    except FileNotFoundError:
-        print("❌ skills_db.txt not found. Falling back to default.")
-        return [
-            "python", "java", "sql", "excel", "communication", "leadership",
-            "machine learning", "data analysis", "project management", "react", "node.js"
-        ]
+# ------------------------------------------------------------------
+# spaCy: loaded on first use, NER only. The model is only needed for the
+# PERSON fallback in extract_name, so the other pipes are never loaded.
+# ------------------------------------------------------------------
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+SPACY_EXCLUDE = [p for p in os.getenv("SPACY_EXCLUDE", "tok2vec,tagger,parser,attribute_ruler,lemmatizer,senter").split(",") if p]
+NER_MAX_CHARS = int(os.getenv("NER_MAX_CHARS", "2000"))
 
-SKILL_DB = load_skills_database()
+_nlp = None
+_nlp_lock = threading.Lock()
 
+def get_nlp():
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy
+                _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    return _nlp
 
+def load_stopwords():
+    # Vendored copy of NLTK's English list, so import never touches the network
+    with open("stopwords_en.txt", "r", encoding="utf-8") as f:
+        return frozenset(line.strip() for line in f if line.strip())
 
-def extract_text_from_pdf(file):
+STOPWORDS = load_stopwords()
+
+# Compiled skills taxonomy; hot-reloaded when skills_db.txt changes
+SKILLS = TaxonomyStore(stopwords=STOPWORDS)
+
+
+
+def read_pdf(file) -> pdf_text.PdfText:
     try:
-        return extract_text(file)
+        return pdf_text.extract(file)
     except Exception as e:
-        print(f"PDF extraction failed: {e}")
-        return ""
+        logger.warning("PDF extraction failed: %s", e)
+        return pdf_text.PdfText("", 0, False, pdf_text.BACKEND)
+
+def extract_text_from_pdf(file):
+    return read_pdf(file).text
+
+# ------------------------------------------------------------------
+# Precompiled patterns & keyword tables
+# ------------------------------------------------------------------
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_RE = re.compile(r"\+?\d[\d\s\(\)\.]{8,}\d")
+SALARY_RE = re.compile(r"\b\d{2,3}[-]\d{2,3}k\b")
+AGE_RE = re.compile(r'\b[Aa]ge[:\s\-]+(\d{1,2})\b')
+YEAR_RANGE_RE = re.compile(r"\b20\d{2}\s*[-\u2013]\s*20\d{2}\b")
+CITY_RE = re.compile(r"\b(coimbatore|chennai|bangalore|mumbai|delhi|hyderabad|pune)\b")
+EXPERIENCE_RE = re.compile(r"\b(?:fresher|intern)\b", re.IGNORECASE)
+
+SOCIAL_PLATFORMS = ("linkedin", "github", "portfolio")
+LINK_RES = {
+    platform: (
+        re.compile(rf"{platform}[:\-\s]*https?://[^\s\)\]]+", re.IGNORECASE),
+        re.compile(rf"https?://(?:www\.)?{platform}[^\s\)\]]+", re.IGNORECASE),
+    )
+    for platform in SOCIAL_PLATFORMS
+}
+
+NAME_BLACKLIST = {
+    "java", "python", "sql", "resume", "intern", "developer", "project", "email", "contact",
+    "android", "studio", "soft skills", "skills", "education", "experience", "throw", "bronze",
+    "award", "runner", "winner", "badminton", "hockey", "cricket", "football"
+}
+NAME_SKIP_CHARS = ('•', '-', '·')
+
+SUMMARY_INSTITUTION_KEYWORDS = ("vellore", "vit", "institute")
+SUMMARY_COURSE_KEYWORDS = ("b.tech", "m.tech", "b.e", "m.e", "computer science", "data science", "engineering")
+HISTORY_INSTITUTION_KEYWORDS = ("school", "college", "university", "institute")
+LOCATION_KEYWORDS = ("address", "location", "contact", "residence")
+LANGUAGE_KEYWORDS = ("english", "tamil", "hindi")
+JOB_TITLES = ("intern", "software engineer", "developer", "data scientist", "analyst", "sde")
+JOB_TITLE_RES = tuple((title, re.compile(rf"\b{re.escape(title)}s?\b")) for title in JOB_TITLES)
+
+# Sections each group of extractors reads (see sections.py); the whole text when the resume has none of them
+CONTACT_SECTIONS = (sections.HEADER, "contact", "other")
+SKILL_SECTIONS = ("skills", "experience", "projects", "summary")
+
+_MONTH = r"(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+)?"
+WORK_DATES_RE = re.compile(
+    rf"\b{_MONTH}(?:19|20)\d{{2}}\s*(?:[-\u2013]|to)\s*(?:{_MONTH}(?:19|20)\d{{2}}|present|current|now)\b", re.IGNORECASE
+)
+EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+BULLET_CHARS = "•·-–*●▪■◦>"
+WORK_DESCRIPTION_CHARS = 100  # longer non-bullet lines under a role are its description
+
+
+class ResumeText:
+    """Extracted text normalized once and shared by every extractor."""
+    __slots__ = ("text", "lower", "lines", "lower_lines", "stripped", "nonblank", "_blocks", "_sections")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.lines = text.split("\n")
+        self.lower_lines = self.lower.split("\n")
+        self.stripped = [line.strip() for line in self.lines]
+        self.nonblank = [line for line in self.stripped if line]
+        self._blocks = None
+        self._sections = {}
+
+    @property
+    def blocks(self):
+        """Labeled sections in document order, segmented on first use."""
+        if self._blocks is None:
+            self._blocks = sections.segment(self.lines)
+        return self._blocks
+
+    def section(self, *labels: str, fallback: bool = True) -> "ResumeText":
+        """
+        The text of the given sections, in document order. When the resume
+        has none of them, the whole text (``fallback``) or an empty text.
+        """
+        key = (labels, fallback)
+        view = self._sections.get(key)
+        if view is None:
+            lines = [line for label, body in self.blocks if label in labels for line in body]
+            if lines:
+                view = ResumeText("\n".join(lines))
+            else:
+                view = self if fallback else ResumeText("")
+            self._sections[key] = view
+        return view
+
+
+def _view(text):
+    return text if isinstance(text, ResumeText) else ResumeText(text)
+
+# ------------------------------------------------------------------
+# Field extractors (accept raw text or a ResumeText)
+# ------------------------------------------------------------------
+def _search(pattern, view: ResumeText, *labels: str):
+    """First match in the given sections, else anywhere in the text."""
+    scoped = view.section(*labels)
+    match = pattern.search(scoped.text)
+    if match is None and scoped is not view:
+        match = pattern.search(view.text)
+    return match
 
 def extract_email(text):
-    match = re.findall(r"[a-zA-Z0-9._%+]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
-    return match[0] if match else ""
+    match = _search(EMAIL_RE, _view(text), *CONTACT_SECTIONS)
+    return match.group() if match else ""
 
 def extract_phone(text):
-    match = re.findall(r"\+?\d[\d\s\(\)\.]{8,}\d", text)
-    return match[0] if match else ""
+    match = _search(PHONE_RE, _view(text), *CONTACT_SECTIONS)
+    return match.group() if match else ""
 
 def extract_name(text):
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    blacklist = {
-        "java", "python", "sql", "resume", "intern", "developer", "project", "email", "contact",
-        "android", "studio", "soft skills", "skills", "education", "experience", "throw", "bronze",
-        "award", "runner", "winner", "badminton", "hockey", "cricket", "football"
-    }
+    # The name sits above the first heading
+    head = _view(text).section(sections.HEADER)
 
     # Heuristically check only the first 5–7 lines
-    for line in lines[:7]:
-        if any(char in line for char in ['•', '-', '·']) or any(c.isdigit() for c in line):
+    for line in head.nonblank[:7]:
+        if any(char in line for char in NAME_SKIP_CHARS) or any(c.isdigit() for c in line):
             continue
 
-        clean_line = line.strip()
-        words = clean_line.split()
+        words = line.split()
 
         # Skip if line has too few/many words or contains blacklist keywords
         if 1 < len(words) <= 4:
-            if not any(word.lower() in blacklist for word in words):
-                if clean_line.replace(" ", "").isalpha():  # letters only
-                    return clean_line.title()
+            if not any(word.lower() in NAME_BLACKLIST for word in words):
+                if line.replace(" ", "").isalpha():  # letters only
+                    return line.title()
 
-    # Fallback to spaCy NER
-    doc = nlp(text)
+    # Fallback to spaCy NER, over the head of the document where the name lives
+    doc = get_nlp()(head.text[:NER_MAX_CHARS])
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             name_candidate = ent.text.strip()
-            if all(word.lower() not in blacklist for word in name_candidate.split()):
+            if all(word.lower() not in NAME_BLACKLIST for word in name_candidate.split()):
                 return name_candidate.title()
 
     return ""
-def load_skills_database():
-    with open("skills_db.txt", "r") as f:
-        return [line.strip().lower() for line in f.readlines()]
-
-SKILL_DB = load_skills_database()
-
 
 def extract_skills(text):
-    text = text.lower()
-    tokens = re.findall(r'\b\w+(?:\.\w+)?\b', text)
-    tokens = [t for t in tokens if t not in stopwords.words("english")]
+    return SKILLS.current().match(_view(text).section(*SKILL_SECTIONS).text)
 
-    matched_skills = set()
-    for token in tokens:
-        close_matches = difflib.get_close_matches(token, SKILL_DB, n=1, cutoff=0.85)
-        if close_matches:
-            matched_skills.add(close_matches[0])
+def _skills_and_categories(text):
+    # One taxonomy snapshot for both, even if a reload lands in between
+    taxonomy = SKILLS.current()
+    skills = taxonomy.match(_view(text).section(*SKILL_SECTIONS).text)
+    return {"skills": skills, "categories": taxonomy.categories_for(skills)}
 
-    return list(matched_skills)
 
+def _scan_education(view: ResumeText):
+    """Single pass over the education section for the education summary and history."""
+    lines, stripped, lower_lines = view.lines, view.stripped, view.lower_lines
 
+    education_summary = None
+    education_entries = []
+    current_entry = ""
+    course_or_score = ""
+    year = ""
 
-def extract_education_summary(text):
-    lines = text.split("\n")
-    education_text = ""
-    for i, line in enumerate(lines):
-        lower = line.lower()
-        if "vellore" in lower or "vit" in lower or "institute" in lower:
-            institution = line.strip()
+    def _flush_entry():
+        entry = current_entry
+        if course_or_score:
+            entry += f" | {course_or_score}"
+        if year:
+            entry += f" | Year: {year}"
+        education_entries.append(entry)
+
+    for i, lower in enumerate(lower_lines):
+        # Education summary: first institution line + course/CGPA within the next 3 lines
+        if education_summary is None and any(k in lower for k in SUMMARY_INSTITUTION_KEYWORDS):
             course = ""
             cgpa = ""
             for j in range(i + 1, min(i + 4, len(lines))):
-                next_line = lines[j].strip().lower()
-                if any(keyword in next_line for keyword in ["b.tech", "m.tech", "b.e", "m.e", "computer science", "data science", "engineering"]):
-                    course = lines[j].strip()
+                next_line = stripped[j].lower()
+                if any(keyword in next_line for keyword in SUMMARY_COURSE_KEYWORDS):
+                    course = stripped[j]
                 if "cgpa" in next_line:
-                    cgpa = lines[j].strip()
-            education_text = f"{course} | {institution}"
+                    cgpa = stripped[j]
+            education_summary = f"{course} | {stripped[i]}"
             if cgpa:
-                education_text += f" | {cgpa}"
-            break
-    return education_text
+                education_summary += f" | {cgpa}"
 
-def extract_education_history(text):
-    lines = text.split("\n")
-    education_entries = []
-    current_entry = ""
-    course_or_score = ""
-    year = ""
-    for i, line in enumerate(lines):
-        clean = line.strip()
-        lower = clean.lower()
-        if any(keyword in lower for keyword in ["school", "college", "university", "institute"]):
+        # Education history
+        clean = stripped[i]
+        clean_lower = clean.lower()
+        if any(keyword in clean_lower for keyword in HISTORY_INSTITUTION_KEYWORDS):
             if current_entry:
-                entry = current_entry
-                if course_or_score:
-                    entry += f" | {course_or_score}"
-                if year:
-                    entry += f" | Year: {year}"
-                education_entries.append(entry)
+                _flush_entry()
                 course_or_score = ""
                 year = ""
             current_entry = clean
-        elif "cgpa" in lower or "percentage" in lower:
+        elif "cgpa" in clean_lower or "percentage" in clean_lower:
             course_or_score = clean
-        elif re.search(r"\b20\d{2}\s*[-\u2013]\s*20\d{2}\b", clean):
-            year_match = re.search(r"\b20\d{2}\s*[-\u2013]\s*20\d{2}\b", clean)
+        else:
+            year_match = YEAR_RANGE_RE.search(clean)
             if year_match:
                 year = year_match.group()
+
     if current_entry:
-        entry = current_entry
-        if course_or_score:
-            entry += f" | {course_or_score}"
-        if year:
-            entry += f" | Year: {year}"
-        education_entries.append(entry)
-    return education_entries
+        _flush_entry()
+    return {"education": education_summary or "", "educationHistory": education_entries}
+
+def _scan_location(view: ResumeText):
+    """Single pass over the header and contact details for city, country and address."""
+    city = ""
+    country = ""
+    full_address = ""
+    for clean, lower in zip(view.stripped, view.lower_lines):
+        if any(keyword in lower for keyword in LOCATION_KEYWORDS):
+            city_match = CITY_RE.search(lower)
+            if city_match:
+                city = city_match.group(1).title()
+        if "address" in lower:
+            full_address = clean
+        if "india" in lower:
+            country = "India"
+
+    if not full_address and city and country:
+        full_address = f"{city}, {country}"
+    return {"city": city, "country": country, "fullAddress": full_address}
+
+def _scan_lines(view: ResumeText):
+    """Every line-based field: education summary and history, and location details."""
+    return {**_scan_education(view.section("education")), **_scan_location(view.section(*CONTACT_SECTIONS))}
+
+def extract_education_summary(text):
+    return _scan_education(_view(text).section("education"))["education"]
+
+def extract_education_history(text):
+    return _scan_education(_view(text).section("education"))["educationHistory"]
 
 def extract_languages(text):
-    lang_keywords = ["english", "tamil", "hindi"]
-    return [lang.capitalize() for lang in lang_keywords if lang in text.lower()]
+    lower = _view(text).section("languages").lower
+    return [lang.capitalize() for lang in LANGUAGE_KEYWORDS if lang in lower]
 
 def extract_link(text, platform):
+    view = _view(text)
+    labelled, raw = LINK_RES.get(platform) or (
+        re.compile(rf"{platform}[:\-\s]*https?://[^\s\)\]]+", re.IGNORECASE),
+        re.compile(rf"https?://(?:www\.)?{platform.lower()}[^\s\)\]]+", re.IGNORECASE),
+    )
     # Case-insensitive match for full URLs
-    pattern = rf"{platform}[:\-\s]*https?://[^\s\)\]]+"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _search(labelled, view, *CONTACT_SECTIONS)
     if match:
         return match.group(0).split()[-1]
 
     # Fallback: raw URLs that include the platform name
-    fallback = re.search(rf"https?://(?:www\.)?{platform.lower()}[^\s\)\]]+", text, re.IGNORECASE)
+    fallback = _search(raw, view, *CONTACT_SECTIONS)
     return fallback.group(0) if fallback else ""
 
 
 def extract_job_title(text):
-    job_titles = ["intern", "software engineer", "developer", "data scientist", "analyst", "sde"]
-    for title in job_titles:
-        if title in text.lower():
-            return title.title()
+    view = _view(text)
+    # The headline under the name first, then the roles listed under experience
+    for scope in (view.section(sections.HEADER, "summary"), view.section("experience", fallback=False)):
+        for title, pattern in JOB_TITLE_RES:
+            if pattern.search(scope.lower):
+                return title.title()
     return ""
 
 def extract_expected_salary(text):
-    match = re.findall(r"\b\d{2,3}[-]\d{2,3}k\b", text.lower())
-    return match[0] if match else ""
+    view = _view(text)
+    match = SALARY_RE.search(view.section(*CONTACT_SECTIONS).lower) or SALARY_RE.search(view.lower)
+    return match.group() if match else ""
 
 def extract_age(text):
-    age_match = re.search(r'\b[Aa]ge[:\s\-]+(\d{1,2})\b', text)
+    age_match = _search(AGE_RE, _view(text), *CONTACT_SECTIONS)
     if age_match:
         age = age_match.group(1)
         if 17 <= int(age) <= 60:
@@ -189,92 +328,188 @@ def extract_age(text):
     return ""
 
 def extract_location_details(text):
-    city = ""
-    country = ""
-    full_address = ""
-    lines = text.split("\n")
-    for line in lines:
-        lower = line.lower()
-        if any(keyword in lower for keyword in ["address", "location", "contact", "residence"]):
-            city_match = re.search(r"\b(coimbatore|chennai|bangalore|mumbai|delhi|hyderabad|pune)\b", lower)
-            if city_match:
-                city = city_match.group(1).title()
-        if "address" in lower:
-            full_address = line.strip()
-        if "india" in lower:
-            country = "India"
-    if not full_address and city and country:
-        full_address = f"{city}, {country}"
-    return city, country, full_address
+    fields = _scan_location(_view(text).section(*CONTACT_SECTIONS))
+    return fields["city"], fields["country"], fields["fullAddress"]
 
 def extract_years_of_exp(text):
-    return "0-1" if re.search(r"\b(?:fresher|intern)\b", text, re.IGNORECASE) else ""
+    return "0-1" if EXPERIENCE_RE.search(_view(text).section(sections.HEADER, "summary", "experience").text) else ""
+
+def _bullet(line: str) -> bool:
+    return line[0] in BULLET_CHARS
+
+def extract_work_experience(text):
+    """
+    Entries of the experience section: a title line ("Analyst - TCS (2016 - 2017)",
+    continued by further non-bullet lines) and the bullet points under it.
+    """
+    entries = []
+    current = None
+    in_bullet = False
+    for line in _view(text).section("experience", fallback=False).nonblank:
+        if _bullet(line) or (current is not None and len(line) > WORK_DESCRIPTION_CHARS):
+            if current is None:
+                current = {"title": "", "years": "", "highlights": []}
+                entries.append(current)
+            current["highlights"].append(line.lstrip(BULLET_CHARS).strip())
+            in_bullet = True
+            continue
+        if in_bullet and not line[0].isupper():
+            # A bullet point wrapped onto the next line
+            current["highlights"][-1] += f" {line}"
+            continue
+        in_bullet = False
+        dates = WORK_DATES_RE.search(line)
+        title = EMPTY_PARENS_RE.sub("", WORK_DATES_RE.sub("", line)).strip(" |,-\u2013")
+        if current is None or current["highlights"] or (dates and current["years"]):
+            current = {"title": title, "years": "", "highlights": []}
+            entries.append(current)
+        elif title:
+            current["title"] = f"{current['title']} | {title}" if current["title"] else title
+        if dates and not current["years"]:
+            current["years"] = dates.group()
+    return entries
+
+def extract_awards(text):
+    awards = []
+    for line in _view(text).section("awards", fallback=False).nonblank:
+        if awards and not _bullet(line) and not line[0].isupper():
+            awards[-1] += f" {line}"
+        else:
+            item = line.lstrip(BULLET_CHARS).strip()
+            if item:
+                awards.append(item)
+    return awards
+
+def _run(timings: Optional[Dict[str, float]], stage: str, fn, *args):
+    if timings is None:
+        return fn(*args)
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+def extract_socials(text):
+    view = _view(text)
+    return {platform: extract_link(view, platform) for platform in SOCIAL_PLATFORMS}
+
+# ------------------------------------------------------------------
+# Extractor registry: name -> (field key, function). "sections" and "skills" return
+# several fields at once. Bump an extractor's version when its output
+# changes so reparse.py re-runs just that extractor over stored text.
+# ------------------------------------------------------------------
+EXTRACTORS = {
+    "sections": (None, _scan_lines),
+    "name": ("name", extract_name),
+    "email": ("email", extract_email),
+    "phone": ("phone", extract_phone),
+    "skills": (None, _skills_and_categories),
+    "languages": ("languages", extract_languages),
+    "job_title": ("jobTitle", extract_job_title),
+    "salary": ("expectedSalary", extract_expected_salary),
+    "age": ("age", extract_age),
+    "experience": ("yearsOfExp", extract_years_of_exp),
+    "links": ("socials", extract_socials),
+    "work_experience": ("workExperience", extract_work_experience),
+    "awards": ("awards", extract_awards),
+}
 
-def parse_resume_from_path(file_path: str):
+EXTRACTOR_VERSIONS = {name: "2" for name in EXTRACTORS}  # 2: reads only its sections
+EXTRACTOR_VERSIONS["skills"] = "3"  # 2: aliases and categories, 3: sections
+EXTRACTOR_VERSIONS["work_experience"] = EXTRACTOR_VERSIONS["awards"] = "1"
+
+def extractor_versions() -> Dict[str, str]:
+    """EXTRACTOR_VERSIONS, with the skills entry tied to the current taxonomy file."""
+    return dict(EXTRACTOR_VERSIONS, skills=f"{EXTRACTOR_VERSIONS['skills']}+{SKILLS.current().fingerprint}")
+
+def cache_version() -> str:
+    """PARSER_VERSION plus the current taxonomy, for the parse cache."""
+    return f"{PARSER_VERSION}+skills:{SKILLS.current().fingerprint}"
+
+def extract_fields(text, timings: Optional[Dict[str, float]] = None, only: Optional[Iterable[str]] = None):
+    """
+    Run the extractors (all, or just ``only``) over one shared ResumeText;
+    per-extractor seconds go into ``timings``.
+    """
+    view = _run(timings, "normalize", _view, text)
+    _run(timings, "segment", getattr, view, "blocks")
+    only = set(only) if only is not None else None
+    fields = {}
+    for name, (key, fn) in EXTRACTORS.items():
+        if only is not None and name not in only:
+            continue
+        value = _run(timings, name, fn, view)
+        if key is None:
+            fields.update(value)
+        else:
+            fields[key] = value
+    return fields
+
+def parse_resume_from_path(file_path: str, stats: Optional[Dict[str, Any]] = None):
+    """
+    Parse one PDF. If ``stats`` is given it is filled with ``stages``
+    (seconds per stage), ``chars`` and ``outcome`` (ok / image_only /
+    empty_text / error) for the caller to record; parsing may run in a
+    pool worker, so metrics are recorded by whoever gets the result.
+    """
+    stats = stats if stats is not None else {}
+    timings = stats.setdefault("stages", {})
+    stats["outcome"] = "error"
     try:
-        text = extract_text_from_pdf(file_path)
+        pdf = _run(timings, "pdf", read_pdf, file_path)
+        text = pdf.text
+        stats["chars"] = len(text)
+        if pdf.image_only:
+            # Scanned resume: no text layer, nothing for the extractors to do
+            stats["outcome"] = "image_only"
+            return {"error": "The PDF has no text layer (scanned image?). Please upload a text-based PDF."}
         if not text.strip():
+            stats["outcome"] = "empty_text"
             return {"error": "Could not extract text from the PDF."}
 
-        # 🔍 Debug: print extracted resume text
-        print("\n===== RESUME TEXT START =====\n")
-        print(text)
-        print("\n===== RESUME TEXT END =====\n")
-
-        name = extract_name(text)
-        email = extract_email(text)
-        phone = extract_phone(text)
-        skills = extract_skills(text)
-        education_list = extract_education_history(text)
-        education_summary = extract_education_summary(text)
-        languages = extract_languages(text)
-        job_title = extract_job_title(text)
-        expected_salary = extract_expected_salary(text)
-        age = extract_age(text)
-        years_of_exp = extract_years_of_exp(text)
-        city, country, full_address = extract_location_details(text)
-        print("Text:", text[:1000])  # Preview first 1000 chars
-        print("Skills Extracted:", skills)
-        socials = {
-    "linkedin": extract_link(text, "linkedin"),
-    "github": extract_link(text, "github"),
-    "portfolio": extract_link(text, "portfolio")
-}
+        # Resume text is PII: only dumped when debug logging is switched on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Resume text (%d chars):\n%s", len(text), text)
 
- 
+        versions = extractor_versions()  # before extracting: a reload meanwhile only means an extra re-parse
+        fields = extract_fields(text, timings)
+        skills = fields["skills"]
+        logger.debug("Skills extracted: %s", skills)
+        stats["outcome"] = "ok"
+        # Kept with the resume so reparse.py can re-run extractors
+        stats["text"] = text
+        stats["versions"] = versions
 
         return {
-            "name": name,
-            "email": email,
+            "name": fields["name"],
+            "email": fields["email"],
             "profileImageURL": "",
-            "profileDescription": job_title,
-            "phone": phone,
-            "age": age,
-            "country": country,
-            "city": city,
-            "fullAddress": full_address,
-            "jobTitle": job_title,
+            "profileDescription": fields["jobTitle"],
+            "phone": fields["phone"],
+            "age": fields["age"],
+            "country": fields["country"],
+            "city": fields["city"],
+            "fullAddress": fields["fullAddress"],
+            "jobTitle": fields["jobTitle"],
             "currentSalary": "",
-            "expectedSalary": expected_salary,
-            "education": education_summary,
-            "yearsOfExp": years_of_exp,
-            "languages": languages,
-            "skills":skills,
-            "categories": ["Software"] if any(skill in ["python", "java"] for skill in skills) else [],
+            "expectedSalary": fields["expectedSalary"],
+            "education": fields["education"],
+            "yearsOfExp": fields["yearsOfExp"],
+            "languages": fields["languages"],
+            "skills": skills,
+            "categories": fields["categories"],
             "allowProfileListing": True,
-            "socials": {
-                "linkedin": extract_link(text, "linkedin"),
-                "github": extract_link(text, "github"),
-                "portfolio": extract_link(text, "portfolio")
-            },
-            "socials":socials,
-            "educationHistory": education_list,
-            "workExperience": [],
-            "awards": [],
+            "socials": fields["socials"],
+            "educationHistory": fields["educationHistory"],
+            "workExperience": fields["workExperience"],
+            "awards": fields["awards"],
             "CV": []
         }
 
     except Exception as e:
-        print("Error in parse_resume:", traceback.format_exc())
+        logger.exception("Error in parse_resume")
         return {"error": f"An error occurred: {str(e)}"}
 
+def parse_resume_from_bytes(data: bytes, stats: Optional[Dict[str, Any]] = None):
+    return parse_resume_from_path(io.BytesIO(data), stats)
+
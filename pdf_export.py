@@ -0,0 +1,159 @@
+import os
+import hashlib
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional, Tuple
+
+from fpdf import FPDF
+
+from models import Resume
+
+# ------------------------------------------------------------------
+# Parsed-resume PDF export: rendered in memory, cached per resume and
+# content version, so repeat downloads neither re-render nor touch disk.
+# ------------------------------------------------------------------
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Bump when the layout below changes so cached PDFs and browser ETags expire
+PDF_LAYOUT_VERSION = "1"
+
+# Every column the rendered PDF reads; the content version hashes these
+PDF_FIELDS = (
+    "name", "email", "phone", "jobTitle", "age", "fullAddress", "languages", "skills",
+    "expectedSalary", "education", "yearsOfExp", "linkedin", "github", "portfolio", "educationHistory",
+)
+
+
+def sanitize(text: Optional[str]) -> str:
+    return text.encode("latin-1", "replace").decode("latin-1") if text else "N/A"
+
+
+def content_version(resume: Resume) -> str:
+    """Hash of what the PDF shows; changes whenever any rendered field is updated."""
+    h = hashlib.sha256(PDF_LAYOUT_VERSION.encode())
+    for field in PDF_FIELDS:
+        h.update(b"\x00" + (getattr(resume, field) or "").encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def render_pdf(resume: Resume) -> bytes:
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+
+    pdf.cell(200, 10, txt="AI Resume Parser Result", ln=True, align="C")
+    pdf.ln(10)
+
+    fields = [
+        f"Name: {resume.name}",
+        f"Email: {resume.email}",
+        f"Phone: {resume.phone}",
+        f"Job Title: {resume.jobTitle}",
+        f"Age: {resume.age or 'N/A'}",
+        f"Location: {resume.fullAddress or 'N/A'}",
+        f"Languages: {resume.languages or 'N/A'}",
+        f"Skills: {resume.skills or 'N/A'}",
+        f"Expected Salary: {resume.expectedSalary or 'N/A'}",
+        f"Education: {resume.education or 'N/A'}",
+        f"Years of Experience: {resume.yearsOfExp or 'N/A'}",
+        f"LinkedIn: {resume.linkedin or 'N/A'}",
+        f"GitHub: {resume.github or 'N/A'}",
+        f"Portfolio: {resume.portfolio or 'N/A'}",
+    ]
+
+    for field in fields:
+        pdf.multi_cell(0, 10, sanitize(field))
+
+    pdf.ln(5)
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(200, 10, txt="Education History", ln=True)
+    pdf.set_font("Arial", size=12)
+    pdf.multi_cell(0, 10, sanitize(resume.educationHistory or "N/A"))
+
+    # fpdf 1.7 returns the document as a latin-1 str
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def export_filename(resume: Resume) -> str:
+    name = "_".join("".join(c for c in (resume.name or "") if c.isalnum() or c == " ").split())
+    return f"resume_{resume.id}_{name}.pdf" if name else f"resume_{resume.id}.pdf"
+
+
+class PdfCache:
+    """
+    LRU of rendered PDFs keyed by (resume id, content version), bounded by
+    total bytes. No invalidation: a row changed anywhere (reparse.py, another
+    worker) has a new content version, so the stale entry is never served and
+    is replaced on the next get().
+    """
+
+    def __init__(self, max_bytes: int = PDF_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[int, Tuple[str, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, resume: Resume) -> Tuple[str, bytes]:
+        """Return (etag, pdf bytes) for the resume, rendering only on a miss."""
+        version = content_version(resume)
+        with self._lock:
+            cached = self._items.get(resume.id)
+            if cached and cached[0] == version:
+                self._items.move_to_end(resume.id)
+                self.hits += 1
+                return version, cached[1]
+            self.misses += 1
+
+        data = render_pdf(resume)
+        with self._lock:
+            old = self._items.pop(resume.id, None)
+            if old:
+                self._bytes -= len(old[1])
+            if len(data) <= self.max_bytes:
+                self._items[resume.id] = (version, data)
+                self._bytes += len(data)
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted) = self._items.popitem(last=False)
+                    self._bytes -= len(evicted)
+        return version, data
+
+    def stats(self):
+        with self._lock:
+            return {"items": len(self._items), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+class _ZipSink:
+    """Write-only file object for zipfile that hands back what was written so far."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[str, bytes]]) -> Iterator[bytes]:
+    """Yield a zip archive of (filename, data) entries as it is built."""
+    sink = _ZipSink()
+    # PDFs are already deflated by fpdf; storing them avoids recompressing
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+        for name, data in entries:
+            zf.writestr(name, data)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    tail = sink.drain()
+    if tail:
+        yield tail
@@ -0,0 +1,183 @@
+import io
+import os
+import logging
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# PDF text extraction with pluggable backends.
+#   PDF_BACKEND=auto      pypdfium2, then PyMuPDF, then pdfminer (whichever is installed)
+#   PDF_BACKEND=pdfium | pymupdf | pdfminer   force one
+# Only the first PDF_MAX_PAGES pages are read (0 = all); resumes rarely
+# need more, and scanned portfolios can run to dozens of pages.
+# ------------------------------------------------------------------
+PDF_BACKEND = os.getenv("PDF_BACKEND", "auto")
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "5"))
+
+# pdfminer layout analysis. boxes_flow=None skips the hierarchical text-box
+# grouping (the expensive part); boxes are then read top-to-bottom, which
+# is the natural order for single-column resumes.
+LAPARAMS = LAParams(
+    line_margin=float(os.getenv("PDF_LINE_MARGIN", "0.5")),
+    char_margin=float(os.getenv("PDF_CHAR_MARGIN", "2.0")),
+    boxes_flow=None if os.getenv("PDF_BOXES_FLOW", "none") == "none" else float(os.getenv("PDF_BOXES_FLOW")),
+    detect_vertical=False,
+    all_texts=False,
+)
+
+
+class PdfText(NamedTuple):
+    text: str
+    pages: int          # pages read (after the cap)
+    image_only: bool    # no text layer on any page read: scanned / image PDF
+    backend: str
+
+
+def _read_bytes(source) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    source.seek(0)
+    return source.read()
+
+
+def _page_limit(max_pages: int, total: int) -> int:
+    return min(total, max_pages) if max_pages > 0 else total
+
+
+# ------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------
+def _extract_pdfium(data: bytes, max_pages: int) -> PdfText:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(data)
+    try:
+        n = _page_limit(max_pages, len(pdf))
+        parts = []
+        for i in range(n):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    text = "\n".join(parts).replace("\r\n", "\n")
+    return PdfText(text, n, not text.strip(), "pdfium")
+
+
+def _extract_pymupdf(data: bytes, max_pages: int) -> PdfText:
+    import pymupdf
+
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        n = _page_limit(max_pages, doc.page_count)
+        text = "\n".join(doc[i].get_text() for i in range(n))
+    return PdfText(text, n, not text.strip(), "pymupdf")
+
+
+def _has_fonts(resources, seen=None) -> bool:
+    # Fonts may also sit in the resources of Form XObjects the page draws
+    # (templated and exported CVs often wrap their whole layout in one)
+    resources = resolve1(resources) or {}
+    if not isinstance(resources, dict):
+        return False
+    if resolve1(resources.get("Font")):
+        return True
+    seen = set() if seen is None else seen
+    xobjects = resolve1(resources.get("XObject")) or {}
+    for ref in (xobjects.values() if isinstance(xobjects, dict) else ()):
+        key = getattr(ref, "objid", None) or id(ref)
+        if key in seen:
+            continue
+        seen.add(key)
+        xobject = resolve1(ref)
+        attrs = getattr(xobject, "attrs", None) or {}
+        if getattr(attrs.get("Subtype"), "name", None) == "Form" and _has_fonts(attrs.get("Resources"), seen):
+            return True
+    return False
+
+
+def _extract_pdfminer(data: bytes, max_pages: int) -> PdfText:
+    # Text can only be drawn with a font, so pages without font resources
+    # (their own or their forms') are images; if every page read is like
+    # that, skip layout analysis.
+    doc = PDFDocument(PDFParser(io.BytesIO(data)))
+    pages = PDFPage.create_pages(doc)
+    pages = list(islice(pages, max_pages) if max_pages > 0 else pages)
+    if not any(_has_fonts(p.resources) for p in pages):
+        return PdfText("", len(pages), True, "pdfminer")
+
+    # Same as pdfminer.high_level.extract_text, minus re-parsing the document
+    rsrcmgr = PDFResourceManager(caching=True)
+    out = io.StringIO()
+    device = TextConverter(rsrcmgr, out, laparams=LAPARAMS)
+    try:
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in pages:
+            interpreter.process_page(page)
+    finally:
+        device.close()
+    text = out.getvalue()
+    return PdfText(text, len(pages), not text.strip(), "pdfminer")
+
+
+BACKENDS = {
+    "pdfium": ("pypdfium2", _extract_pdfium),
+    "pymupdf": ("pymupdf", _extract_pymupdf),
+    "pdfminer": ("pdfminer", _extract_pdfminer),
+}
+
+
+def _installed(module: str) -> bool:
+    import importlib.util
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_backend(name: str = PDF_BACKEND) -> str:
+    if name != "auto":
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown PDF_BACKEND {name!r}; expected auto or one of {sorted(BACKENDS)}")
+        if not _installed(BACKENDS[name][0]):
+            raise RuntimeError(f"PDF_BACKEND={name} but {BACKENDS[name][0]} is not installed")
+        return name
+    for candidate in ("pdfium", "pymupdf"):
+        if _installed(BACKENDS[candidate][0]):
+            return candidate
+    return "pdfminer"
+
+
+BACKEND = resolve_backend()
+
+
+def cache_tag() -> str:
+    """Identifies what produced the text, for parse-cache invalidation."""
+    return f"{BACKEND}/p{PDF_MAX_PAGES}"
+
+
+def extract(source, max_pages: int = PDF_MAX_PAGES, backend: Optional[str] = None) -> PdfText:
+    """
+    Extract text from a path, bytes or binary file object. If the fast
+    backend fails on a file, pdfminer gets a second try.
+    """
+    backend = backend or BACKEND
+    data = _read_bytes(source)
+    try:
+        return BACKENDS[backend][1](data, max_pages)
+    except Exception as e:
+        if backend == "pdfminer":
+            raise
+        logger.warning("%s could not read the PDF (%s); retrying with pdfminer", backend, e)
+        return _extract_pdfminer(data, max_pages)
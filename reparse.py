@@ -0,0 +1,270 @@
+"""
+Re-run extractors over resumes already in the database.
+
+Each resume's extracted text is stored in resume_text together with the
+extractor versions its fields came from (parser.extractor_versions()). A
+run re-executes only the extractors whose version changed, e.g. just
+"skills" after skills_db.txt is edited. Resumes with no stored text
+(uploaded before it was kept, or served from the parse cache) have their
+PDF fetched from storage (Cloudinary or a local stand-in) and are
+parsed in full.
+
+Work goes in id order, in batches: extraction runs on a process pool
+outside any transaction, then each batch is written in one short
+transaction together with what is derived from it (skill index, dedup
+fingerprints, dashboard counters) and a checkpoint, so the live app is never
+locked out for long. An interrupted run resumes after the last
+committed batch. The checkpoint resets by itself once the versions
+change again. A run that updated anything ends by rebuilding the /match
+index (match_index.py), which every app worker then switches to.
+
+    python reparse.py [--batch-size 200] [--workers N] [--storage cloudinary|local] [--restart] [--dry-run]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlmodel import Session, select
+
+import analytics
+import dedup
+import match_index
+import parser
+from models import BackfillState, Resume, ResumeText
+from skill_index import index_resumes
+from storage import PdfStorage, get_storage
+
+logger = logging.getLogger(__name__)
+
+REPARSE_BATCH_SIZE = int(os.getenv("REPARSE_BATCH_SIZE", "200"))
+REPARSE_WORKERS = int(os.getenv("REPARSE_WORKERS", "0")) or (os.cpu_count() or 1)
+REPARSE_FETCH_THREADS = int(os.getenv("REPARSE_FETCH_THREADS", "8"))
+STATE_NAME = "reparse"
+
+
+def versions_fingerprint(versions: Dict[str, str]) -> str:
+    return hashlib.sha1(json.dumps(versions, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def stale_extractors(stored: Optional[ResumeText], versions: Dict[str, str]) -> List[str]:
+    if stored is None:
+        return list(versions)
+    done = json.loads(stored.versions or "{}")
+    return [name for name, version in versions.items() if done.get(name) != version]
+
+
+def resume_columns(name: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Resume columns written by one extractor (same conversions as main._build_resume)."""
+    if name == "sections":
+        return {
+            "education": fields.get("education") or "",
+            "educationHistory": "\n".join(fields.get("educationHistory") or []),
+            "city": fields.get("city"),
+            "country": fields.get("country"),
+            "fullAddress": fields.get("fullAddress"),
+        }
+    if name in ("skills", "languages"):
+        return {name: ", ".join(fields.get(name) or [])}
+    if name == "job_title":
+        return {"jobTitle": fields.get("jobTitle"), "profileDescription": fields.get("jobTitle")}
+    if name in ("work_experience", "awards"):
+        return {}  # not Resume columns: part of the parse result only
+    if name == "links":
+        socials = fields.get("socials") or {}
+        return {platform: socials.get(platform, "") for platform in parser.SOCIAL_PLATFORMS}
+    key = parser.EXTRACTORS[name][0]
+    return {key: fields.get(key)}
+
+
+# ------------------------------------------------------------------
+# Pool workers
+# ------------------------------------------------------------------
+def _init_worker():
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+def _reparse_one(item: Tuple[int, Optional[str], Optional[bytes], List[str]]):
+    """-> (resume_id, text, source, fields, error); source is set when the text is new."""
+    import pdf_text
+
+    resume_id, text, pdf_bytes, stale = item
+    source = None
+    try:
+        if text is None:
+            if pdf_bytes is None:
+                return resume_id, None, None, None, "PDF not found in storage"
+            pdf = pdf_text.extract(pdf_bytes)
+            if not pdf.text.strip():
+                return resume_id, None, None, None, "no text layer" if pdf.image_only else "empty text"
+            text, source = pdf.text, pdf_text.cache_tag()
+        return resume_id, text, source, parser.extract_fields(text, only=stale), None
+    except Exception as e:
+        return resume_id, None, None, None, str(e)
+
+
+def _fetch(storage: PdfStorage, resume: Resume) -> Optional[bytes]:
+    try:
+        return storage.fetch(resume)
+    except Exception as e:
+        logger.warning("Could not fetch the PDF of resume %s: %s", resume.id, e)
+        return None
+
+
+# ------------------------------------------------------------------
+# Driver
+# ------------------------------------------------------------------
+def _load_state(engine, target: str, restart: bool, dry_run: bool = False) -> BackfillState:
+    with Session(engine) as session:
+        state = session.get(BackfillState, STATE_NAME)
+        if state is None or restart or state.target != target:
+            state = state or BackfillState(name=STATE_NAME, target=target)
+            state.target, state.last_id, state.processed = target, 0, 0
+            state.updated_at = datetime.utcnow()
+            if dry_run:
+                return state  # start over without resetting the stored checkpoint
+            session.add(state)
+            session.commit()
+            session.refresh(state)
+        session.expunge(state)
+        return state
+
+
+def _write_batch(engine, results, stale_by_id: Dict[int, List[str]], versions: Dict[str, str], last_id: int) -> Tuple[int, int]:
+    updated = failed = 0
+    versions_json = json.dumps(versions)
+    with Session(engine) as session:
+        reindex = []
+        refingerprint = []
+        # Net change of the dashboard counters: old values out, new values in
+        counts = Counter()
+        for resume_id, text, source, fields, error in results:
+            if error is not None:
+                failed += 1
+                logger.warning("Resume %s skipped: %s", resume_id, error)
+                continue
+            resume = session.get(Resume, resume_id)
+            if resume is None:
+                continue  # deleted meanwhile
+            stale = stale_by_id[resume_id]
+            counts.update(analytics.count([resume], sign=-1))
+            for name in stale:
+                for column, value in resume_columns(name, fields).items():
+                    setattr(resume, column, value)
+            counts.update(analytics.count([resume]))
+            session.add(resume)
+            if "skills" in stale:
+                reindex.append(resume)
+            if source is not None or {"email", "phone"} & set(stale):
+                refingerprint.append((resume, text))
+
+            stored = session.get(ResumeText, resume_id) or ResumeText(resume_id=resume_id, text=text)
+            if source is not None:
+                stored.text, stored.source = text, source
+            stored.versions = versions_json
+            stored.updated_at = datetime.utcnow()
+            session.add(stored)
+            updated += 1
+
+        if reindex:
+            session.flush()
+            index_resumes(session, reindex, replace=True)
+        if refingerprint:
+            session.flush()
+            dedup.register(session, [r for r, _ in refingerprint], [t for _, t in refingerprint], replace=True)
+        analytics.apply(session, counts)
+
+        state = session.get(BackfillState, STATE_NAME)
+        state.last_id = last_id
+        state.processed += len(results)
+        state.updated_at = datetime.utcnow()
+        session.add(state)
+        session.commit()
+    return updated, failed
+
+
+def run(engine, storage: PdfStorage, batch_size: int = REPARSE_BATCH_SIZE, workers: int = REPARSE_WORKERS,
+        restart: bool = False, dry_run: bool = False) -> Dict[str, Any]:
+    versions = parser.extractor_versions()
+    state = _load_state(engine, versions_fingerprint(versions), restart, dry_run)
+    last_id = state.last_id
+    totals = {"scanned": 0, "stale": 0, "updated": 0, "failed": 0, "fetched": 0, "extractors": {}}
+    if last_id:
+        print(f"Resuming after resume id {last_id} ({state.processed} already processed).")
+
+    ctx = multiprocessing.get_context(os.getenv("PARSE_POOL_START_METHOD", "spawn"))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker) as pool, \
+            ThreadPoolExecutor(max_workers=REPARSE_FETCH_THREADS) as fetchers:
+        while True:
+            with Session(engine) as session:
+                rows = session.exec(
+                    select(Resume, ResumeText)
+                    .join(ResumeText, ResumeText.resume_id == Resume.id, isouter=True)
+                    .where(Resume.id > last_id)
+                    .order_by(Resume.id)
+                    .limit(batch_size)
+                ).all()
+            if not rows:
+                break
+            batch_last_id = rows[-1][0].id
+            totals["scanned"] += len(rows)
+
+            work = [(resume, stored, stale_extractors(stored, versions)) for resume, stored in rows]
+            work = [w for w in work if w[2]]
+            totals["stale"] += len(work)
+            for _, _, stale in work:
+                for name in stale:
+                    totals["extractors"][name] = totals["extractors"].get(name, 0) + 1
+            if dry_run:
+                last_id = batch_last_id
+                continue
+
+            started = time.perf_counter()
+            need_pdf = [resume for resume, stored, _ in work if stored is None]
+            pdfs = dict(zip((r.id for r in need_pdf), fetchers.map(lambda r: _fetch(storage, r), need_pdf)))
+            totals["fetched"] += sum(1 for data in pdfs.values() if data is not None)
+
+            items = [(resume.id, stored.text if stored else None, pdfs.get(resume.id), stale) for resume, stored, stale in work]
+            chunksize = max(1, len(items) // (workers * 4))
+            results = list(pool.map(_reparse_one, items, chunksize=chunksize))
+
+            updated, failed = _write_batch(engine, results, {resume.id: stale for resume, _, stale in work}, versions, batch_last_id)
+            totals["updated"] += updated
+            totals["failed"] += failed
+            last_id = batch_last_id
+            print(f"Through resume id {last_id}: {updated} updated, {failed} failed, "
+                  f"{len(rows) - len(work)} up to date ({time.perf_counter() - started:.1f}s)")
+
+    if totals["updated"]:
+        # The running app only appends new rows to its match index; a new base segment replaces the stale vectors
+        started = time.perf_counter()
+        segment = match_index.rebuild(engine)
+        print(f"Match index rebuilt: {segment.n_docs} resumes ({time.perf_counter() - started:.1f}s)")
+    return totals
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--database-url", default=None, help="defaults to $DATABASE_URL")
+    ap.add_argument("--batch-size", type=int, default=REPARSE_BATCH_SIZE)
+    ap.add_argument("--workers", type=int, default=REPARSE_WORKERS)
+    ap.add_argument("--storage", default=None, help="cloudinary | local (defaults to $STORAGE_BACKEND)")
+    ap.add_argument("--restart", action="store_true", help="ignore the checkpoint and start from the first resume")
+    ap.add_argument("--dry-run", action="store_true", help="only count what would be re-run")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+    from database import DATABASE_URL, make_engine, create_db_and_tables
+    from storage import STORAGE_BACKEND
+    engine = make_engine(args.database_url or DATABASE_URL)
+    create_db_and_tables(engine)
+    summary = run(engine, get_storage(args.storage or STORAGE_BACKEND), args.batch_size, args.workers,
+                  restart=args.restart, dry_run=args.dry_run)
+    print(json.dumps(summary, indent=2))
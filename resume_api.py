@@ -0,0 +1,165 @@
+import os
+import zlib
+import hashlib
+import dataclasses
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+import brotli
+import orjson
+from sqlmodel import Session, select
+
+from models import Resume
+
+# ------------------------------------------------------------------
+# /api/v1 serialization: resume rows go straight from a select of the
+# requested columns into a slotted dataclass per field set, which orjson
+# encodes natively -- no model_dump() or dict per row. List and export
+# bodies are compressed with brotli or gzip, whichever the client
+# accepts (brotli preferred).
+# ------------------------------------------------------------------
+API_LIST_MAX = int(os.getenv("API_LIST_MAX", "200"))
+API_EXPORT_BATCH_SIZE = int(os.getenv("API_EXPORT_BATCH_SIZE", "1000"))
+API_COMPRESS_MIN_BYTES = int(os.getenv("API_COMPRESS_MIN_BYTES", "1024"))  # smaller bodies go out as-is
+API_GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "6"))
+API_BROTLI_QUALITY = int(os.getenv("API_BROTLI_QUALITY", "5"))  # 4-6 suit per-request compression
+
+# Public fields in output order; id is always included
+API_FIELDS = (
+    "id", "name", "email", "phone", "jobTitle", "age", "fullAddress", "city", "country", "profileDescription",
+    "education", "educationHistory", "yearsOfExp", "languages", "skills", "expectedSalary",
+    "linkedin", "github", "portfolio", "cv_url", "cv_download_url", "uploaded_at",
+)
+_FIELD_INDEX = {name: i for i, name in enumerate(API_FIELDS)}
+
+# Naive datetimes are UTC (datetime.utcnow()); say so in the output
+_DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """?fields=name,email -> the field set in API_FIELDS order. ValueError names unknown fields."""
+    if not fields:
+        return API_FIELDS
+    wanted = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = sorted(wanted - _FIELD_INDEX.keys())
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(API_FIELDS)}.")
+    wanted.add("id")
+    return tuple(sorted(wanted, key=_FIELD_INDEX.__getitem__))
+
+
+@lru_cache(maxsize=256)
+def _struct(fields: Tuple[str, ...]):
+    annotations = Resume.__annotations__
+    return dataclasses.make_dataclass(
+        "ResumeOut", [(f, annotations[f]) for f in fields], slots=True,
+    )
+
+
+def _columns(fields: Tuple[str, ...]):
+    return [getattr(Resume, f) for f in fields]
+
+
+def _records(rows, fields: Tuple[str, ...]) -> List[Any]:
+    struct = _struct(fields)
+    return [struct(*row) for row in rows]
+
+
+def get_one(session: Session, resume_id: int, fields: Tuple[str, ...]) -> Optional[Tuple[str, bytes]]:
+    """-> (etag, JSON body) of one resume, or None. The ETag is a hash of the body."""
+    row = session.exec(select(*_columns(fields)).where(Resume.id == resume_id)).first()
+    if row is None:
+        return None
+    body = orjson.dumps(_struct(fields)(*row), option=_DUMPS_OPTIONS)
+    return hashlib.sha1(body).hexdigest()[:20], body
+
+
+def list_page(session: Session, fields: Tuple[str, ...], limit: int, after_id: Optional[int] = None) -> bytes:
+    """Newest-first keyset page: {"resumes": [...], "next_after_id": id | null}."""
+    query = select(*_columns(fields))
+    if after_id is not None:
+        query = query.where(Resume.id < after_id)
+    rows = session.exec(query.order_by(Resume.id.desc()).limit(limit + 1)).all()
+    records = _records(rows[:limit], fields)
+    return orjson.dumps({
+        "resumes": records,
+        "next_after_id": records[-1].id if len(rows) > limit else None,
+    }, option=_DUMPS_OPTIONS)
+
+
+def export_lines(engine, fields: Tuple[str, ...], batch_size: int = API_EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """All resumes as NDJSON, oldest first, one chunk per batch; a short session per batch."""
+    struct = _struct(fields)
+    query = select(*_columns(fields)).order_by(Resume.id).limit(batch_size)
+    option = _DUMPS_OPTIONS | orjson.OPT_APPEND_NEWLINE
+    last_id = 0
+    while True:
+        with Session(engine) as session:
+            rows = session.exec(query.where(Resume.id > last_id)).all()
+        if not rows:
+            return
+        yield b"".join(orjson.dumps(struct(*row), option=option) for row in rows)
+        last_id = rows[-1][0]
+
+
+# ------------------------------------------------------------------
+# Content-Encoding negotiation
+# ------------------------------------------------------------------
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """-> "br", "gzip" or None, from an Accept-Encoding header (q=0 refuses a coding)."""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    best = None
+    for coding in ("br", "gzip"):
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (coding, q)
+    return best[0] if best else None
+
+
+class Compressor:
+    """Incremental brotli/gzip; each compress() flushes, so a streamed chunk reaches the client whole."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=API_BROTLI_QUALITY)
+        else:
+            self._gz = zlib.compressobj(API_GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._br.finish() if self.encoding == "br" else self._gz.flush(zlib.Z_FINISH)
+
+
+def compress(body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """-> (body, Content-Encoding). Bodies under API_COMPRESS_MIN_BYTES are left alone."""
+    if encoding is None or len(body) < API_COMPRESS_MIN_BYTES:
+        return body, None
+    if encoding == "br":
+        return brotli.compress(body, quality=API_BROTLI_QUALITY), encoding
+    gz = zlib.compressobj(API_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return gz.compress(body) + gz.flush(), encoding
+
+
+def compress_stream(chunks: Iterator[bytes], encoding: Optional[str]) -> Iterator[bytes]:
+    if encoding is None:
+        yield from chunks
+        return
+    compressor = Compressor(encoding)
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.finish()
@@ -0,0 +1,90 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from sqlmodel import Session, select
+
+from models import Resume
+
+# ------------------------------------------------------------------
+# Resume detail payloads for the dashboard modal, serialized once and
+# cached per id. Entries expire after DETAILS_CACHE_TTL seconds, so edits
+# made by other processes (reparse.py, other workers) show up within that.
+# The TTL is the only invalidation: those writers can't reach this cache.
+# ------------------------------------------------------------------
+DETAILS_CACHE_ITEMS = int(os.getenv("DETAILS_CACHE_ITEMS", "2048"))
+DETAILS_CACHE_TTL = float(os.getenv("DETAILS_CACHE_TTL", "60"))
+
+DETAIL_FIELDS = (
+    "name", "email", "phone", "jobTitle", "age", "fullAddress", "city", "country", "languages", "skills",
+    "expectedSalary", "education", "yearsOfExp", "educationHistory", "linkedin", "github", "portfolio",
+)
+_COLUMNS = [Resume.id] + [getattr(Resume, f) for f in DETAIL_FIELDS]
+
+
+def serialize(row) -> Tuple[str, bytes]:
+    """-> (etag, JSON body). The ETag is a hash of the body."""
+    body = json.dumps({f: getattr(row, f) for f in DETAIL_FIELDS}, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(body).hexdigest()[:20], body
+
+
+class DetailsCache:
+    """LRU of serialized details keyed by resume id, with a per-entry TTL."""
+
+    def __init__(self, engine, max_items: int = DETAILS_CACHE_ITEMS, ttl: float = DETAILS_CACHE_TTL):
+        self.engine = engine
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items: "OrderedDict[int, Tuple[float, str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, Tuple[str, bytes]]:
+        """{id: (etag, body)} for the ids that exist; misses are loaded in one query."""
+        ids = list(dict.fromkeys(ids))
+        found: Dict[int, Tuple[str, bytes]] = {}
+        now = time.monotonic()
+        with self._lock:
+            for resume_id in ids:
+                entry = self._items.get(resume_id)
+                if entry is not None and entry[0] > now:
+                    self._items.move_to_end(resume_id)
+                    found[resume_id] = entry[1:]
+            self.hits += len(found)
+            self.misses += len(ids) - len(found)
+
+        missing = [i for i in ids if i not in found]
+        if missing:
+            with Session(self.engine) as session:
+                rows = session.exec(select(*_COLUMNS).where(Resume.id.in_(missing))).all()
+            loaded = {row.id: serialize(row) for row in rows}
+            expires = time.monotonic() + self.ttl
+            with self._lock:
+                for resume_id, (etag, body) in loaded.items():
+                    self._items[resume_id] = (expires, etag, body)
+                    self._items.move_to_end(resume_id)
+                while len(self._items) > self.max_items:
+                    self._items.popitem(last=False)
+            found.update(loaded)
+        return found
+
+    def get(self, resume_id: int):
+        return self.get_many([resume_id]).get(resume_id)
+
+    def stats(self):
+        with self._lock:
+            return {"items": len(self._items), "hits": self.hits, "misses": self.misses, "ttl_seconds": self.ttl}
+
+
+def batch_body(ids: List[int], found: Dict[int, Tuple[str, bytes]]) -> Tuple[str, bytes]:
+    """-> (etag, body) of {"resumes": {id: details}, "missing": [...]}, built from the cached bodies."""
+    present = [i for i in ids if i in found]
+    parts = b",".join(b'"%d":%s' % (i, found[i][1]) for i in present)
+    missing = json.dumps([i for i in ids if i not in found]).encode()
+    etag = hashlib.sha1("".join(f"{i}:{found[i][0]};" for i in present).encode() + missing).hexdigest()[:20]
+    return etag, b'{"resumes":{' + parts + b'},"missing":' + missing + b"}"
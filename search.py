@@ -0,0 +1,100 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+# ------------------------------------------------------------------
+# Full-text search over resumes: an external-content FTS5 table on top
+# of `resume`, kept in sync by triggers so every insert path (single,
+# batch, jobs, backfills) is covered without application code.
+# ------------------------------------------------------------------
+FTS_COLUMNS = ("name", "skills", "jobTitle", "education", "city")
+# bm25 weights, same order as FTS_COLUMNS
+FTS_WEIGHTS = (10.0, 5.0, 3.0, 1.0, 2.0)
+
+_QUERY_TERM_RE = re.compile(r"[\w.+#-]+", re.UNICODE)
+
+_cols = ", ".join(FTS_COLUMNS)
+_new = ", ".join(f'new."{c}"' for c in FTS_COLUMNS)
+_old = ", ".join(f'old."{c}"' for c in FTS_COLUMNS)
+_watched = ", ".join(f'"{c}"' for c in FTS_COLUMNS)
+
+FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+        {_cols}, content='resume', content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2 tokenchars '+#'"
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS resume_fts_ai AFTER INSERT ON resume BEGIN
+        INSERT INTO resume_fts(rowid, {_cols}) VALUES (new.id, {_new});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS resume_fts_ad AFTER DELETE ON resume BEGIN
+        INSERT INTO resume_fts(resume_fts, rowid, {_cols}) VALUES ('delete', old.id, {_old});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS resume_fts_au AFTER UPDATE OF {_watched} ON resume BEGIN
+        INSERT INTO resume_fts(resume_fts, rowid, {_cols}) VALUES ('delete', old.id, {_old});
+        INSERT INTO resume_fts(rowid, {_cols}) VALUES (new.id, {_new});
+    END""",
+]
+
+
+def ensure_fts(engine):
+    """Create the FTS table and triggers (SQLite only); index existing rows on first run."""
+    if engine.dialect.name != "sqlite":
+        return False
+    with engine.begin() as conn:
+        existed = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'resume_fts'")).first() is not None
+        for ddl in FTS_DDL:
+            conn.execute(text(ddl))
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        conn.execute(text(f"INSERT INTO resume_fts(resume_fts, rank) VALUES ('rank', 'bm25({weights})')"))
+        if not existed:
+            conn.execute(text("INSERT INTO resume_fts(resume_fts) VALUES ('rebuild')"))
+    return True
+
+
+def to_fts_query(q: str) -> str:
+    """Turn free text into a safe FTS5 query: every term quoted, prefix-matched, AND-ed."""
+    terms = _QUERY_TERM_RE.findall(q.lower())
+    return " ".join('"' + t.replace('"', '""') + '"*' for t in terms)
+
+
+def encode_cursor(score: float, resume_id: int) -> str:
+    return f"{score!r}:{resume_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    score, resume_id = cursor.rsplit(":", 1)
+    return float(score), int(resume_id)
+
+
+def search_resumes(conn, q: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Ranked search with keyset pagination on (rank, id): each page continues
+    strictly after the last row of the previous one, so deep pages cost the
+    same as the first.
+    """
+    match = to_fts_query(q)
+    if not match:
+        return {"results": [], "next_cursor": None}
+
+    params: Dict[str, Any] = {"match": match, "limit": limit + 1}
+    after = ""
+    if cursor:
+        params["after_score"], params["after_id"] = decode_cursor(cursor)
+        after = "AND (resume_fts.rank > :after_score OR (resume_fts.rank = :after_score AND resume_fts.rowid > :after_id))"
+
+    rows = conn.execute(text(f"""
+        SELECT r.id, r.name, r.email, r."jobTitle", r.skills, r.city, resume_fts.rank AS score
+        FROM resume_fts JOIN resume r ON r.id = resume_fts.rowid
+        WHERE resume_fts MATCH :match {after}
+        ORDER BY resume_fts.rank, resume_fts.rowid
+        LIMIT :limit
+    """), params).all()
+
+    results: List[Dict[str, Any]] = [
+        {"id": r.id, "name": r.name, "email": r.email, "jobTitle": r.jobTitle,
+         "skills": r.skills, "city": r.city, "score": r.score}
+        for r in rows[:limit]
+    ]
+    next_cursor = encode_cursor(results[-1]["score"], results[-1]["id"]) if len(rows) > limit else None
+    return {"results": results, "next_cursor": next_cursor}
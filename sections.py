@@ -0,0 +1,96 @@
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ------------------------------------------------------------------
+# Section segmentation: split resume text once into labeled blocks by
+# spotting heading lines ("EDUCATION", "Work Experience", "Skills:"), so
+# each extractor reads only the part of the resume it cares about.
+# Lines before the first heading are the "header" (name, title, contact).
+# ------------------------------------------------------------------
+HEADER = "header"
+
+SECTION_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    "contact": ("contact", "contacts", "contact details", "contact information", "contact info",
+                "personal details", "personal information", "personal info", "personal profile", "social links"),
+    "summary": ("summary", "profile", "profile summary", "professional summary", "career summary",
+                "objective", "career objective", "about", "about me"),
+    "education": ("education", "education history", "educational background", "educational qualification",
+                  "educational qualifications", "academic background", "academic details", "academics",
+                  "academic qualifications", "qualifications", "education and training"),
+    "experience": ("experience", "work experience", "professional experience", "work history",
+                   "employment", "employment history", "internship", "internships", "internship experience",
+                   "experience and internships"),
+    "skills": ("skills", "technical skills", "key skills", "core skills", "soft skills", "skill set",
+               "skills and tools", "skills and abilities", "core competencies", "technologies", "tools",
+               "tools and technologies", "technical proficiency"),
+    "projects": ("projects", "project", "academic projects", "personal projects", "key projects", "project work"),
+    "awards": ("awards", "achievements", "awards and achievements", "achievements and awards", "honors",
+               "honours", "honors and awards", "accomplishments", "certifications", "certificates",
+               "certifications and achievements"),
+    "languages": ("languages", "languages known", "language proficiency"),
+    "other": ("hobbies", "interests", "hobbies and interests", "extracurricular activities",
+              "extra curricular activities", "activities", "volunteering", "references", "declaration"),
+}
+_HEADING_LABELS = {phrase: label for label, phrases in SECTION_HEADINGS.items() for phrase in phrases}
+_MAX_HEADING_CHARS = 48
+
+_DECORATION = "•·-–*#:|_=>■▪●◆ \t"
+_NON_LETTERS_RE = re.compile(r"[^a-z ]+")
+# "Expected Salary: 40k" -- a label line that ends an inline "Skills: ..." section
+_KEY_VALUE_RE = re.compile(r"^[A-Za-z][A-Za-z .]{0,24}:")
+
+Block = Tuple[str, List[str]]
+
+
+def _heading_key(text: str) -> str:
+    text = _NON_LETTERS_RE.sub(" ", text.lower().replace("&", " and "))
+    return " ".join(text.split())
+
+
+def heading_of(line: str) -> Optional[Tuple[str, str]]:
+    """-> (label, text after the heading) if the line is a section heading, else None."""
+    stripped = line.strip().strip(_DECORATION)
+    if not stripped:
+        return None
+    name, colon, rest = stripped.partition(":")
+    if len(name) > _MAX_HEADING_CHARS:
+        return None
+    label = _HEADING_LABELS.get(_heading_key(name))
+    if label is None:
+        return None
+    return label, rest.strip() if colon else ""
+
+
+def segment(lines: Sequence[str]) -> List[Block]:
+    """
+    -> [(label, lines)] in document order. A label may occur more than once
+    ("Technical Skills" and "Soft Skills"). An inline heading ("Skills: a, b")
+    holds its own text and any unlabelled lines after it; the next
+    "Key: value" line starts an "other" block.
+    """
+    blocks: List[Block] = [(HEADER, [])]
+    inline = False
+    for line in lines:
+        found = heading_of(line)
+        if found is not None:
+            label, rest = found
+            blocks.append((label, [rest] if rest else []))
+            inline = bool(rest)
+        elif inline and _KEY_VALUE_RE.match(line.strip()):
+            blocks.append(("other", [line]))
+        else:
+            blocks[-1][1].append(line)
+    return [(label, body) for label, body in blocks if label != HEADER or any(s.strip() for s in body)]
+
+
+if __name__ == "__main__":
+    # python sections.py resume.pdf ... -- print the blocks found in each PDF
+    import pdf_text
+
+    for path in sys.argv[1:]:
+        print(f"== {path}")
+        for label, body in segment(pdf_text.extract(path).text.split("\n")):
+            content = [line.strip() for line in body if line.strip()]
+            preview = " / ".join(content)[:100]
+            print(f"  {label:<11} {len(content):>3} lines  {preview}")
@@ -0,0 +1,175 @@
+import argparse
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, event, func as sa_func, delete, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from models import Resume, ResumeSkill, Skill
+from parser import SKILLS
+
+# ------------------------------------------------------------------
+# Normalized resume <-> skill index, so skill queries are index lookups
+# instead of LIKE scans over the comma-joined Resume.skills column.
+# Skills are stored as their canonical name ("gcp" -> "google cloud").
+# ------------------------------------------------------------------
+_skill_ids: Dict[str, int] = {}
+_skill_ids_lock = threading.Lock()
+_PENDING = "skill_index.created_ids"  # session.info key: skills created by the open transaction
+
+
+def split_skills(skills: Optional[str]) -> List[str]:
+    """Comma-joined skills -> distinct canonical names under the current taxonomy."""
+    taxonomy = SKILLS.current()
+    return list(dict.fromkeys(s for s in (taxonomy.canonical(p) for p in (skills or "").split(",")) if s))
+
+
+def _skill_id_map(session: Session, names: Iterable[str], create: bool) -> Dict[str, int]:
+    names = list(dict.fromkeys(names))
+    with _skill_ids_lock:
+        found = {n: _skill_ids[n] for n in names if n in _skill_ids}
+    missing = [n for n in names if n not in found]
+    if missing:
+        # Skills created by this transaction are cached only once it commits: a rolled-back
+        # row's id can be reused for another name. Anything else read here is committed.
+        pending = session.info.setdefault(_PENDING, {})
+        selected = {}
+        for skill_id, name in session.exec(select(Skill.id, Skill.name).where(Skill.name.in_(missing))).all():
+            found[name] = skill_id
+            if name not in pending:
+                selected[name] = skill_id
+        if create:
+            for name in missing:
+                if name not in found:
+                    found[name] = pending[name] = _create_skill(session, name)
+        with _skill_ids_lock:
+            _skill_ids.update(selected)
+    return found
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_ids(session):
+    if session.in_nested_transaction():
+        return  # a savepoint released (also reported as a commit); the transaction is still open
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        with _skill_ids_lock:
+            _skill_ids.update(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted_ids(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING, None)
+
+
+def _create_skill(session: Session, name: str) -> int:
+    # Savepoint, so losing a race with another writer doesn't abort the caller's transaction
+    try:
+        with session.begin_nested():
+            skill = Skill(name=name)
+            session.add(skill)
+        return skill.id
+    except IntegrityError:
+        return session.exec(select(Skill.id).where(Skill.name == name)).one()
+
+
+def index_resumes(session: Session, resumes: Iterable[Resume], replace: bool = False):
+    """Write resume_skill rows for flushed Resume objects (same transaction as the caller)."""
+    rows = []
+    resumes = list(resumes)
+    if replace and resumes:
+        session.exec(delete(ResumeSkill).where(ResumeSkill.resume_id.in_([r.id for r in resumes])))
+    per_resume = [(r.id, split_skills(r.skills)) for r in resumes]
+    ids = _skill_id_map(session, (s for _, names in per_resume for s in names), create=True)
+    for resume_id, names in per_resume:
+        rows.extend({"skill_id": ids[n], "resume_id": resume_id} for n in names)
+    if rows:
+        session.exec(insert(ResumeSkill), params=rows)
+
+
+def backfill(engine, batch_size: int = 1000) -> int:
+    """Index resumes that have skills but no resume_skill rows yet. Returns rows indexed."""
+    done = 0
+    last_id = 0
+    while True:
+        with Session(engine) as session:
+            indexed = select(ResumeSkill.resume_id).where(ResumeSkill.resume_id == Resume.id).exists()
+            batch = session.exec(
+                select(Resume).where(Resume.id > last_id, Resume.skills != None, Resume.skills != "", ~indexed)  # noqa: E711
+                .order_by(Resume.id).limit(batch_size)
+            ).all()
+            if not batch:
+                return done
+            index_resumes(session, batch)
+            session.commit()
+            last_id = batch[-1].id
+            done += len(batch)
+
+
+def _resume_skills(group: Dict[int, int]):
+    """Distinct (resume_id, skill) pairs, where skill is the index in group of the requested skill."""
+    skill = case(group, value=ResumeSkill.skill_id).label("skill")
+    return (select(ResumeSkill.resume_id, skill).where(ResumeSkill.skill_id.in_(list(group)))
+            .distinct().subquery())
+
+
+def _skill_counts(session: Session, group: Dict[int, int], wanted: List[str]) -> Dict[str, int]:
+    per_skill = _resume_skills(group)
+    rows = session.exec(select(per_skill.c.skill, sa_func.count()).group_by(per_skill.c.skill)).all()
+    return {wanted[i]: n for i, n in rows}
+
+
+def find_candidates(session: Session, skills: List[str], match: str = "all",
+                    limit: int = 20, after_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Resumes having all (or any) of ``skills``, newest first, keyset-paginated
+    on id. Also returns how many resumes have each requested skill.
+    """
+    taxonomy = SKILLS.current()
+    wanted = list(dict.fromkeys(taxonomy.canonical(s) for s in skills if s.strip()))
+    # Rows indexed before an alias was added still hold the alias ("gcp"): look those up too
+    forms = [taxonomy.forms(name) for name in wanted]
+    ids = _skill_id_map(session, (f for names in forms for f in names), create=False)
+    group = {ids[f]: i for i, names in enumerate(forms) for f in names if f in ids}
+    counts = dict.fromkeys(wanted, 0)
+
+    if group:
+        counts.update(_skill_counts(session, group, wanted))
+
+    found = len(set(group.values()))
+    if not found or (match == "all" and found < len(wanted)):
+        return {"skills": counts, "total": 0, "results": [], "next_after_id": None}
+
+    per_skill = _resume_skills(group)
+    matched = sa_func.count().label("matched")
+    hits = select(per_skill.c.resume_id, matched).group_by(per_skill.c.resume_id)
+    if match == "all":
+        hits = hits.having(matched == len(wanted))
+    hits = hits.subquery()
+
+    total = session.exec(select(sa_func.count()).select_from(hits)).one()
+    page = select(Resume.id, Resume.name, Resume.email, Resume.jobTitle, Resume.skills, hits.c.matched).join(hits, hits.c.resume_id == Resume.id)
+    if after_id is not None:
+        page = page.where(Resume.id < after_id)
+    rows = session.exec(page.order_by(Resume.id.desc()).limit(limit + 1)).all()
+
+    results = [
+        {"id": r.id, "name": r.name, "email": r.email, "jobTitle": r.jobTitle, "skills": r.skills, "matched": r.matched}
+        for r in rows[:limit]
+    ]
+    next_after_id = results[-1]["id"] if len(rows) > limit else None
+    return {"skills": counts, "total": total, "results": results, "next_after_id": next_after_id}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Backfill the resume_skill index for existing resumes.")
+    ap.add_argument("--database-url", default=None, help="defaults to $DATABASE_URL")
+    ap.add_argument("--batch-size", type=int, default=1000)
+    args = ap.parse_args()
+
+    from database import DATABASE_URL, make_engine, create_db_and_tables
+    engine = make_engine(args.database_url or DATABASE_URL)
+    create_db_and_tables(engine)
+    print(f"Indexed {backfill(engine, args.batch_size)} resumes.")
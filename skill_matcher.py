@@ -0,0 +1,163 @@
+import re
+import difflib
+from collections import defaultdict, deque
+from functools import lru_cache
+
+
+# Characters that glue onto a skill name ("c++", "c#"), so a skill only
+# counts as an exact hit when it is not followed/preceded by one of these.
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Same tokenizer the old per-token difflib scan used, kept for the fuzzy tier
+_TOKEN_RE = re.compile(r"\b\w+(?:\.\w+)?\b")
+
+
+def normalize_text(text):
+    return _WHITESPACE_RE.sub(" ", text.lower()).strip()
+
+
+def _bigrams(word):
+    return {word[i:i + 2] for i in range(len(word) - 1)}
+
+
+class SkillMatcher:
+    """
+    Skill matcher compiled once from the skills list.
+
+    Exact tier: an Aho-Corasick automaton over the normalized skill names
+    and their aliases, so single- and multi-word skills ("machine learning",
+    "node.js", "c++") are found in one pass over the text. An alias is
+    reported as its canonical skill ("js" -> "javascript").
+
+    Fuzzy tier: tokens that are not skills themselves are looked up in a
+    character-bigram index restricted to skills of compatible length and
+    verified with difflib (same 0.85 cutoff as before). Lookups are memoized
+    per token, so common words cost a dict hit after the first resume.
+    """
+
+    def __init__(self, skills, stopwords=(), aliases=None, fuzzy_cutoff=0.85, fuzzy_cache_size=50_000):
+        self.skills = tuple(dict.fromkeys(normalize_text(s) for s in skills if s and s.strip()))
+        # Every surface form (skill or alias) -> the canonical skill it stands for
+        canonical = {skill: skill for skill in self.skills}
+        for alias, skill in (aliases or {}).items():
+            canonical.setdefault(normalize_text(alias), normalize_text(skill))
+        self._canonical = canonical
+        self.forms = tuple(canonical)
+        self.skill_set = frozenset(self.forms)
+        self.stopwords = frozenset(stopwords)
+        self.fuzzy_cutoff = fuzzy_cutoff
+
+        self._build_automaton()
+        self._build_fuzzy_index()
+        self._fuzzy_lookup = lru_cache(maxsize=fuzzy_cache_size)(self._closest_skill)
+
+    # ------------------------------------------------------------------
+    # Exact tier
+    # ------------------------------------------------------------------
+    def _build_automaton(self):
+        goto = [{}]
+        outputs = [[]]
+        for skill in self.forms:
+            node = 0
+            for ch in skill:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(skill)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fallback = goto[f].get(ch, 0)
+                fail[nxt] = fallback if fallback != nxt else 0
+                outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _exact_matches(self, text):
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = {}
+        node = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not outputs[node]:
+                continue
+            if i < last and text[i + 1] in _WORD_CHARS:
+                continue
+            for skill in outputs[node]:
+                start = i - len(skill) + 1
+                if start > 0 and text[start - 1] in _WORD_CHARS:
+                    continue
+                found.setdefault(self._canonical[skill], start)
+        return found
+
+    # ------------------------------------------------------------------
+    # Fuzzy tier
+    # ------------------------------------------------------------------
+    def _build_fuzzy_index(self):
+        index = defaultdict(set)
+        for skill in self.forms:
+            for gram in _bigrams(skill):
+                index[gram].add(skill)
+        self._bigram_index = {gram: frozenset(s) for gram, s in index.items()}
+
+    def _closest_skill(self, token):
+        # difflib's ratio is 2*M / (len(a) + len(b)), so a candidate can only
+        # reach the cutoff when the lengths are close; any string pair that
+        # does reach it (and has len(a) + len(b) >= 4) shares a bigram.
+        cutoff = self.fuzzy_cutoff
+        candidates = set()
+        for gram in _bigrams(token):
+            candidates.update(self._bigram_index.get(gram, ()))
+
+        n = len(token)
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(token)
+        best = None
+        for skill in candidates:
+            m = len(skill)
+            if 2.0 * min(n, m) / (n + m) < cutoff:
+                continue
+            matcher.set_seq1(skill)
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            score = matcher.ratio()
+            if score >= cutoff and (best is None or (score, skill) > best):
+                best = (score, skill)
+        return best[1] if best else None
+
+    def _fuzzy_matches(self, text, found):
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            if len(token) < 3 or token in self.skill_set or token in self.stopwords:
+                continue
+            skill = self._fuzzy_lookup(token)
+            if skill:
+                found.setdefault(self._canonical[skill], match.start())
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def match(self, text, fuzzy=True):
+        """Return the skills found in ``text``, ordered by first occurrence."""
+        text = normalize_text(text)
+        found = self._exact_matches(text)
+        if fuzzy:
+            self._fuzzy_matches(text, found)
+        return sorted(found, key=found.get)
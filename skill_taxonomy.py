@@ -0,0 +1,181 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from skill_matcher import SkillMatcher, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# Skills taxonomy (skills_db.txt): canonical skills, their aliases and
+# categories, compiled into one read-only SkillTaxonomy. Edits to the file
+# are picked up by every process (including parse pool workers) within
+# SKILLS_RELOAD_CHECK_SECONDS (0 = only on POST /admin/skills/reload).
+# ------------------------------------------------------------------
+SKILLS_DB_PATH = os.getenv("SKILLS_DB_PATH", "skills_db.txt")
+SKILLS_RELOAD_CHECK_SECONDS = float(os.getenv("SKILLS_RELOAD_CHECK_SECONDS", "5"))
+
+DEFAULT_SKILLS = [
+    "python", "java", "sql", "excel", "communication", "leadership",
+    "machine learning", "data analysis", "project management", "react", "node.js"
+]
+
+
+class TaxonomyError(ValueError):
+    pass
+
+
+def parse_taxonomy(lines: Iterable[str]) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """-> (skills, alias -> skill, skill -> category), all normalized."""
+    skills: List[str] = []
+    aliases: Dict[str, str] = {}
+    categories: Dict[str, str] = {}
+    category = None
+    for lineno, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            category = line[1:-1].strip() or None
+            continue
+        name, _, alias_part = line.partition("=")
+        skill = normalize_text(name)
+        if not skill:
+            raise TaxonomyError(f"line {lineno}: missing skill name before '='")
+        if skill in skills:
+            logger.warning("skills taxonomy line %d: duplicate skill %r ignored", lineno, skill)
+            continue
+        if skill in aliases:
+            raise TaxonomyError(f"line {lineno}: {skill!r} is already an alias of {aliases[skill]!r}")
+        skills.append(skill)
+        if category:
+            categories[skill] = category
+        for alias in (normalize_text(a) for a in alias_part.split(",")):
+            if not alias or alias == skill:
+                continue
+            if alias in aliases or alias in skills:
+                raise TaxonomyError(f"line {lineno}: alias {alias!r} is already used")
+            aliases[alias] = skill
+    clash = [a for a in aliases if a in skills]
+    if clash:
+        raise TaxonomyError(f"aliases also listed as skills: {', '.join(clash)}")
+    return skills, aliases, categories
+
+
+class SkillTaxonomy:
+    """One compiled version of the taxonomy. Never mutated: reloads build a new one."""
+
+    def __init__(self, skills: Iterable[str], aliases: Mapping[str, str], categories: Mapping[str, str],
+                 stopwords=(), fingerprint: str = ""):
+        self.skills: Tuple[str, ...] = tuple(skills)
+        self.aliases: Mapping[str, str] = MappingProxyType(dict(aliases))
+        self.categories: Mapping[str, str] = MappingProxyType(dict(categories))
+        self.fingerprint = fingerprint
+        self._forms: Dict[str, List[str]] = {}
+        for alias, skill in self.aliases.items():
+            self._forms.setdefault(skill, [skill]).append(alias)
+        self.matcher = SkillMatcher(self.skills, stopwords=stopwords, aliases=self.aliases)
+
+    def match(self, text: str) -> List[str]:
+        return self.matcher.match(text)
+
+    def canonical(self, name: str) -> str:
+        name = normalize_text(name)
+        return self.aliases.get(name, name)
+
+    def forms(self, name: str) -> List[str]:
+        """The canonical skill of ``name`` followed by all its aliases."""
+        name = self.canonical(name)
+        return self._forms.get(name, [name])
+
+    def categories_for(self, skills: Iterable[str]) -> List[str]:
+        return list(dict.fromkeys(self.categories[s] for s in skills if s in self.categories))
+
+
+def load_taxonomy(path: str = SKILLS_DB_PATH, stopwords=()) -> SkillTaxonomy:
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    skills, aliases, categories = parse_taxonomy(content.splitlines())
+    fingerprint = hashlib.sha1(content.encode("utf-8")).hexdigest()[:10]
+    return SkillTaxonomy(skills, aliases, categories, stopwords, fingerprint)
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class TaxonomyStore:
+    """
+    Holds the current SkillTaxonomy. Readers take ``current()`` once per
+    parse and keep using that object, so a reload (a plain reference swap)
+    never blocks or changes an in-flight parse. At most one thread rebuilds
+    at a time; the others carry on with the old taxonomy meanwhile.
+    """
+
+    def __init__(self, path: str = SKILLS_DB_PATH, stopwords=(), check_seconds: float = SKILLS_RELOAD_CHECK_SECONDS):
+        self.path = path
+        self.stopwords = frozenset(stopwords)
+        self.check_seconds = check_seconds
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[[SkillTaxonomy], None]] = []
+        self._stamp = _file_stamp(path)
+        try:
+            self._current = load_taxonomy(path, self.stopwords)
+        except FileNotFoundError:
+            logger.warning("%s not found. Falling back to default.", path)
+            self._current = SkillTaxonomy(DEFAULT_SKILLS, {}, {}, self.stopwords, "default")
+        self._next_check = time.monotonic() + check_seconds
+
+    def current(self) -> SkillTaxonomy:
+        if self.check_seconds > 0 and time.monotonic() >= self._next_check:
+            self._check_file()
+        return self._current
+
+    def on_reload(self, callback: Callable[[SkillTaxonomy], None]):
+        self._listeners.append(callback)
+
+    def _check_file(self):
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.check_seconds
+            stamp = _file_stamp(self.path)
+            if stamp is None or stamp == self._stamp:
+                return
+            try:
+                self._swap(load_taxonomy(self.path, self.stopwords), stamp)
+            except (OSError, TaxonomyError) as e:
+                # Half-written or invalid file: keep serving the current taxonomy
+                logger.warning("Skills taxonomy not reloaded from %s: %s", self.path, e)
+                self._stamp = stamp
+        finally:
+            self._reload_lock.release()
+
+    def reload(self) -> SkillTaxonomy:
+        """Rebuild from the file now. Raises on a missing or invalid file."""
+        with self._reload_lock:
+            stamp = _file_stamp(self.path)
+            self._swap(load_taxonomy(self.path, self.stopwords), stamp)
+            self._next_check = time.monotonic() + self.check_seconds
+            return self._current
+
+    def _swap(self, taxonomy: SkillTaxonomy, stamp):
+        self._stamp = stamp
+        if taxonomy.fingerprint == self._current.fingerprint:
+            return
+        self._current = taxonomy
+        logger.info("Skills taxonomy %s loaded: %d skills, %d aliases",
+                    taxonomy.fingerprint, len(taxonomy.skills), len(taxonomy.aliases))
+        for callback in self._listeners:
+            try:
+                callback(taxonomy)
+            except Exception:
+                logger.exception("Skills taxonomy reload listener failed")
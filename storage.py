@@ -0,0 +1,58 @@
+import os
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from models import Resume
+
+# ------------------------------------------------------------------
+# Where the original PDFs can be fetched back from. Uploads are not kept
+# on local disk, so re-processing old resumes reads them from here.
+#   STORAGE_BACKEND=cloudinary   download Resume.cv_url (default)
+#   STORAGE_BACKEND=local        STORAGE_LOCAL_DIR/<public_id>.pdf, a local
+#                                copy of the Cloudinary folder (the app
+#                                itself only ever writes to Cloudinary)
+# ------------------------------------------------------------------
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "cloudinary")
+STORAGE_LOCAL_DIR = os.getenv("STORAGE_LOCAL_DIR", "storage")
+STORAGE_TIMEOUT_SECONDS = float(os.getenv("STORAGE_TIMEOUT_SECONDS", "30"))
+
+
+class PdfStorage(ABC):
+    @abstractmethod
+    def fetch(self, resume: Resume) -> Optional[bytes]:
+        """Original PDF bytes for the resume, or None if they are not available."""
+
+
+class CloudinaryStorage(PdfStorage):
+    def fetch(self, resume: Resume) -> Optional[bytes]:
+        if not resume.cv_url:
+            return None
+        with urllib.request.urlopen(resume.cv_url, timeout=STORAGE_TIMEOUT_SECONDS) as response:
+            return response.read()
+
+
+class LocalStorage(PdfStorage):
+    def __init__(self, root: str = STORAGE_LOCAL_DIR):
+        self.root = root
+
+    def _path(self, public_id: str) -> str:
+        # public_id keeps Cloudinary's folder prefix ("resumes/...")
+        return os.path.join(self.root, *public_id.split("/")) + ".pdf"
+
+    def fetch(self, resume: Resume) -> Optional[bytes]:
+        if not resume.public_id:
+            return None
+        try:
+            with open(self._path(resume.public_id), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+def get_storage(name: str = STORAGE_BACKEND) -> PdfStorage:
+    if name == "cloudinary":
+        return CloudinaryStorage()
+    if name == "local":
+        return LocalStorage()
+    raise ValueError(f"Unknown STORAGE_BACKEND {name!r}; expected cloudinary or local")
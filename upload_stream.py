@@ -0,0 +1,97 @@
+import os
+import io
+import hashlib
+import zipfile
+from typing import List, Tuple
+
+from fastapi import UploadFile
+
+# ------------------------------------------------------------------
+# In-memory upload handling: read each PDF once, hash it while reading,
+# and hand the same immutable bytes to Cloudinary and pdfminer.
+# ------------------------------------------------------------------
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+MAX_BATCH_BYTES = int(os.getenv("MAX_BATCH_BYTES", str(200 * 1024 * 1024)))
+CHUNK_SIZE = 64 * 1024
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+
+
+class UploadRejected(Exception):
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def is_zip(head: bytes) -> bool:
+    return head[:4] == ZIP_MAGIC
+
+
+def is_pdf(head: bytes) -> bool:
+    # The PDF header must appear within the first 1024 bytes (a stored PDF
+    # inside a zip would also match that, hence the zip check)
+    return PDF_MAGIC in head[:1024] and not is_zip(head)
+
+
+def as_file(data: bytes) -> io.BytesIO:
+    # BytesIO over an immutable bytes object shares the buffer (no copy) until written to
+    return io.BytesIO(data)
+
+
+async def read_upload(upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[bytes, str]:
+    """Read an UploadFile into memory, enforcing ``max_bytes``. Returns (bytes, sha256 hex)."""
+    chunks = []
+    size = 0
+    digest = hashlib.sha256()
+    while True:
+        chunk = await upload.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadRejected(f"File exceeds the {max_bytes // (1024 * 1024)} MB limit.", status_code=413)
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+async def read_pdf_upload(upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[bytes, str]:
+    data, digest = await read_upload(upload, max_bytes)
+    if not is_pdf(data):
+        raise UploadRejected("Please upload a valid PDF file.")
+    return data, digest
+
+
+def read_zip_pdfs(data: bytes, max_files: int, max_total_bytes: int,
+                  max_bytes: int = MAX_UPLOAD_BYTES) -> List[Tuple[str, bytes, str]]:
+    """
+    Extract the PDF members of a zip archive as (filename, bytes, sha256 hex).
+    At most ``max_files`` members and ``max_total_bytes`` decompressed in all;
+    reading stops as soon as either is exceeded (zip bombs).
+    """
+    found = []
+    remaining = max_total_bytes
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        members = [m for m in archive.infolist() if not m.is_dir()]
+        if len(members) > max_files:
+            raise UploadRejected(f"At most {max_files} PDFs per batch.", status_code=413)
+        if sum(m.file_size for m in members) > max_total_bytes:
+            raise UploadRejected(f"Batch exceeds the {max_total_bytes // (1024 * 1024)} MB limit.", status_code=413)
+        for member in members:
+            if member.file_size > max_bytes:
+                raise UploadRejected(f"{member.filename} exceeds the {max_bytes // (1024 * 1024)} MB limit.", status_code=413)
+            if member.file_size > remaining:
+                raise UploadRejected(f"Batch exceeds the {max_total_bytes // (1024 * 1024)} MB limit.", status_code=413)
+            with archive.open(member) as src:
+                # Don't trust the declared size: read at most one byte past either limit
+                content = src.read(min(max_bytes, remaining) + 1)
+            if len(content) > max_bytes:
+                raise UploadRejected(f"{member.filename} exceeds the {max_bytes // (1024 * 1024)} MB limit.", status_code=413)
+            if len(content) > remaining:
+                raise UploadRejected(f"Batch exceeds the {max_total_bytes // (1024 * 1024)} MB limit.", status_code=413)
+            remaining -= len(content)
+            if is_pdf(content):
+                found.append((os.path.basename(member.filename), content, hashlib.sha256(content).hexdigest()))
+    return found